@@ -50,6 +50,9 @@ from setuptools import (
     setup,
     find_packages,
 )
+from setuptools.command.build_py import (
+    build_py                as _build_py,
+)
 
 
 # Load some useful modules and functions.
@@ -132,6 +135,47 @@ elif "development" == _vinfo_release_type: # Development Release
     _version = "{major}.{minor}.0dev{update}".format( **_vinfo_numbers_DICT )
 
 
+def _write_version_module( path ):
+    """
+        Writes a pure-Python module, which contains the version info of the
+        master package with the release type, numbers, and timestamp already
+        baked in. The package imports this module, when it is present, 
+        rather than parsing its version config file at runtime.
+    """
+
+    with open( path, "w" ) as version_file:
+        print( "# Note: Generated by 'setup.py' at build time. Do not edit.",
+               file = version_file )
+        print( "release_type    = {0!r}".format( str( _vinfo_release_type ) ),
+               file = version_file )
+        print( "numbers         = {0!r}".format( dict(
+                    ( str( k ), str( v ) )
+                    for k, v in _vinfo_numbers_DICT.items( )
+                ) ),
+               file = version_file )
+        print( "version         = {0!r}".format( str( _version ) ),
+               file = version_file )
+
+
+class build_py( _build_py ): # pylint: disable=C0103
+    """
+        Builds pure Python modules and generates the version module of the
+        master package into the build directory.
+    """
+
+
+    def run( self ):
+        """
+            Runs the standard command and then writes the version module.
+        """
+
+        _build_py.run( self )
+        if not self.dry_run:
+            _write_version_module(
+                _join_path( self.build_lib, "utilia", "_version.py" )
+            )
+
+
 # Fill out the metadata for the distribution.
 setup_data = { }
 
@@ -229,6 +273,8 @@ setup_data[ "setup_requires" ].append( "Sphinx >= 1.1.3" )
 # TODO: tests_require
 # TODO: install_requires
 
+setup_data[ "cmdclass" ]            = { "build_py": build_py, }
+
 setup_data[ "test_suite" ]          = "nose.collector"
 # TODO: test_loader
 # TODO: eager_resources
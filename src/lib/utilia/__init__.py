@@ -33,6 +33,11 @@
         * :py:mod:`operating system interfaces <.os>`
         
         * :py:mod:`.types`
+
+    The subpackages are imported upon first access to them as attributes of
+    this package. Likewise, the ``__version__`` attribute is only calculated
+    upon first access to it. (Python versions prior to 3.7 calculate the
+    version eagerly.)
 """
 
 
@@ -71,53 +76,161 @@ else:
     )
 
 
-# Read the version info from config file.
-# Note: If something goes wrong here, then just let the exception propagate.
-if 3 == python_version.major:
-    if 2 <= python_version.minor:
-        from configparser import ( # pylint: disable=F0401
-            ConfigParser            as _ConfigParser,
+# Lazy Attributes
+# (Subpackages and the version string are only loaded upon first access.)
+
+
+#: Names of the subpackages which are imported upon first attribute access.
+_LAZY_SUBMODULE_NAMES = frozenset( [
+    "compat", "config_parsers", "exceptions", "filesystem", "functional",
+    "os", "types",
+] )
+
+
+def _compute_version( ):
+    """
+        Returns the version string of the package.
+
+        The string is taken from the version module, generated at build time,
+        if it is present. Else, it is calculated from the version info in the
+        config file, as is the case in a source checkout.
+    """
+
+    try:
+        from utilia._version import ( # pylint: disable=F0401,E0611
+            version,
         )
+    except ImportError:
+        return _compute_version_from_config( )
+    return version
+
+
+def _compute_version_from_config( ):
+    """
+        Returns the version string of the package, as calculated from the
+        version info in the config file.
+    """
+
+    # Note: If something goes wrong here, then just let the exception 
+    #       propagate.
+    if 3 == python_version.major:
+        if 2 <= python_version.minor:
+            from configparser import ( # pylint: disable=F0401
+                ConfigParser            as _ConfigParser,
+            )
+        else:
+            from configparser import ( # pylint: disable=F0401
+                SafeConfigParser        as _ConfigParser,
+            )
     else:
-        from configparser import ( # pylint: disable=F0401
+        from ConfigParser import ( # pylint: disable=F0401
             SafeConfigParser        as _ConfigParser,
         )
-else:
-    from ConfigParser import ( # pylint: disable=F0401
-        SafeConfigParser        as _ConfigParser,
-    )
 
-_path_to_config = _join_path( __path__[ 0 ], "version.cfg" )
-_vinfo_CFG = _ConfigParser( )
-if _path_to_config not in _vinfo_CFG.read( _path_to_config ):
-    raise IOError(
-        "Configuration file '{0}' expected but not found.".format(
-            _path_to_config
+    path_to_config = _join_path( __path__[ 0 ], "version.cfg" )
+    vinfo_CFG = _ConfigParser( )
+    if path_to_config not in vinfo_CFG.read( path_to_config ):
+        raise IOError(
+            "Configuration file '{0}' expected but not found.".format(
+                path_to_config
+            )
         )
-    )
 
-_vinfo_release_type     = _vinfo_CFG.get( "control", "release_type" )
-assert _vinfo_release_type in [ "bugfix", "candidate", "development" ]
-_vinfo_numbers_DICT     = dict( _vinfo_CFG.items( "numbers" ) )
-if   "bugfix" == _vinfo_release_type: # Stable Bugfix Release
-    __version__ = \
-    "{major}.{minor}.{bugfix}".format( **_vinfo_numbers_DICT )
-elif "candidate" == _vinfo_release_type: # Release Candidate
-    __version__ = \
-    "{major}.{minor}.0rc{update}".format( **_vinfo_numbers_DICT )
-elif "development" == _vinfo_release_type: # Development Release
+    vinfo_release_type  = vinfo_CFG.get( "control", "release_type" )
+    assert vinfo_release_type in [ "bugfix", "candidate", "development" ]
+    vinfo_numbers_DICT  = dict( vinfo_CFG.items( "numbers" ) )
+    if   "bugfix" == vinfo_release_type: # Stable Bugfix Release
+        return "{major}.{minor}.{bugfix}".format( **vinfo_numbers_DICT )
+    elif "candidate" == vinfo_release_type: # Release Candidate
+        return "{major}.{minor}.0rc{update}".format( **vinfo_numbers_DICT )
+    # Development Release
     with open( _join_path( __path__[ 0 ], "dev-timestamp.dat" ) ) \
-    as _ts_file:
-        _vinfo_numbers_DICT[ "update" ] = _ts_file.read( 12 )
-    __version__ = \
-    "{major}.{minor}.0dev{update}".format( **_vinfo_numbers_DICT )
+    as ts_file:
+        vinfo_numbers_DICT[ "update" ] = ts_file.read( 12 )
+    return "{major}.{minor}.0dev{update}".format( **vinfo_numbers_DICT )
 
-del _ConfigParser, _path_to_config
-del _vinfo_CFG, _vinfo_release_type, _vinfo_numbers_DICT
+
+def _make_lazy_attribute_loader(
+    package_name, submodule_names, attribute_homes = None
+):
+    """
+        Returns a function, suitable for use as the module-level 
+        ``__getattr__`` hook of :pep:`562`, which imports the named submodules
+        of a package upon first access to them as attributes of the package.
+
+        The optional ``attribute_homes`` dictionary maps the names of
+        attributes, which the package re-exports from its submodules, to the
+        names of those submodules. Such an attribute is imported from its
+        submodule upon first access to it and is then bound as an attribute
+        of the package.
+
+        Importing a submodule binds it as an attribute of its package, 
+        so the hook is only invoked once per submodule.
+    """
+
+    if None is attribute_homes: attribute_homes = { }
+
+    def __getattr__( name ):
+        """
+            Imports and returns a submodule or an attribute of one upon first
+            access.
+        """
+
+        if name in submodule_names:
+            module_name = "{0}.{1}".format( package_name, name )
+            __import__( module_name )
+            return sys.modules[ module_name ]
+        if name in attribute_homes:
+            module_name = "{0}.{1}".format(
+                package_name, attribute_homes[ name ]
+            )
+            __import__( module_name )
+            value = getattr( sys.modules[ module_name ], name )
+            setattr( sys.modules[ package_name ], name, value )
+            return value
+        raise AttributeError(
+            "module '{0}' has no attribute '{1}'".format( package_name, name )
+        )
+
+    return __getattr__
+
+
+_load_lazy_submodule = \
+_make_lazy_attribute_loader( __name__, _LAZY_SUBMODULE_NAMES )
+
+
+def __getattr__( name ):
+    """
+        Computes the version string or imports a subpackage upon first
+        access.
+    """
+
+    if "__version__" == name:
+        version = _compute_version( )
+        globals( )[ "__version__" ] = version
+        return version
+    return _load_lazy_submodule( name )
+
+
+def __dir__( ):
+    """
+        Returns the names in the module namespace, including the names of
+        attributes which have not been loaded yet.
+    """
+
+    return sorted(
+        set( globals( ) ) | _LAZY_SUBMODULE_NAMES | set( [ "__version__" ] )
+    )
+
+
+# Note: Module-level '__getattr__' hooks are only honored as of Python 3.7.
+#       Compute the version eagerly on older Pythons.
+if (python_version.major, python_version.minor) < (3, 7):
+    __version__ = _compute_version( )
 
 
 # Cleanup the module namespace.
-del _join_path, collections
+del collections
 
 
 # Utility Functions
@@ -129,18 +242,38 @@ if 3 == python_version.major:
     xrange = range # pylint: disable=W0622
 
 
-def _autodoc_function_parameters( func, pdict ):
+def _append_docstring( obj, *fragments ):
+    """
+        Appends fragments of documentation to the docstring of a function,
+        in one concatenation. Does nothing if docstrings have been stripped,
+        as is the case when running with the ``-OO`` interpreter option.
+
+        Returns the function, so that this can also serve as the body of a
+        decorator.
+    """
+
+    if obj.__doc__:
+        obj.__doc__ = \
+        "".join( [ obj.__doc__ ] + [ f for f in fragments if f ] )
+    return obj
+
+
+def _autodoc_function_parameters( func, pdict, *fragments ):
     """
         Automatically document a function's parameters, if
         the supplied dictionary has entries for their names.
+        Any additional fragments of documentation are appended afterwards.
 
         Note: This function assumes that the first entries of the 'co_varnames'
               tuple are the parameters passed on the stack.
     """
 
-    for i in xrange( func.__code__.co_argcount ):
-        docs = pdict.get( func.__code__.co_varnames[ i ], None )
-        if docs: func.__doc__ += docs
+    if not func.__doc__: return
+    code = func.__code__
+    pdocs = [
+        pdict.get( pname ) for pname in code.co_varnames[ : code.co_argcount ]
+    ]
+    _append_docstring( func, *(pdocs + list( fragments )) )
 
 
 def _TD_( s ):
@@ -187,6 +187,21 @@ AbstractBase_BASE.__doc__ = \
 del ABCMeta
 
 
+# Lazy Submodules
+
+
+from utilia import (
+    _make_lazy_attribute_loader,
+)
+
+__getattr__ = _make_lazy_attribute_loader(
+    __name__,
+    frozenset( [ "argparse", "builtins", "collections", "configparser", ] )
+)
+
+del _make_lazy_attribute_loader
+
+
 # Module Cleanup
 
 del python_version
@@ -21,6 +21,9 @@
     module from the Python standard library and provides pieces which are 
     missing in some Python implementations.
 
+    For Python 3.3 and later, the abstract base classes are imported from
+    the :py:mod:`collections.abc <CPython3:collections.abc>` module.
+
     For Python 2.6 and 3.0, these missing classes are provided:
 
         * :py:class:`OrderedDict <CPython2:collections.OrderedDict>`
@@ -50,6 +53,11 @@ from utilia import (
 
 from collections import *
 
+# Note: The abstract base classes live in 'collections.abc' as of Python 3.3
+#       and are no longer available from 'collections' as of Python 3.10.
+if  (3 == _python_version.major) and (3 <= _python_version.minor):
+    from collections.abc import * # pylint: disable=F0401
+
 if  [ _python_version.major, _python_version.minor ] \
     in [ [ 2, 6 ], [ 3, 0 ] ]:
     from utilia.compat._INTERNAL_.collections.ordered_dict import (
@@ -32,6 +32,9 @@ from __future__ import (
 __docformat__ = "reStructuredText"
 
 
+from utilia import (
+    _append_docstring,
+)
 from utilia.compat import (
     AbstractBase_BASE,
 )
@@ -200,7 +203,7 @@ class Exception_Exiting( Exception_WithReason ):
         self._rc            = 0
         self._class_name    = self.__class__.__name__
 
-    __init__.__doc__ += Exception_WithReason.__init__.__doc__
+    _append_docstring( __init__, Exception_WithReason.__init__.__doc__ )
 
 
     def __repr__( self ):
@@ -253,7 +256,7 @@ class InvalidKeyError( Exception_Exiting, _builtins_KeyError ):
         self._class_name    = self.__class__.__name__
         self._rc            = _exit_codes.INTERNAL_SOFTWARE_ERROR( )
 
-    __init__.__doc__ += Exception_Exiting.__init__.__doc__
+    _append_docstring( __init__, Exception_Exiting.__init__.__doc__ )
         
 
 Error_BASE.register( InvalidKeyError )
@@ -278,7 +281,7 @@ class UnknownKeyError( Exception_Exiting, _builtins_KeyError ):
         self._class_name    = self.__class__.__name__
         self._rc            = _exit_codes.INTERNAL_SOFTWARE_ERROR( )
 
-    __init__.__doc__ += Exception_Exiting.__init__.__doc__
+    _append_docstring( __init__, Exception_Exiting.__init__.__doc__ )
         
 
 Error_BASE.register( UnknownKeyError )
@@ -304,7 +307,7 @@ class InvalidValueError( Exception_Exiting, _builtins_ValueError ):
         self._class_name    = self.__class__.__name__
         self._rc            = _exit_codes.INTERNAL_SOFTWARE_ERROR( )
 
-    __init__.__doc__ += Exception_Exiting.__init__.__doc__
+    _append_docstring( __init__, Exception_Exiting.__init__.__doc__ )
         
 
 Error_BASE.register( InvalidValueError )
@@ -330,7 +333,7 @@ class InvokedAbstractMethodError( Exception_Exiting, _builtins_RuntimeError ):
         self._class_name    = self.__class__.__name__
         self._rc            = _exit_codes.INTERNAL_SOFTWARE_ERROR( )
 
-    __init__.__doc__ += Exception_Exiting.__init__.__doc__
+    _append_docstring( __init__, Exception_Exiting.__init__.__doc__ )
         
 
 Error_BASE.register( InvokedAbstractMethodError )
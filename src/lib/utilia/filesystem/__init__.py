@@ -25,6 +25,16 @@
     The following modules provide calculated paths:
 
         * :py:mod:`.stdpath`
+
+    The following modules manage space on file systems:
+
+        * :py:mod:`.diskcache`
+        * :py:mod:`.tempspace`
+        * :py:mod:`.usage`
+
+    The following modules observe file systems:
+
+        * :py:mod:`.watch`
 """
 
 
@@ -39,6 +49,22 @@ from __future__ import (
 __docformat__ = "reStructuredText"
 
 
+# Lazy Submodules
+
+
+from utilia import (
+    _make_lazy_attribute_loader,
+)
+
+__getattr__ = _make_lazy_attribute_loader(
+    __name__, frozenset( [
+        "diskcache", "stdpath", "tempspace", "usage", "watch",
+    ] )
+)
+
+del _make_lazy_attribute_loader
+
+
 # Exceptions
 
 
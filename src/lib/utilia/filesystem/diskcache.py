@@ -0,0 +1,475 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides a size-bounded cache of byte strings, stored on disk, which
+    persists across invocations of a program.
+
+    By default, the cache is rooted in a dedicated directory,
+    ``utilia-diskcache``, within the temporary storage for the software
+    product, as calculated by the ``whereis_temp`` method of the
+    :py:func:`platform back-end
+    <utilia.filesystem.stdpath.get_platform_backend>`.
+    On POSIX platforms, which follow the XDG Base Directory Specification,
+    the temporary storage is within the user cache directory,
+    ``$XDG_CACHE_HOME`` or ``~/.cache``. Since that directory is shared with
+    other programs, a context without a software name is refused.
+
+    Each entry is stored in a file named after a digest of its key. The files
+    are spread across 256 shard directories, named after the first two
+    characters of the digests, so that no single directory grows too large.
+    An entry is written to a temporary file first and then renamed into
+    place, so that readers never observe a partially written entry. Only
+    files named like entries or like the temporary files of the cache are
+    ever indexed or removed.
+
+    The sizes and recency of the entries are tracked by an in-memory index,
+    which is built from a single scan of the shard directories upon first use.
+    When the cache exceeds its bounds, the least recently used entries are
+    evicted.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+import os
+import re
+import errno
+import hashlib
+import threading
+from os.path import (
+    isdir                   as _is_directory,
+    join                    as _join_path,
+)
+
+from utilia.compat.collections import (
+    OrderedDict,
+)
+
+
+#: Replaces a file atomically, even if the destination exists.
+_replace_file = getattr( os, "replace", os.rename )
+
+#: Age, in seconds, beyond which a leftover temporary file is removed.
+_STALE_TEMP_FILE_AGE = 3600
+
+#: Name of the directory, within the temporary storage for the software
+#: product, in which the entries are stored by default.
+_ROOT_DIRECTORY_NAME = "utilia-diskcache"
+
+#: Prefix and suffix of the names of the temporary files of the cache.
+_TEMP_FILE_PREFIX = ".diskcache-"
+_TEMP_FILE_SUFFIX = ".tmp"
+
+#: Matches the names of shard directories and of entries.
+_SHARD_NAME_PATTERN = re.compile( r"^[0-9a-f]{2}$" )
+_ENTRY_NAME_PATTERN = re.compile( r"^[0-9a-f]{40}$" )
+
+
+if hasattr( os, "scandir" ):
+
+
+    def _scan_shard( path ):
+        """
+            Returns an iterator over the names, sizes, and modification times
+            of the files in a shard directory.
+        """
+
+        for entry in os.scandir( path ):
+            try:
+                stats = entry.stat( )
+            except OSError: continue
+            yield entry.name, stats.st_size, stats.st_mtime
+
+
+else: # Python prior to 3.5.
+
+
+    def _scan_shard( path ):
+        """
+            Returns an iterator over the names, sizes, and modification times
+            of the files in a shard directory.
+        """
+
+        for name in os.listdir( path ):
+            try:
+                stats = os.stat( _join_path( path, name ) )
+            except OSError: continue
+            yield name, stats.st_size, stats.st_mtime
+
+
+def _remove_file( path ):
+    """
+        Removes a file, unless it is already gone.
+    """
+
+    try:
+        os.remove( path )
+    except OSError as exc:
+        if errno.ENOENT != exc.errno: raise
+
+
+class DiskCache( object ):
+    """
+        Cache of byte strings, keyed on strings, stored in files under a
+        directory.
+
+        The cache may be shared by multiple processes. Each process keeps its
+        own index, so the bounds are enforced per process, but entries
+        written by other processes are found and adopted upon lookup.
+    """
+
+
+    def __init__(
+        self,
+        path = None, context = None,
+        max_size = 256 * 1024 * 1024, max_entries = None,
+        touch_on_read = True
+    ):
+        """
+            :param path: directory in which to store the entries; if ``None``,
+                         then a dedicated directory within the temporary
+                         storage for the software product, defined in
+                         ``context``, is used
+            :param context: standard path context for the platform back-end;
+                            if ``None``, then the current context is used
+            :param max_size: maximum total size, in bytes, of the entries; if
+                             ``None``, then the size is unbounded
+            :param max_entries: maximum number of entries; if ``None``, then
+                                the number is unbounded
+            :param touch_on_read: If ``True``, then update the modification
+                                  time of an entry when it is read, so that
+                                  its recency survives across invocations.
+        """
+
+        self._path              = path
+        self._context           = context
+        self._max_size          = max_size
+        self._max_entries       = max_entries
+        self._touch_on_read     = touch_on_read
+
+        self._lock              = threading.Lock( )
+        self._index             = None
+        self._total_size        = 0
+
+
+    def __repr__( self ):
+        """
+            Returns a string representation of the cache.
+        """
+
+        return "DiskCache( {0!r}, max_size = {1!r}, max_entries = {2!r} )" \
+        "".format( self._path, self._max_size, self._max_entries )
+
+
+    def __len__( self ):
+        """
+            Returns the number of indexed entries.
+        """
+
+        with self._lock:
+            return len( self._load_index( ) )
+
+
+    def __contains__( self, key ):
+        """
+            Returns ``True``, if there is an entry for the key.
+            Does not affect the recency of the entry.
+        """
+
+        digest = self._digest( key )
+        with self._lock:
+            if digest in self._load_index( ): return True
+        return os.path.isfile( self._entry_path( digest ) )
+
+
+    @property
+    def path( self ):
+        """
+            The directory in which the entries are stored.
+
+            :raises: ``UndeterminedPathError``, if no directory was given
+                     and the context does not name a software product.
+        """
+
+        path = self._path
+        if None is path:
+            from utilia import _TD_
+            from .stdpath import get_platform_backend
+            from .stdpath._INTERNAL_ import UndeterminedPathError
+            standard_path = get_platform_backend( ).StandardPath( )
+            context = standard_path._find_context( self._context )
+            if      (None is context) \
+                or  not context.get_with_default( "software_name" ):
+                # Note: The temporary storage without a software name is
+                #       shared with other programs.
+                raise UndeterminedPathError(
+                    _TD_(
+                        "Undetermined path to disk cache "
+                        "because no software name is given."
+                    )
+                )
+            path = self._path = _join_path(
+                standard_path.whereis_temp( context ), _ROOT_DIRECTORY_NAME
+            )
+        return path
+
+
+    @property
+    def total_size( self ):
+        """
+            The total size, in bytes, of the indexed entries.
+        """
+
+        with self._lock:
+            self._load_index( )
+            return self._total_size
+
+
+    def get( self, key, default = None ):
+        """
+            Returns the contents of the entry for a key or the default, if
+            there is no such entry.
+
+            :param key: key of the entry
+            :type key: :py:class:`string <CPython3:str>`
+        """
+
+        digest = self._digest( key )
+        entry_path = self._entry_path( digest )
+        try:
+            with open( entry_path, "rb" ) as entry_file:
+                value = entry_file.read( )
+        except IOError as exc:
+            if errno.ENOENT != exc.errno: raise
+            with self._lock:
+                self._forget( self._load_index( ), digest )
+            return default
+
+        if self._touch_on_read:
+            try:
+                os.utime( entry_path, None )
+            except OSError: pass
+        with self._lock:
+            index = self._load_index( )
+            self._forget( index, digest )
+            self._remember( index, digest, len( value ) )
+        return value
+
+
+    def set( self, key, value ):
+        """
+            Stores the contents of the entry for a key, replacing any
+            previous contents, and evicts the least recently used entries,
+            if the bounds of the cache are exceeded.
+
+            :param key: key of the entry
+            :type key: :py:class:`string <CPython3:str>`
+            :param value: contents of the entry
+            :type value: :py:class:`bytes <CPython3:bytes>`
+        """
+
+        digest = self._digest( key )
+        entry_path = self._entry_path( digest )
+        shard_path = os.path.dirname( entry_path )
+        if not _is_directory( shard_path ):
+            try:
+                os.makedirs( shard_path, 0o700 )
+            except OSError:
+                if not _is_directory( shard_path ): raise
+
+        import tempfile
+        fd, temp_path = tempfile.mkstemp(
+            prefix = _TEMP_FILE_PREFIX + digest, suffix = _TEMP_FILE_SUFFIX,
+            dir = shard_path
+        )
+        try:
+            with os.fdopen( fd, "wb" ) as temp_file:
+                temp_file.write( value )
+            _replace_file( temp_path, entry_path )
+        except BaseException:
+            _remove_file( temp_path )
+            raise
+
+        with self._lock:
+            index = self._load_index( )
+            self._forget( index, digest )
+            self._remember( index, digest, len( value ) )
+            evicted = self._choose_evictions( index )
+        for digest in evicted: _remove_file( self._entry_path( digest ) )
+
+
+    def get_or_compute( self, key, compute ):
+        """
+            Returns the contents of the entry for a key, computing and storing
+            them first, if there is no such entry.
+
+            :param compute: callable, which takes no arguments and returns
+                            the contents of the entry as a byte string
+        """
+
+        value = self.get( key )
+        if None is value:
+            value = compute( )
+            self.set( key, value )
+        return value
+
+
+    def delete( self, key ):
+        """
+            Removes the entry for a key, if there is one.
+        """
+
+        digest = self._digest( key )
+        with self._lock:
+            self._forget( self._load_index( ), digest )
+        _remove_file( self._entry_path( digest ) )
+
+
+    def clear( self ):
+        """
+            Removes all of the indexed entries.
+        """
+
+        with self._lock:
+            digests = list( self._load_index( ) )
+            self._index         = OrderedDict( )
+            self._total_size    = 0
+        for digest in digests: _remove_file( self._entry_path( digest ) )
+
+
+    def rescan( self ):
+        """
+            Discards the index, so that it is built anew from a scan of the
+            shard directories upon next use.
+        """
+
+        with self._lock:
+            self._index         = None
+            self._total_size    = 0
+
+
+    @staticmethod
+    def _digest( key ):
+        """
+            Returns the hexadecimal digest, which names the entry for a key.
+        """
+
+        if not isinstance( key, bytes ): key = key.encode( "utf-8" )
+        return hashlib.sha1( key ).hexdigest( )
+
+
+    def _entry_path( self, digest ):
+        """
+            Returns the path to the file of an entry.
+        """
+
+        return _join_path( self.path, digest[ : 2 ], digest )
+
+
+    def _load_index( self ):
+        """
+            Returns the index, building it from a scan of the shard
+            directories if necessary. Must be called with the lock held.
+        """
+
+        index = self._index
+        if None is not index: return index
+
+        import time
+        stale_before = time.time( ) - _STALE_TEMP_FILE_AGE
+        root = self.path
+        entries = [ ]
+        try:
+            shard_names = os.listdir( root )
+        except OSError: shard_names = [ ]
+        for shard_name in shard_names:
+            if not _SHARD_NAME_PATTERN.match( shard_name ): continue
+            shard_path = _join_path( root, shard_name )
+            try:
+                for name, size, mtime in _scan_shard( shard_path ):
+                    if _ENTRY_NAME_PATTERN.match( name ):
+                        if name.startswith( shard_name ):
+                            entries.append( ( mtime, name, size ) )
+                    elif    name.startswith( _TEMP_FILE_PREFIX ) \
+                        and name.endswith( _TEMP_FILE_SUFFIX ) \
+                        and mtime < stale_before:
+                        try: os.remove( _join_path( shard_path, name ) )
+                        except OSError: pass
+            except OSError: continue
+        entries.sort( )
+
+        index = self._index = OrderedDict( )
+        self._total_size = 0
+        for mtime, digest, size in entries:
+            self._remember( index, digest, size )
+        return index
+
+
+    def _remember( self, index, digest, size ):
+        """
+            Records an entry as the most recently used one.
+            Must be called with the lock held.
+        """
+
+        index[ digest ] = size
+        self._total_size += size
+
+
+    def _forget( self, index, digest ):
+        """
+            Removes an entry from the index, if it is there.
+            Must be called with the lock held.
+        """
+
+        size = index.pop( digest, None )
+        if None is not size: self._total_size -= size
+
+
+    def _choose_evictions( self, index ):
+        """
+            Removes the least recently used entries from the index, until the
+            bounds of the cache are met, and returns their digests.
+            Must be called with the lock held.
+        """
+
+        max_size    = self._max_size
+        max_entries = self._max_entries
+        evicted     = [ ]
+        # Note: The most recently stored entry is never evicted.
+        while 1 < len( index ) and (
+                ((None is not max_size) and (self._total_size > max_size))
+            or  ((None is not max_entries) and (len( index ) > max_entries))
+        ):
+            digest = next( iter( index ) )
+            self._forget( index, digest )
+            evicted.append( digest )
+        return evicted
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
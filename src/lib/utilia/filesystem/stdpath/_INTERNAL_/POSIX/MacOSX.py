@@ -33,23 +33,32 @@ from __future__ import (
 __docformat__ = "reStructuredText"
 
 
-import re   as _re
-# TODO: Replace with POSIX-specific functions.
-from os.path import (
+from posixpath import (
+    isabs                   as _is_absolute_path,
     join                    as _join_path,
-    dirname                 as _dirname_of_path,
 )
 
 
+from utilia.compat.collections import (
+    OrderedDict,
+)
 from .. import (
     _OptionValidator,
+    _ContextSlot,
+    _document_options,
+    _option_slot_names,
 )
 from . import (
     StandardPathContext     as POSIXStandardPathContext,
+    FrozenStandardPathContext as POSIXFrozenStandardPathContext,
     StandardPath            as POSIXStandardPath,
 )
+from ...facts import (
+    truncated_framework_path,
+)
 
 
+@_document_options
 class StandardPathContext( POSIXStandardPathContext ):
     """
         Auxiliary class, which provides a context for calculating standard
@@ -67,7 +76,8 @@ class StandardPathContext( POSIXStandardPathContext ):
     """
 
 
-    _option_validators = POSIXStandardPathContext._option_validators
+    _option_validators = \
+    OrderedDict( POSIXStandardPathContext._option_validators )
     _option_validators[ "XDG_standard" ]        = \
     _OptionValidator(
         _option_validators[ "XDG_standard" ].func, False,
@@ -83,40 +93,66 @@ class StandardPathContext( POSIXStandardPathContext ):
     __init__.__doc__ = POSIXStandardPathContext.__init__.__doc__
 
 
-#: Current standard path context.
-_context = StandardPathContext( )
-
-StandardPathContext.__doc__ += \
-"\n".join(
-    map(
-        lambda k, v: \
-        (" " * 10) + """ "{option_name}", "{option_help}" """.format(
-            option_name = k, option_help = v
-        ),
-        (k for k, v in _context.iter_option_validators( )),
-        (v.help for k, v in _context.iter_option_validators( ))
+@_document_options
+class FrozenStandardPathContext( POSIXFrozenStandardPathContext ):
+    """
+        Immutable variant of :py:class:`StandardPathContext`.
+
+        Inherits from :py:class:`POSIX.FrozenStandardPathContext
+        <POSIXFrozenStandardPathContext>`.
+
+        Provides these options:
+
+        .. csv-table::
+           :header: "Name", "Description"
+           :widths: 20, 80
+
+    """
+
+
+    _option_validators  = StandardPathContext._option_validators
+
+    __slots__ = _option_slot_names(
+        POSIXFrozenStandardPathContext, _option_validators
     )
-)
+
+    _mutable_class      = StandardPathContext
+
+
+StandardPathContext._frozen_class = FrozenStandardPathContext
+
+
+#: Current standard path context.
+_context_slot = _ContextSlot( __name__, StandardPathContext( ) )
 
 
 def get_context( ):
     """
-        Returns the current standard path context.
+        Returns the current standard path context. This is the context
+        supplied to the innermost enclosing :py:func:`use_context`, if any,
+        or else the process-wide context.
     """
 
-    return _context
+    return _context_slot.get( )
 
 
 def set_context( new_context ):
     """
-        Sets a new standard path context.
-        Returns the old standard path context.
+        Sets a new process-wide standard path context.
+        Returns the old process-wide standard path context.
     """
 
-    global _context     # pylint: disable=W0603
+    return _context_slot.set( new_context )
 
-    old_context, _context = _context, new_context
-    return old_context
+
+def use_context( context ):
+    """
+        Returns a context manager, within the scope of which the given
+        standard path context is the current one for the running task or
+        thread only. Other tasks and threads are unaffected.
+    """
+
+    return _context_slot.use( context )
 
 
 class StandardPath( POSIXStandardPath ):
@@ -125,13 +161,21 @@ class StandardPath( POSIXStandardPath ):
     """
 
 
-    def __init__( self, context = get_context( ) ):
+    _environment_variable_names = \
+    POSIXStandardPath._environment_variable_names + ( "TMPDIR", )
+
+    _socket_path_max_length = 103
+
+
+    def __init__( self, context = None, environment = None, facts = None ):
         """ """
 
-        POSIXStandardPath.__init__( self, context )
+        POSIXStandardPath.__init__( self, context, environment, facts )
 
     __init__.__doc__ = POSIXStandardPath.__init__.__doc__
 
+    _get_current_context = staticmethod( get_context )
+
 
     def whereis_common_config( self, context = None ):
         """ """
@@ -217,7 +261,7 @@ class StandardPath( POSIXStandardPath ):
                     self, context
                 )
             base_path = base_path_trunc
-        else: base_path = POSIXStandardPath._whereis_user_home( )
+        else: base_path = self._whereis_user_home( )
         base_path = _join_path( base_path, "Preferences" )
 
         if specific_path: return _join_path( base_path, specific_path )
@@ -249,7 +293,7 @@ class StandardPath( POSIXStandardPath ):
                     self, context
                 )
             base_path = base_path_trunc
-        else: base_path = POSIXStandardPath._whereis_user_home( )
+        else: base_path = self._whereis_user_home( )
         base_path = _join_path( base_path, "Application Support" )
 
         if specific_path: return _join_path( base_path, specific_path )
@@ -267,7 +311,7 @@ class StandardPath( POSIXStandardPath ):
         base_path, specific_path = \
         self._choose_user_path_parts( context )
 
-        if not base_path: base_path = POSIXStandardPath._whereis_user_home( )
+        if not base_path: base_path = self._whereis_user_home( )
         base_path = _join_path( base_path, "Documents" )
 
         if specific_path: return _join_path( base_path, specific_path )
@@ -277,6 +321,19 @@ class StandardPath( POSIXStandardPath ):
     POSIXStandardPath.whereis_saved_data.__doc__
 
 
+    def _whereis_runtime_base( self, context ):
+        """
+            Returns the path to the per-user temporary directory, which
+            serves for runtime files, or ``None``, if there is none.
+        """
+
+        if context.get_with_default( "XDG_standard" ):
+            return POSIXStandardPath._whereis_runtime_base( self, context )
+        base_path = self._get_environment( ).get( "TMPDIR" )
+        if base_path and _is_absolute_path( base_path ): return base_path
+        return None
+
+
     @staticmethod
     def _truncate_framework_path( path ):
         """
@@ -286,13 +343,7 @@ class StandardPath( POSIXStandardPath ):
             without any alteration.
         """
 
-        match = _re.findall( r".*/Python\.framework/Versions/.*", path )
-        if match:
-            return reduce(
-                lambda x, f: f( x ), [ _dirname_of_path ] * 4, path
-            )
-
-        return path
+        return truncated_framework_path( path )
 
 
 ###############################################################################
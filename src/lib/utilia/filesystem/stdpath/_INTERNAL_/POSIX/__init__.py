@@ -33,31 +33,35 @@ from __future__ import (
 __docformat__ = "reStructuredText"
 
 
-import site
-import functools
-import re
-from os import (
-    environ                 as _envvars,
-)
-# TODO: Replace with POSIX-specific functions.
-from os.path import (
+import posixpath
+from posixpath import (
     isabs                   as _is_absolute_path,
     join                    as _join_path,
-    expanduser              as _expand_user_path,
 )
 
 
 from utilia import (
     _TD_,
 )
+from utilia.compat.collections import (
+    OrderedDict,
+)
 from .. import (
     _OptionValidator,
+    _ContextSlot,
+    _document_options,
+    _option_slot_names,
     UndeterminedPathError,
     StandardPathContext_BASE,
+    FrozenStandardPathContext_BASE,
     StandardPath_BASE,
 )
+from ...normalization import (
+    get_name_normalizer,
+)
 
 
+@_document_options
 class StandardPathContext( StandardPathContext_BASE ):
     """
         Auxiliary class, which provides a context for calculating standard
@@ -74,7 +78,8 @@ class StandardPathContext( StandardPathContext_BASE ):
     """
 
 
-    _option_validators = StandardPathContext_BASE._option_validators
+    _option_validators = \
+    OrderedDict( StandardPathContext_BASE._option_validators )
     _option_validators[ "whitespace_to_underscore" ]    = \
     _OptionValidator(
         None, True,
@@ -106,79 +111,122 @@ class StandardPathContext( StandardPathContext_BASE ):
     def _calculate_path( self ):
         """ """
 
-        error_on_none               = \
-        self.get_with_default( "error_on_none" )
-        whitespace_to_underscore    = \
-        self.get_with_default( "whitespace_to_underscore" )
-        software_name               = \
-        self.get_with_default( "software_name" )
-        software_provider_name      = \
-        self.get_with_default( "software_provider_name" )
-        software_version            = \
-        self.get_with_default( "software_version" )
-        
-        if not software_name:
-            if error_on_none:
-                raise UndeterminedPathError(
-                    _TD_( "Missing software name for calculated path." )
-                )
-            else: return None
-
-        if whitespace_to_underscore:
-            resub_whitespace_to_underscore  = \
-            functools.partial( re.sub, r"\s+", "_" )
-            software_name                   = \
-            resub_whitespace_to_underscore( software_name )
-            if software_provider_name:
-                software_provider_name      = \
-                resub_whitespace_to_underscore( software_provider_name )
-            if software_version:
-                software_version            = \
-                resub_whitespace_to_underscore( software_version )
-
-        return _join_path( *filter(
-            None,
-            [ software_provider_name, software_name, software_version ]
-        ) )
+        return _calculate_software_path( self )
 
     _calculate_path.__doc__ = \
     StandardPathContext_BASE._calculate_path.__doc__
 
 
-#: Current standard path context.
-_context = StandardPathContext( )
-
-StandardPathContext.__doc__ += \
-"\n".join(
-    map(
-        lambda k, v: \
-        (" " * 10) + """ "{option_name}", "{option_help}" """.format(
-            option_name = k, option_help = v
-        ),
-        (k for k, v in _context.iter_option_validators( )),
-        (v.help for k, v in _context.iter_option_validators( ))
+@_document_options
+class FrozenStandardPathContext( FrozenStandardPathContext_BASE ):
+    """
+        Immutable variant of :py:class:`StandardPathContext`.
+
+        Inherits from :py:class:`FrozenStandardPathContext_BASE`.
+
+        Provides these options:
+
+        .. csv-table::
+           :header: "Name", "Description"
+           :widths: 20, 80
+
+    """
+
+
+    _option_validators  = StandardPathContext._option_validators
+
+    __slots__ = _option_slot_names(
+        FrozenStandardPathContext_BASE, _option_validators
     )
-)
+
+    _mutable_class      = StandardPathContext
+
+
+    def _calculate_path( self ):
+        """ """
+
+        return _calculate_software_path( self )
+
+    _calculate_path.__doc__ = \
+    StandardPathContext_BASE._calculate_path.__doc__
+
+
+StandardPathContext._frozen_class = FrozenStandardPathContext
+
+
+#: Converts whitespace to underscores in the names of software products.
+_whitespace_to_underscore = get_name_normalizer( "POSIX", strip = False )
+
+
+def _calculate_software_path( context ):
+    """
+        Returns the path calculated from information about the software 
+        product specified in the options of a context.
+    """
+
+    error_on_none               = \
+    context.get_with_default( "error_on_none" )
+    whitespace_to_underscore    = \
+    context.get_with_default( "whitespace_to_underscore" )
+    software_name               = \
+    context.get_with_default( "software_name" )
+    software_provider_name      = \
+    context.get_with_default( "software_provider_name" )
+    software_version            = \
+    context.get_with_default( "software_version" )
+    
+    if not software_name:
+        if error_on_none:
+            raise UndeterminedPathError(
+                _TD_( "Missing software name for calculated path." )
+            )
+        else: return None
+
+    if whitespace_to_underscore:
+        normalize       = _whitespace_to_underscore
+        software_name   = normalize( software_name )
+        if software_provider_name:
+            software_provider_name  = normalize( software_provider_name )
+        if software_version:
+            software_version        = normalize( software_version )
+
+    return _join_path( *filter(
+        None,
+        [ software_provider_name, software_name, software_version ]
+    ) )
+
+
+#: Current standard path context.
+_context_slot = _ContextSlot( __name__, StandardPathContext( ) )
 
 
 def get_context( ):
     """
-        Returns the current standard path context.
+        Returns the current standard path context. This is the context
+        supplied to the innermost enclosing :py:func:`use_context`, if any,
+        or else the process-wide context.
     """
 
-    return _context
+    return _context_slot.get( )
 
 
 def set_context( new_context ):
     """
-        Sets a new standard path context.
-        Returns the old standard path context.
+        Sets a new process-wide standard path context.
+        Returns the old process-wide standard path context.
     """
 
-    global _context     # pylint: disable=W0603
+    return _context_slot.set( new_context )
+
 
-    old_context, _context = _context, new_context
-    return old_context
+def use_context( context ):
+    """
+        Returns a context manager, within the scope of which the given
+        standard path context is the current one for the running task or
+        thread only. Other tasks and threads are unaffected.
+    """
+
+    return _context_slot.use( context )
 
 
 class StandardPath( StandardPath_BASE ):
@@ -187,13 +235,23 @@ class StandardPath( StandardPath_BASE ):
     """
 
 
-    def __init__( self, context = get_context( ) ):
+    _path_flavor = posixpath
+
+    _environment_variable_names = (
+        "XDG_CACHE_HOME", "XDG_CONFIG_HOME", "XDG_DATA_HOME",
+        "XDG_RUNTIME_DIR",
+    )
+
+
+    def __init__( self, context = None, environment = None, facts = None ):
         """ """
 
-        StandardPath_BASE.__init__( self, context )
+        StandardPath_BASE.__init__( self, context, environment, facts )
 
     __init__.__doc__ = StandardPath_BASE.__init__.__doc__
 
+    _get_current_context = staticmethod( get_context )
+
 
     def whereis_temp( self, context = None ):
         """ """
@@ -209,10 +267,10 @@ class StandardPath( StandardPath_BASE ):
 
         if None is base_path:
             if context.get_with_default( "XDG_standard" ):
-                base_path = _envvars.get( "XDG_CACHE_HOME" )
+                base_path = self._get_environment( ).get( "XDG_CACHE_HOME" )
                 if None is base_path:
                     base_path = \
-                    _join_path( StandardPath._whereis_user_home( ), ".cache" )
+                    _join_path( self._whereis_user_home( ), ".cache" )
         if None is base_path: base_path = "/tmp"
 
         if specific_path: return _join_path( base_path, specific_path )
@@ -221,7 +279,26 @@ class StandardPath( StandardPath_BASE ):
     whereis_temp.__doc__ = StandardPath_BASE.whereis_temp.__doc__
 
 
-    # TODO: whereis_runtime_support
+    def whereis_runtime( self, context = None ):
+        """ """
+
+        context = self._find_context( context )
+
+        base_path, specific_path = \
+        self._choose_user_path_parts( context )
+
+        if base_path: base_path = _join_path( base_path, "run" )
+
+        if None is base_path:
+            base_path = self._whereis_runtime_base( context )
+        if None is base_path:
+            # Note: Temporary storage includes the specific path already.
+            return self.whereis_temp( context )
+
+        if specific_path: return _join_path( base_path, specific_path )
+        return base_path
+
+    whereis_runtime.__doc__ = StandardPath_BASE.whereis_runtime.__doc__
 
 
     def whereis_common_config( self, context = None ):
@@ -231,13 +308,15 @@ class StandardPath( StandardPath_BASE ):
 
         pythonic = context.get_with_default( "Pythonic" )
         if pythonic and context.get_with_default( "strictly_Pythonic" ):
-            return _whereis_common_Python_package( context )
+            return _whereis_common_Python_package(
+                context, self._whereis_Python_prefix( context )
+            )
 
         base_path, specific_path = \
         self._choose_common_path_parts( context )
 
         if (None is base_path) and pythonic:
-            base_path = context.get_with_default( "Python_prefix_path" )
+            base_path = self._whereis_Python_prefix( context )
         # TODO: Handle '/etc/xdg' if XDG compliance is requested.
         if None is base_path: base_path = "/usr/local"
 
@@ -260,13 +339,15 @@ class StandardPath( StandardPath_BASE ):
 
         pythonic = context.get_with_default( "Pythonic" )
         if pythonic and context.get_with_default( "strictly_Pythonic" ):
-            return _whereis_common_Python_package( context )
+            return _whereis_common_Python_package(
+                context, self._whereis_Python_prefix( context )
+            )
 
         base_path, specific_path = \
         self._choose_common_path_parts( context )
 
         if (None is base_path) and pythonic:
-            base_path = context.get_with_default( "Python_prefix_path" )
+            base_path = self._whereis_Python_prefix( context )
         if None is base_path: base_path = "/usr/local"
 
         # Note: '/' cannot rely on the presence of '/usr/share'.
@@ -290,7 +371,7 @@ class StandardPath( StandardPath_BASE ):
         base_path = self._choose_common_path_parts( context )[ 0 ]
 
         if (None is base_path) and context.get_with_default( "Pythonic" ):
-            base_path = context.get_with_default( "Python_prefix_path" )
+            base_path = self._whereis_Python_prefix( context )
         if None is base_path: base_path = "/usr/local"
 
         return _join_path( base_path, "bin" )
@@ -306,7 +387,9 @@ class StandardPath( StandardPath_BASE ):
 
         pythonic = context.get_with_default( "Pythonic" )
         if pythonic and context.get_with_default( "strictly_Pythonic" ):
-            return _whereis_user_Python_package( context )
+            return _whereis_user_Python_package(
+                context, self._whereis_user_site( )
+            )
 
         base_path, specific_path = \
         self._choose_user_path_parts( context )
@@ -314,21 +397,21 @@ class StandardPath( StandardPath_BASE ):
         if base_path: base_path = _join_path( base_path, "etc" )
 
         if (None is base_path) and pythonic:
-            base_path = _join_path( site.USER_BASE, "etc" )
+            base_path = _join_path( self._whereis_user_base( ), "etc" )
         if None is base_path:
             if context.get_with_default( "XDG_standard" ):
-                base_path = _envvars.get( "XDG_CONFIG_HOME" )
+                base_path = self._get_environment( ).get( "XDG_CONFIG_HOME" )
                 if None is base_path:
                     base_path = \
-                    _join_path( StandardPath._whereis_user_home( ), ".config" )
+                    _join_path( self._whereis_user_home( ), ".config" )
         if None is base_path:
             if specific_path:
                 return _join_path(
-                    StandardPath._whereis_user_home( ),
+                    self._whereis_user_home( ),
                     "." + specific_path,
                     "config"
                 )
-            else: return StandardPath._whereis_user_home( )
+            else: return self._whereis_user_home( )
 
         if specific_path: return _join_path( base_path, specific_path )
         return base_path
@@ -344,7 +427,9 @@ class StandardPath( StandardPath_BASE ):
 
         pythonic = context.get_with_default( "Pythonic" )
         if pythonic and context.get_with_default( "strictly_Pythonic" ):
-            return _whereis_user_Python_package( context )
+            return _whereis_user_Python_package(
+                context, self._whereis_user_site( )
+            )
 
         base_path, specific_path = \
         self._choose_user_path_parts( context )
@@ -352,25 +437,26 @@ class StandardPath( StandardPath_BASE ):
         if base_path: base_path = _join_path( base_path, "share" )
 
         if (None is base_path) and pythonic:
-            base_path = _join_path( site.USER_BASE, "share" )
+            base_path = \
+            _join_path( self._whereis_user_base( ), "share" )
         if None is base_path:
             if context.get_with_default( "XDG_standard" ):
-                base_path = _envvars.get( "XDG_DATA_HOME" )
+                base_path = self._get_environment( ).get( "XDG_DATA_HOME" )
                 if None is base_path:
                     base_path = \
                     _join_path(
-                        StandardPath._whereis_user_home( ),
+                        self._whereis_user_home( ),
                         ".local",
                         "share"
                     )
         if None is base_path:
             if specific_path:
                 return _join_path(
-                   StandardPath._whereis_user_home( ),
+                   self._whereis_user_home( ),
                    "." + specific_path,
                    "resources"
                 )
-            else: return StandardPath._whereis_user_home( )
+            else: return self._whereis_user_home( )
 
         if specific_path: return _join_path( base_path, specific_path )
         return base_path
@@ -392,11 +478,11 @@ class StandardPath( StandardPath_BASE ):
         if not base_path:
             if specific_path:
                 return _join_path(
-                    StandardPath._whereis_user_home( ),
+                    self._whereis_user_home( ),
                     "." + specific_path,
                     "saved_data"
                 )
-            else: return StandardPath._whereis_user_home( )
+            else: return self._whereis_user_home( )
 
         if specific_path:
             specific_path = _join_path( specific_path, "saved_data" )
@@ -413,44 +499,26 @@ class StandardPath( StandardPath_BASE ):
     def _is_absolute_path( self, the_path ):
         """ """
 
-        # TODO: Use POSIX-specific path tester rather than current OS one.
         return _is_absolute_path( the_path )
 
     _is_absolute_path.__doc__ = \
     StandardPath_BASE._is_absolute_path.__doc__
 
 
-    @staticmethod
-    def _whereis_user_home( ):
+    def _whereis_runtime_base( self, context ):
         """
-            Returns the path to the current user's home directory, if it can be
-            determined. Returns ``None``, otherwise.
+            Returns the path to the memory-backed directory for the current
+            user's runtime files or ``None``, if there is none.
         """
-        # TODO: Consider users other than the current one from context.
-
-        user_id         = _envvars.get( "USER" )
-        user_home_path  = _expand_user_path( "~" )
-
-        if None is user_home_path:
-            if None is user_id:
-                raise UndeterminedPathError(
-                    _TD_(
-                        "Undetermined path to home directory "
-                        "because current user is unknown."
-                    )
-                )
-            else:
-                raise UndeterminedPathError(
-                    _TD_(
-                        "Undetermined path to home directory of user {0}."
-                    ),
-                    user_id
-                )
 
-        return user_home_path
+        if context.get_with_default( "XDG_standard" ):
+            # Note: The specification requires relative paths to be ignored.
+            base_path = self._get_environment( ).get( "XDG_RUNTIME_DIR" )
+            if base_path and _is_absolute_path( base_path ): return base_path
+        return self._get_facts( ).system_runtime_dir
 
 
-def _whereis_common_Python_package( context ):
+def _whereis_common_Python_package( context, python_prefix_path ):
     """
         Returns the path to a particular Python package relative to the primary
         site packages directory for a given Python installation and version.
@@ -467,7 +535,7 @@ def _whereis_common_Python_package( context ):
     #       'dist-packages' instead of 'site-packages'.
     # TODO: Account for Ubuntu Linux in Linux-specific standard paths.
     return _join_path(
-        context.get_with_default( "Python_prefix_path" ),
+        python_prefix_path,
         "lib",
         "python" + context.get_with_default( "Python_version" ),
         "site-packages",
@@ -475,7 +543,7 @@ def _whereis_common_Python_package( context ):
     )
 
 
-def _whereis_user_Python_package( context ):
+def _whereis_user_Python_package( context, user_site_path ):
     """
         Returns the path to a particular Python package relative to the user's
         site packages directory specified by :pep:`370` and provided by the
@@ -489,7 +557,7 @@ def _whereis_user_Python_package( context ):
             _TD_( "Python package" ), specify_software = True
         )
 
-    return _join_path( site.USER_SITE, python_package_name )
+    return _join_path( user_site_path, python_package_name )
 
 
 ###############################################################################
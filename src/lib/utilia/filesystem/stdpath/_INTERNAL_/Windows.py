@@ -33,13 +33,9 @@ from __future__ import (
 __docformat__ = "reStructuredText"
 
 
-import sys
-import site
-from os import (
-    environ                 as _envvars,
-)
-# TODO: Replace with Windows-specific functions.
-from os.path import (
+import ntpath
+from ntpath import (
+    isabs                   as _is_absolute_path,
     join                    as _join_path,
 )
 
@@ -47,14 +43,22 @@ from os.path import (
 from utilia import (
     _TD_,
 )
+from utilia.compat.collections import (
+    OrderedDict,
+)
 from . import (
     _OptionValidator,
+    _ContextSlot,
+    _document_options,
+    _option_slot_names,
     UndeterminedPathError,
     StandardPathContext_BASE,
+    FrozenStandardPathContext_BASE,
     StandardPath_BASE,
 )
 
 
+@_document_options
 class StandardPathContext( StandardPathContext_BASE ):
     """
         Auxiliary class, which provides a context for calculating standard
@@ -71,7 +75,8 @@ class StandardPathContext( StandardPathContext_BASE ):
     """
 
 
-    _option_validators = StandardPathContext_BASE._option_validators
+    _option_validators = \
+    OrderedDict( StandardPathContext_BASE._option_validators )
 
 
     def __init__( self, **options ):
@@ -85,65 +90,108 @@ class StandardPathContext( StandardPathContext_BASE ):
     def _calculate_path( self ):
         """ """
 
-        error_on_none               = \
-        self.get_with_default( "error_on_none" )
-        software_name               = \
-        self.get_with_default( "software_name" )
-        software_provider_name      = \
-        self.get_with_default( "software_provider_name" )
-        software_version            = \
-        self.get_with_default( "software_version" )
-        
-        if not software_name:
-            if error_on_none:
-                raise UndeterminedPathError(
-                    _TD_( "Missing software name for calculated path." )
-                )
-            else: return None
+        return _calculate_software_path( self )
+
+    _calculate_path.__doc__ = \
+    StandardPathContext_BASE._calculate_path.__doc__
+
+
+@_document_options
+class FrozenStandardPathContext( FrozenStandardPathContext_BASE ):
+    """
+        Immutable variant of :py:class:`StandardPathContext`.
+
+        Inherits from :py:class:`FrozenStandardPathContext_BASE`.
+
+        Provides these options:
+
+        .. csv-table::
+           :header: "Name", "Description"
+           :widths: 20, 80
+
+    """
+
+
+    _option_validators  = StandardPathContext._option_validators
+
+    __slots__ = _option_slot_names(
+        FrozenStandardPathContext_BASE, _option_validators
+    )
+
+    _mutable_class      = StandardPathContext
+
+
+    def _calculate_path( self ):
+        """ """
 
-        return _join_path( *filter(
-            None,
-            [ software_provider_name, software_name, software_version ]
-        ) )
+        return _calculate_software_path( self )
 
     _calculate_path.__doc__ = \
     StandardPathContext_BASE._calculate_path.__doc__
 
 
+StandardPathContext._frozen_class = FrozenStandardPathContext
+
+
+def _calculate_software_path( context ):
+    """
+        Returns the path calculated from information about the software 
+        product specified in the options of a context.
+    """
+
+    error_on_none               = \
+    context.get_with_default( "error_on_none" )
+    software_name               = \
+    context.get_with_default( "software_name" )
+    software_provider_name      = \
+    context.get_with_default( "software_provider_name" )
+    software_version            = \
+    context.get_with_default( "software_version" )
+    
+    if not software_name:
+        if error_on_none:
+            raise UndeterminedPathError(
+                _TD_( "Missing software name for calculated path." )
+            )
+        else: return None
+
+    return _join_path( *filter(
+        None,
+        [ software_provider_name, software_name, software_version ]
+    ) )
+
+
 #: Current standard path context.
-_context = StandardPathContext( )
-
-StandardPathContext.__doc__ += \
-"\n".join(
-    map(
-        lambda k, v: \
-        (" " * 10) + """ "{option_name}", "{option_help}" """.format(
-            option_name = k, option_help = v
-        ),
-        (k for k, v in _context.iter_option_validators( )),
-        (v.help for k, v in _context.iter_option_validators( ))
-    )
-)
+_context_slot = _ContextSlot( __name__, StandardPathContext( ) )
 
 
 def get_context( ):
     """
-        Returns the current standard path context.
+        Returns the current standard path context. This is the context
+        supplied to the innermost enclosing :py:func:`use_context`, if any,
+        or else the process-wide context.
     """
 
-    return _context
+    return _context_slot.get( )
 
 
 def set_context( new_context ):
     """
-        Sets a new standard path context.
-        Returns the old standard path context.
+        Sets a new process-wide standard path context.
+        Returns the old process-wide standard path context.
     """
 
-    global _context     # pylint: disable=W0603
+    return _context_slot.set( new_context )
 
-    old_context, _context = _context, new_context
-    return old_context
+
+def use_context( context ):
+    """
+        Returns a context manager, within the scope of which the given
+        standard path context is the current one for the running task or
+        thread only. Other tasks and threads are unaffected.
+    """
+
+    return _context_slot.use( context )
 
 
 class StandardPath( StandardPath_BASE ):
@@ -152,13 +200,23 @@ class StandardPath( StandardPath_BASE ):
     """
 
 
-    def __init__( self, context = get_context( ) ):
+    _path_flavor = ntpath
+
+    _environment_variable_names = (
+        "TMP", "TEMP", "ProgramFiles", "ProgramFiles(x86)", "ProgramData",
+        "APPDATA", "LOCALAPPDATA",
+    )
+
+
+    def __init__( self, context = None, environment = None, facts = None ):
         """ """
 
-        StandardPath_BASE.__init__( self, context )
+        StandardPath_BASE.__init__( self, context, environment, facts )
 
     __init__.__doc__ = StandardPath_BASE.__init__.__doc__
 
+    _get_current_context = staticmethod( get_context )
+
 
     def whereis_temp( self, context = None ):
         """ """
@@ -173,7 +231,8 @@ class StandardPath( StandardPath_BASE ):
         else: base_path = None
 
         if None is base_path:
-            base_path = _envvars.get( "TMP", _envvars.get( "TEMP" ) )
+            environment = self._get_environment( )
+            base_path = environment.get( "TMP", environment.get( "TEMP" ) )
             if None is base_path:
                 context.raise_UndeterminedPathError(
                     _TD_( "temporary storage" )
@@ -185,6 +244,15 @@ class StandardPath( StandardPath_BASE ):
     whereis_temp.__doc__ = StandardPath_BASE.whereis_temp.__doc__
 
 
+    def whereis_runtime( self, context = None ):
+        """ """
+
+        # Note: Windows has no separate directory for runtime files.
+        return self.whereis_temp( context )
+
+    whereis_runtime.__doc__ = StandardPath_BASE.whereis_runtime.__doc__
+
+
     def whereis_common_config( self, context = None ):
         """ """
 
@@ -192,24 +260,21 @@ class StandardPath( StandardPath_BASE ):
 
         pythonic = context.get_with_default( "Pythonic" )
         if pythonic and context.get_with_default( "strictly_Pythonic" ):
-            return _whereis_common_Python_package( context )
+            return _whereis_common_Python_package(
+                context, self._whereis_Python_prefix( context )
+            )
 
         base_path, specific_path = \
         self._choose_common_path_parts( context )
 
+        if base_path: base_path = _join_path( base_path, "Config" )
+
         if (None is base_path) and pythonic:
-            base_path = context.get_with_default( "Python_prefix_path" )
+            base_path = self._whereis_Python_prefix( context )
         if None is base_path:
-            # TEMP HACK: Satisfy '__str__'. Not an acutal Windows convention.
-            # TODO: Need to raise exception if software name is not supplied. 
-            #       And, need to think about how to handle '__str__' 
-            #       representation of objects in this case.
-            base_path = \
-            _join_path(
-                StandardPath._whereis_common_installation( context ),
-                "Common Files"
-            )
-        else: base_path = _join_path( base_path, "Config" )
+            # TODO: Consider the "ProgramData" folder, once existing
+            #       configuration can be migrated to it.
+            base_path = self._whereis_common_files( context )
 
         if specific_path: return _join_path( base_path, specific_path )
         return base_path
@@ -218,17 +283,156 @@ class StandardPath( StandardPath_BASE ):
     StandardPath_BASE.whereis_common_config.__doc__
 
 
-    @staticmethod
-    def _whereis_common_installation( context ):
+    def whereis_common_resources( self, context = None ):
+        """ """
+
+        context = self._find_context( context )
+
+        pythonic = context.get_with_default( "Pythonic" )
+        if pythonic and context.get_with_default( "strictly_Pythonic" ):
+            return _whereis_common_Python_package(
+                context, self._whereis_Python_prefix( context )
+            )
+
+        base_path, specific_path = \
+        self._choose_common_path_parts( context )
+
+        if base_path: base_path = _join_path( base_path, "Resources" )
+
+        if (None is base_path) and pythonic:
+            base_path = _join_path(
+                self._whereis_Python_prefix( context ), "Resources"
+            )
+        if None is base_path:
+            base_path = self._whereis_common_application_data( context )
+
+        if specific_path: return _join_path( base_path, specific_path )
+        return base_path
+
+    whereis_common_resources.__doc__ = \
+    StandardPath_BASE.whereis_common_resources.__doc__
+
+
+    def whereis_common_programs( self, context = None ):
+        """ """
+
+        context = self._find_context( context )
+
+        base_path, specific_path = \
+        self._choose_common_path_parts( context )
+
+        if (None is base_path) and context.get_with_default( "Pythonic" ):
+            return _join_path(
+                self._whereis_Python_prefix( context ), "Scripts"
+            )
+        if None is base_path:
+            base_path = self._whereis_common_installation( context )
+
+        # Note: Each program is installed in a folder of its own.
+        if specific_path: return _join_path( base_path, specific_path )
+        return base_path
+
+    whereis_common_programs.__doc__ = \
+    StandardPath_BASE.whereis_common_programs.__doc__
+
+
+    def whereis_user_config( self, context = None ):
+        """ """
+
+        context = self._find_context( context )
+
+        pythonic = context.get_with_default( "Pythonic" )
+        if pythonic and context.get_with_default( "strictly_Pythonic" ):
+            return _whereis_user_Python_package(
+                context, self._whereis_user_site( )
+            )
+
+        base_path, specific_path = \
+        self._choose_user_path_parts( context )
+
+        if base_path: base_path = _join_path( base_path, "Config" )
+
+        if (None is base_path) and pythonic:
+            base_path = _join_path( self._whereis_user_base( ), "Config" )
+        if None is base_path:
+            base_path = self._whereis_user_application_data(
+                "APPDATA", "Roaming"
+            )
+
+        if specific_path: return _join_path( base_path, specific_path )
+        return base_path
+
+    whereis_user_config.__doc__ = \
+    StandardPath_BASE.whereis_user_config.__doc__
+
+
+    def whereis_user_resources( self, context = None ):
+        """ """
+
+        context = self._find_context( context )
+
+        pythonic = context.get_with_default( "Pythonic" )
+        if pythonic and context.get_with_default( "strictly_Pythonic" ):
+            return _whereis_user_Python_package(
+                context, self._whereis_user_site( )
+            )
+
+        base_path, specific_path = \
+        self._choose_user_path_parts( context )
+
+        if base_path: base_path = _join_path( base_path, "Resources" )
+
+        if (None is base_path) and pythonic:
+            base_path = \
+            _join_path( self._whereis_user_base( ), "Resources" )
+        if None is base_path:
+            base_path = self._whereis_user_application_data(
+                "LOCALAPPDATA", "Local"
+            )
+
+        if specific_path: return _join_path( base_path, specific_path )
+        return base_path
+
+    whereis_user_resources.__doc__ = \
+    StandardPath_BASE.whereis_user_resources.__doc__
+
+
+    def whereis_saved_data( self, context = None ):
+        """ """
+
+        context = self._find_context( context )
+
+        base_path, specific_path = \
+        self._choose_user_path_parts( context )
+
+        if None is base_path: base_path = self._whereis_user_home( )
+        base_path = _join_path( base_path, "Documents" )
+
+        if specific_path: return _join_path( base_path, specific_path )
+        return base_path
+
+    whereis_saved_data.__doc__ = \
+    StandardPath_BASE.whereis_saved_data.__doc__
+
+
+    def _is_absolute_path( self, the_path ):
+        """ """
+
+        return _is_absolute_path( the_path )
+
+    _is_absolute_path.__doc__ = \
+    StandardPath_BASE._is_absolute_path.__doc__
+
+
+    def _whereis_common_installation( self, context ):
         """
             Returns path to the appropriate Windows "program files" folder in
             the context of the bit width for the Windows OS.
         """
 
-        import platform
-
-        os_bit_width    = 64 if "64bit" in platform.architecture( ) else 32
-        app_bit_width   = 64 if sys.maxsize > 2 ** 32 else 32
+        facts           = self._get_facts( )
+        os_bit_width    = facts.os_bit_width
+        app_bit_width   = facts.app_bit_width
         # TODO: Get desired bit widths from context, 
         #       setting context defaults as computed above.
 
@@ -239,7 +443,7 @@ class StandardPath( StandardPath_BASE ):
             else:                   evname = "ProgramFiles(x86)"
         else:                       evname = "ProgramFiles"
         
-        the_path = _envvars.get( evname )
+        the_path = self._get_environment( ).get( evname )
         if None is the_path:
             context.raise_UndeterminedPathError(
                 _TD_( "Windows common installation directory" )
@@ -248,7 +452,49 @@ class StandardPath( StandardPath_BASE ):
         return the_path
 
 
-def _whereis_common_Python_package( context ):
+    def _whereis_common_files( self, context ):
+        """
+            Returns the path to the "Common Files" folder under the "program
+            files" folder, which holds the shared configuration information.
+        """
+
+        return _join_path(
+            self._whereis_common_installation( context ), "Common Files"
+        )
+
+
+    def _whereis_common_application_data( self, context ):
+        """
+            Returns the path to the folder for application data shared by all
+            users. Before Windows Vista, there is no such folder, and a
+            "Resources" folder under the "Common Files" folder is used, so
+            that the resources are kept apart from the configuration
+            information.
+        """
+
+        the_path = self._get_environment( ).get( "ProgramData" )
+        if None is the_path:
+            the_path = \
+            _join_path( self._whereis_common_files( context ), "Resources" )
+        return the_path
+
+
+    def _whereis_user_application_data( self, evname, folder_name ):
+        """
+            Returns the path to a folder for the current user's application
+            data, as given by an environment variable or else by the folder
+            of that name under the "AppData" folder in the user's profile.
+        """
+
+        the_path = self._get_environment( ).get( evname )
+        if None is the_path:
+            the_path = _join_path(
+                self._whereis_user_home( ), "AppData", folder_name
+            )
+        return the_path
+
+
+def _whereis_common_Python_package( context, python_prefix_path ):
     """
         Returns the path to a particular Python package relative to the primary
         site packages directory for a given Python installation and version.
@@ -262,14 +508,14 @@ def _whereis_common_Python_package( context ):
         )
 
     return _join_path(
-        context.get_with_default( "Python_prefix_path" ),
+        python_prefix_path,
         "Lib",
         "site-packages",
         python_package_name
     )
 
 
-def _whereis_user_Python_package( context ):
+def _whereis_user_Python_package( context, user_site_path ):
     """
         Returns the path to a particular Python package relative to the user's
         site packages directory specified by :pep:`370` and provided by the
@@ -283,7 +529,7 @@ def _whereis_user_Python_package( context ):
             _TD_( "Python package" ), specify_software = True
         )
 
-    return _join_path( site.USER_SITE, python_package_name )
+    return _join_path( user_site_path, python_package_name )
 
 
 ###############################################################################
@@ -19,6 +19,10 @@
 """
     Basis for OS-dependent implementations of the standard path calculation 
     logic.
+
+    The implementations live in back-end modules, one per filesystem layout
+    classification. Use :py:func:`get_backend` to obtain the back-end for a
+    layout; only that back-end is imported, and only upon first use.
 """
 
 
@@ -33,13 +37,35 @@ from __future__ import (
 __docformat__ = "reStructuredText"
 
 
+import os
 import sys
+import threading
+from copy import (
+    copy                    as _copy,
+)
+from os import (
+    environ                 as _envvars,
+    makedirs                as _make_directories,
+)
+from os.path import (
+    isdir                   as _is_directory,
+)
 from abc import (
+    ABCMeta,
     abstractmethod,
 )
+from contextlib import (
+    contextmanager,
+)
+try:
+    from contextvars import ( # pylint: disable=F0401
+        ContextVar              as _ContextVar,
+    )
+except ImportError: _ContextVar = None
 
 from utilia import (
     _TD_,
+    _append_docstring,
     python_version          as _python_version,
 )
 from utilia.compat import (
@@ -51,12 +77,17 @@ from utilia.compat import (
 from utilia.compat.builtins import (
     LookupError             as _builtins_LookupError,
     KeyError                as _builtins_KeyError,
+    TypeError               as _builtins_TypeError,
 )
 from utilia.compat.collections import ( # pylint: disable=E0611
+    Mapping,
     MutableMapping,
     namedtuple,
     OrderedDict,
 )
+from utilia.types.maps import (
+    LRUDict,
+)
 import utilia.os.exit_codes as _exit_codes
 from utilia.exceptions import (
     Exception_Exiting,
@@ -68,6 +99,51 @@ from utilia.exceptions import (
 from utilia.filesystem import (
     Error_BASE              as FilesystemError_BASE,
 )
+from .. import (
+    which_fs_layout,
+    UnsupportedFilesystemLayout,
+)
+from ..facts import (
+    get_platform_facts,
+    is_private_directory,
+)
+
+
+#: Names of the back-end modules, relative to this package, by filesystem
+#: layout classification.
+_BACKEND_MODULE_NAMES = \
+{
+    "POSIX":    "POSIX",
+    "MacOS X":  "POSIX.MacOSX",
+    "Windows":  "Windows",
+}
+
+
+def get_backend( fs_layout = None ):
+    """
+        Returns the back-end module for a filesystem layout classification,
+        importing it upon first use. If no classification is given, then the
+        classification for the current OS platform is used.
+
+        :raises: :py:class:`UnsupportedFilesystemLayout
+                 <utilia.filesystem.stdpath.UnsupportedFilesystemLayout>`, if
+                 there is no back-end for the filesystem layout.
+    """
+
+    if None is fs_layout: fs_layout = which_fs_layout( )
+    try:
+        module_name = "{0}.{1}".format(
+            __name__, _BACKEND_MODULE_NAMES[ fs_layout ]
+        )
+    except _builtins_KeyError:
+        raise UnsupportedFilesystemLayout(
+            "Unimplemented path determination logic for {0}.", fs_layout
+        )
+    try:
+        return sys.modules[ module_name ]
+    except _builtins_KeyError:
+        __import__( module_name )
+        return sys.modules[ module_name ]
 
 
 class UndeterminedPathError( Exception_Exiting, _builtins_LookupError ):
@@ -90,7 +166,7 @@ class UndeterminedPathError( Exception_Exiting, _builtins_LookupError ):
         self._class_name    = self.__class__.__name__
         self._rc            = _exit_codes.INTERNAL_SOFTWARE_ERROR( )
 
-    __init__.__doc__ += Exception_Exiting.__init__.__doc__
+    _append_docstring( __init__, Exception_Exiting.__init__.__doc__ )
         
 
 FilesystemError_BASE.register( UndeterminedPathError )
@@ -99,7 +175,239 @@ FilesystemError_BASE.register( UndeterminedPathError )
 _OptionValidator = namedtuple( "_OptionValidator", "func default help" )
 
 
-class StandardPathContext_BASE( MutableMapping ):
+class _OptionsDocumenter( ABCMeta ):
+    """
+        Metaclass of the standard path context classes, which fills in the
+        options tables at the ends of their docstrings.
+    """
+
+
+    def _get_docstring( cls ):
+        """
+            Returns the docstring of the class, with one row per option of
+            the class appended to the options table at its end. The rows are
+            built upon first access to the docstring, such as by
+            :py:func:`help <CPython3:help>` or Sphinx, and are then retained.
+            Nothing is built, if docstrings have been stripped, as is the
+            case when running with the ``-OO`` interpreter option.
+        """
+
+        namespace = cls.__dict__
+        docstring = namespace.get( "__doc__" )
+        if (not docstring) or not namespace.get( "_documents_options" ):
+            return docstring
+        documented_docstring = namespace.get( "_documented_docstring" )
+        if None is documented_docstring:
+            documented_docstring = docstring + "\n".join(
+                (" " * 10) + """ "{option_name}", "{option_help}" """.format(
+                    option_name = k, option_help = v.help
+                )
+                for k, v in iter_dict_items( cls._option_validators )
+            )
+            cls._documented_docstring = documented_docstring
+        return documented_docstring
+
+    # Note: A data descriptor on the metaclass takes precedence over the
+    #       docstring in the namespace of the class, which 'pydoc' reads.
+    __doc__ = property( _get_docstring )
+
+
+def _document_options( cls ):
+    """
+        Class decorator, which recreates the class with
+        :py:class:`_OptionsDocumenter` as its metaclass, so that the options
+        table at the end of its docstring is filled in upon first access to
+        the docstring rather than when the class is created.
+    """
+
+    namespace = dict( cls.__dict__ )
+    slot_names = namespace.get( "__slots__", ( ) )
+    if isinstance( slot_names, str ): slot_names = ( slot_names, )
+    for name in tuple( slot_names ) + ( "__dict__", "__weakref__", ):
+        namespace.pop( name, None )
+    namespace[ "_documents_options" ] = True
+    return _OptionsDocumenter( cls.__name__, cls.__bases__, namespace )
+
+
+class _StandardPathContextMixin( object ):
+    """
+        Behavior shared by the mutable and the frozen standard path contexts.
+        Relies upon the ``_options`` dictionary of customized options and
+        upon the ``_option_validators`` dictionary of the class.
+    """
+
+
+    __slots__ = ( )
+
+
+    def __str__( self ):
+        """
+            Returns a dictionary-like representation of the options, both
+            default and customized.
+        """
+
+        options = OrderedDict( )
+        for k, v in self.iter_option_validators( ):
+            options[ k ] = v.default
+        for k, v in iter_dict_items( self._options ):
+            options[ k ] = v
+        return "{{ {0} }} ".format(
+            ", ".join( map(
+                lambda k, v: "{option_name}: {option_value}".format(
+                    option_name = k, option_value = v
+                ),
+                (repr( k ) for k in iter_dict_keys( options )),
+                (repr( v ) for v in iter_dict_values( options ))
+            ) )
+        )
+
+
+    @property
+    def common_path( self ):
+        """
+            The common installation root path to the particular software 
+            product, if specified.
+        """
+
+        options = self._options
+
+        if "specific_common_path" in options:
+            return options[ "specific_common_path" ]
+        
+        if "calculate_path" in options:
+            return self._calculate_path( )
+
+        if "error_on_none" in options:
+            self.raise_UndeterminedPathError( )
+
+
+    @property
+    def user_path( self ):
+        """
+            The common installation root path to the particular software 
+            product, if specified.
+        """
+
+        options = self._options
+
+        if "specific_user_path" in options:
+            return options[ "specific_user_path" ]
+        
+        if "calculate_path" in options:
+            return self._calculate_path( )
+
+        if "error_on_none" in options:
+            self.raise_UndeterminedPathError( )
+
+
+    def raise_UndeterminedPathError(
+        self,
+        location_class = None,
+        specify_software = False, specify_os = False
+    ):
+        """
+            Raises a UndeterminedPathError exception with a message for the
+            context and, optionally, a location class.
+
+            :param location_class: string containing a general name for a
+                                   particular class of location in a 
+                                   filesystem
+            :param specify_software: boolean determining whether information
+                                     about the software product should appear
+                                     in the reason for the error
+            :param specify_os: boolean determining whether information about
+                               the operating system should appear in the reason
+                               for the error
+
+            :raises: :py:class:`UndeterminedPathError`
+        """
+
+        options = self._options
+
+        for_whom = None
+        if specify_software:
+            software_option_names = \
+            [ "software provider name", "software name", "software version", ]
+            for_whom = \
+            " ".join(
+                [   options[ option_name ]
+                    for option_name in software_option_names
+                    if option_name in options
+                ]
+            )
+
+        on_os = None
+        if specify_os:
+            os_option_names = \
+            [ "operating system", " operating system version", ]
+            on_os = \
+            " ".join(
+                [   options[ option_name ]
+                    for option_name in os_option_names
+                    if option_name in options
+                ]
+            )
+
+        msg_format  = _TD_( "Undetermined path." )
+        msg_args    = [ ]
+        if   location_class:
+            if   for_whom:
+                if on_os:
+                    msg_format  = \
+                    _TD_( "Undetermined path to {0} for {1} on {2}." )
+                    msg_args    = [ location_class, for_whom, on_os ]
+                else:
+                    msg_format  = _TD_( "Undetermined path to {0} for {1}." )
+                    msg_args    = [ location_class, for_whom ]
+            elif on_os:
+                msg_format  = _TD_( "Undetermined path to {0} on {1}." )
+                msg_args    = [ location_class, on_os ]
+            else:
+                msg_format  = _TD_( "Undetermined path to {0}." )
+                msg_args    = [ location_class ]
+        elif for_whom:
+            if on_os:
+                msg_format  = _TD_( "Undetermined path for {0} on {1}." )
+                msg_args    = [ for_whom, on_os ]
+            else:
+                msg_format  = _TD_( "Undetermined path for {0}." )
+                msg_args    = [ for_whom ]
+        elif on_os:
+            msg_format  = _TD_( "Undetermined path on {0}." )
+            msg_args    = [ on_os ]
+
+        raise UndeterminedPathError( msg_format, *msg_args )
+
+
+    def fingerprint( self ):
+        """
+            Returns a hashable value, which is equal for any two contexts of
+            the same class with the same customized options, and which
+            differs once any option is customized differently.
+        """
+
+        return (
+            self.__class__,
+            tuple( sorted( iter_dict_items( self._options ) ) )
+        )
+
+
+    def iter_option_validators( self ):
+        """
+            Returns an iterator over the available option validators.
+            Each item returned is a tuple consisting of the validator function
+            (or ``None``) and help on the corresponding option.
+
+            This can be useful for getting help on the options in an
+            interactive session.
+        """
+
+        return iter_dict_items( self._option_validators )
+
+
+class StandardPathContext_BASE(
+    _StandardPathContextMixin, MutableMapping
+):
     """
         Base for auxiliary classes, which provide a context for calculating 
         standard paths.
@@ -109,6 +417,10 @@ class StandardPathContext_BASE( MutableMapping ):
     """
 
 
+    #: Class of the frozen variant of the context.
+    _frozen_class       = None
+
+
     _option_validators  = OrderedDict( )
     _option_validators[ "error_on_none" ]           = \
     _OptionValidator(
@@ -301,6 +613,16 @@ class StandardPathContext_BASE( MutableMapping ):
         return len( self._options )
 
 
+    def __contains__( self, key ):
+        """
+            Tests whether an option has been customized.
+
+            :param key: key into the options dictionary
+        """
+
+        return key in self._options
+
+
     def __getitem__( self, key ):
         """
             Gets an entry from the options dictionary.
@@ -382,143 +704,263 @@ class StandardPathContext_BASE( MutableMapping ):
         )
 
 
-    def __str__( self ):
+    @abstractmethod
+    def _calculate_path( self ):
         """
-            Returns a dictionary-like representation of the options, both
-            default and customized.
+            Returns the path calculated from information about the software 
+            product specified in the options dictionary.
         """
 
-        options = OrderedDict( )
-        for k, v in self.iter_option_validators( ):
-            options[ k ] = v.default
-        for k, v in iter_dict_items( self._options ):
-            options[ k ] = v
-        return "{{ {0} }} ".format(
-            ", ".join( map(
-                lambda k, v: "{option_name}: {option_value}".format(
-                    option_name = k, option_value = v
-                ),
-                (repr( k ) for k in iter_dict_keys( options )),
-                (repr( v ) for v in iter_dict_values( options ))
-            ) )
-        )
+        pass
 
 
-    @property
-    def common_path( self ):
+    def get_with_default( self, option_name, fallback_value = None ):
         """
-            The common installation root path to the particular software 
-            product, if specified.
+            If the option, corresponding to the given name, has been customized
+            in this instance of a standard path context, then returns the value
+            of the customized option. Else if an option valdiator,
+            corresponding to the given option name, exists, then return the 
+            default value for the option. Else, return the fallback value, if
+            one was provided, or ``None`` otherwise.
         """
 
-        options = self._options
+        if option_name in self._options:
+            return self._options[ option_name ]
+        if option_name in self._option_validators:
+            return self._option_validators[ option_name ].default
+        return fallback_value
 
-        if "specific_common_path" in options:
-            return options[ "specific_common_path" ]
-        
-        if "calculate_path" in options:
-            return self._calculate_path( )
 
-        if "error_on_none" in options:
-            self.raise_UndeterminedPathError( )
+    def freeze( self ):
+        """
+            Returns a frozen context with the same options as this one.
 
+            :rtype: :py:class:`FrozenStandardPathContext_BASE`
+        """
 
-    @property
-    def user_path( self ):
+        return self._frozen_class( **self._options )
+
+
+#: Marker for a path which has not been calculated yet.
+_UNCALCULATED = object( )
+
+
+class FrozenStandardPathContext_BASE( _StandardPathContextMixin, Mapping ):
+    """
+        Base for immutable variants of the auxiliary classes, which provide a
+        context for calculating standard paths.
+
+        Every option of a frozen context is held in a slot of its own, which
+        has the default value of the option, unless it was customized. An
+        option can also be read as an attribute, named after the option.
+        As a mapping, a frozen context contains the customized options,
+        just as the corresponding mutable context does.
+
+        Frozen contexts are hashable, provided that the values of their
+        options are, and are equal if they are of the same class and have the
+        same customized options. They can be shared between threads and used
+        as keys in caches. The common and user paths are only calculated once.
+
+        Inherits from :py:class:`collections.Mapping
+        <CPython3:collections.Mapping>`.
+    """
+
+
+    _option_validators  = StandardPathContext_BASE._option_validators
+
+    __slots__ = (
+        "_options", "_fingerprint", "_common_path", "_user_path",
+    ) + tuple( _option_validators )
+
+    #: Class of the mutable variant of the context.
+    _mutable_class      = None
+
+
+    def __init__( self, **options ):
         """
-            The common installation root path to the particular software 
-            product, if specified.
+            :param **options: Zero or more keyword arguments to be used as
+                              options for modifying the behavior of path
+                              calculations.
         """
 
-        options = self._options
+        option_validators   = self._option_validators
+        set_slot            = object.__setattr__
 
-        if "specific_user_path" in options:
-            return options[ "specific_user_path" ]
-        
-        if "calculate_path" in options:
-            return self._calculate_path( )
+        for option_name, option_value in iter_dict_items( options ):
+            try:
+                validator = option_validators[ option_name ]
+            except _builtins_KeyError:
+                raise InvalidKeyError(
+                    _TD_( "Invalid option '{1}' for instance of '{0}'." ),
+                    self.__class__.__name__, option_name
+                )
+            func = validator.func
+            if callable( func ) and not func( option_value ):
+                raise InvalidValueError(
+                    _TD_(
+                        "Invalid value '{2}' for option '{1}' "
+                        "for instance of '{0}'."
+                    ),
+                    self.__class__.__name__, option_name, option_value
+                )
 
-        if "error_on_none" in options:
-            self.raise_UndeterminedPathError( )
+        for option_name, validator in iter_dict_items( option_validators ):
+            set_slot(
+                self, option_name,
+                options.get( option_name, validator.default )
+            )
+        set_slot( self, "_options", dict( options ) )
+        set_slot(
+            self, "_fingerprint",
+            ( self.__class__, tuple( sorted( iter_dict_items( options ) ) ) )
+        )
+        set_slot( self, "_common_path", _UNCALCULATED )
+        set_slot( self, "_user_path", _UNCALCULATED )
 
 
-    def raise_UndeterminedPathError(
-        self,
-        location_class = None,
-        specify_software = False, specify_os = False
-    ):
+    def __setattr__( self, name, value ):
+        """
+            Refuses to alter the context.
         """
-            Raises a UndeterminedPathError exception with a message for the
-            context and, optionally, a location class.
 
-            :param location_class: string containing a general name for a
-                                   particular class of location in a 
-                                   filesystem
-            :param specify_software: boolean determining whether information
-                                     about the software product should appear
-                                     in the reason for the error
-            :param specify_os: boolean determining whether information about
-                               the operating system should appear in the reason
-                               for the error
+        raise AttributeError(
+            "Instance of '{0}' is immutable.".format( self.__class__.__name__ )
+        )
 
-            :raises: :py:class:`UndeterminedPathError`
+
+    def __delattr__( self, name ):
+        """
+            Refuses to alter the context.
         """
 
-        options = self._options
+        raise AttributeError(
+            "Instance of '{0}' is immutable.".format( self.__class__.__name__ )
+        )
 
-        for_whom = None
-        if specify_software:
-            software_option_names = \
-            [ "software provider name", "software name", "software version", ]
-            for_whom = \
-            " ".join(
-                [   options[ option_name ]
-                    for option_name in software_option_names
-                    if option_name in options
-                ]
-            )
 
-        on_os = None
-        if specify_os:
-            os_option_names = \
-            [ "operating system", " operating system version", ]
-            on_os = \
-            " ".join(
-                [   options[ option_name ]
-                    for option_name in os_option_names
-                    if option_name in options
-                ]
+    def __iter__( self ):
+        """
+            Returns an iterator over the names of the customized options.
+        """
+
+        return iter_dict_keys( self._options )
+
+
+    def __len__( self ):
+        """
+            Returns the number of customized options.
+        """
+
+        return len( self._options )
+
+
+    def __contains__( self, key ):
+        """
+            Tests whether an option has been customized.
+
+            :param key: name of the option
+        """
+
+        return key in self._options
+
+
+    def __getitem__( self, key ):
+        """
+            Gets the value of a customized option.
+
+            :param key: name of the option
+        """
+
+        try:
+            value = self._options[ key ]
+        except _builtins_KeyError:
+            raise UnknownKeyError(
+                _TD_( "Unknown option '{1}' for instance of '{0}'." ),
+                self.__class__.__name__, key
             )
+        return value
 
-        msg_format  = _TD_( "Undetermined path." )
-        msg_args    = [ ]
-        if   location_class:
-            if   for_whom:
-                if on_os:
-                    msg_format  = \
-                    _TD_( "Undetermined path to {0} for {1} on {2}." )
-                    msg_args    = [ location_class, for_whom, on_os ]
-                else:
-                    msg_format  = _TD_( "Undetermined path to {0} for {1}." )
-                    msg_args    = [ location_class, for_whom ]
-            elif on_os:
-                msg_format  = _TD_( "Undetermined path to {0} on {1}." )
-                msg_args    = [ location_class, on_os ]
-            else:
-                msg_format  = _TD_( "Undetermined path to {0}." )
-                msg_args    = [ location_class ]
-        elif for_whom:
-            if on_os:
-                msg_format  = _TD_( "Undetermined path for {0} on {1}." )
-                msg_args    = [ for_whom, on_os ]
-            else:
-                msg_format  = _TD_( "Undetermined path for {0}." )
-                msg_args    = [ for_whom ]
-        elif on_os:
-            msg_format  = _TD_( "Undetermined path on {0}." )
-            msg_args    = [ on_os ]
 
-        raise UndeterminedPathError( msg_format, *msg_args )
+    def __hash__( self ):
+        """
+            Returns a hash of the class and the customized options.
+        """
+
+        return hash( self._fingerprint )
+
+
+    def __eq__( self, other ):
+        """
+            Tests whether another context is of the same class and has the
+            same customized options.
+        """
+
+        if isinstance( other, FrozenStandardPathContext_BASE ):
+            return self._fingerprint == other._fingerprint
+        return NotImplemented
+
+
+    def __ne__( self, other ):
+        """
+            Tests whether another context differs in class or in customized
+            options.
+        """
+
+        if isinstance( other, FrozenStandardPathContext_BASE ):
+            return self._fingerprint != other._fingerprint
+        return NotImplemented
+
+
+    def __repr__( self ):
+        """
+            Returns a string which can be used by :py:func:`eval
+            <CPython3:eval>` to create an instance of the class, having the
+            same options as the current instance.
+        """
+
+        return "FrozenStandardPathContext( {0} )".format(
+            ", ".join( [
+                "{0} = {1!r}".format( k, v )
+                for k, v in iter_dict_items( self._options )
+            ] )
+        )
+
+
+    def __reduce__( self ):
+        """
+            Supports pickling, which cannot set the slots of an immutable
+            instance directly.
+        """
+
+        return ( _make_frozen_context, ( self.__class__, self._options ) )
+
+
+    @property
+    def common_path( self ):
+        """
+            The common installation root path to the particular software 
+            product, if specified.
+        """
+
+        common_path = self._common_path
+        if _UNCALCULATED is common_path:
+            common_path = _StandardPathContextMixin.common_path.fget( self )
+            object.__setattr__( self, "_common_path", common_path )
+        return common_path
+
+
+    @property
+    def user_path( self ):
+        """
+            The user installation root path to the particular software 
+            product, if specified.
+        """
+
+        user_path = self._user_path
+        if _UNCALCULATED is user_path:
+            user_path = _StandardPathContextMixin.user_path.fget( self )
+            object.__setattr__( self, "_user_path", user_path )
+        return user_path
 
 
     @abstractmethod
@@ -533,32 +975,199 @@ class StandardPathContext_BASE( MutableMapping ):
 
     def get_with_default( self, option_name, fallback_value = None ):
         """
-            If the option, corresponding to the given name, has been customized
-            in this instance of a standard path context, then returns the value
-            of the customized option. Else if an option valdiator,
-            corresponding to the given option name, exists, then return the 
-            default value for the option. Else, return the fallback value, if
+            Returns the value of the option, corresponding to the given name,
+            which is either its customized value or its default value.
+            If there is no such option, then returns the fallback value, if
             one was provided, or ``None`` otherwise.
         """
 
-        if option_name in self._options:
-            return self._options[ option_name ]
         if option_name in self._option_validators:
-            return self._option_validators[ option_name ].default
+            return getattr( self, option_name )
         return fallback_value
 
 
-    def iter_option_validators( self ):
+    def fingerprint( self ):
+        """
+            Returns a hashable value, which is equal for any two contexts of
+            the same class with the same customized options, and which
+            differs once any option is customized differently.
         """
-            Returns an iterator over the available option validators.
-            Each item returned is a tuple consisting of the validator function
-            (or ``None``) and help on the corresponding option.
 
-            This can be useful for getting help on the options in an
-            interactive session.
+        return self._fingerprint
+
+
+    def thaw( self ):
         """
+            Returns a mutable context with the same options as this one.
 
-        return iter_dict_items( self._option_validators )
+            :rtype: :py:class:`StandardPathContext_BASE`
+        """
+
+        return self._mutable_class( **self._options )
+
+
+def _make_frozen_context( cls, options ):
+    """
+        Returns a frozen context of the given class with the given options.
+        Used when unpickling.
+    """
+
+    return cls( **options )
+
+
+def _option_slot_names( base_class, option_validators ):
+    """
+        Returns the names of the slots, which a frozen context class needs for
+        the given options, beyond those which its base class already provides.
+    """
+
+    return tuple( [
+        option_name for option_name in option_validators
+        if option_name not in base_class._option_validators
+    ] )
+
+
+class _ThreadLocalVar( threading.local ):
+    """
+        Stand-in for :py:class:`contextvars.ContextVar
+        <CPython3:contextvars.ContextVar>` on Pythons which lack it.
+        The value is local to each thread rather than to each task.
+    """
+
+
+    value = None
+
+
+    def get( self ):
+        """
+            Returns the value for the current thread.
+        """
+
+        return self.value
+
+
+    def set( self, value ):
+        """
+            Sets the value for the current thread.
+            Returns a token with which to restore the previous value.
+        """
+
+        token, self.value = self.value, value
+        return token
+
+
+    def reset( self, token ):
+        """
+            Restores the value which was current before the value was set.
+        """
+
+        self.value = token
+
+
+class _ContextSlot( object ):
+    """
+        Holds the current standard path context of a platform back-end.
+
+        The slot has a process-wide context, which is replaced by
+        :py:meth:`set`, and may have an overriding context within the scope
+        of :py:meth:`use`. Overriding contexts are held in a
+        :py:class:`contextvars.ContextVar <CPython3:contextvars.ContextVar>`,
+        so concurrent tasks and threads can each use their own context.
+    """
+
+
+    __slots__ = ( "_context", "_override", )
+
+
+    def __init__( self, name, context ):
+        """
+            :param name: name of the slot, such as the name of the back-end
+            :param context: the initial process-wide context
+        """
+
+        self._context = context
+        if None is _ContextVar: self._override = _ThreadLocalVar( )
+        else: self._override = _ContextVar( name, default = None )
+
+
+    def get( self ):
+        """
+            Returns the overriding context, if there is one in the current
+            scope, or else the process-wide context.
+        """
+
+        context = self._override.get( )
+        if None is context: return self._context
+        return context
+
+
+    def set( self, context ):
+        """
+            Replaces the process-wide context.
+            Returns the old process-wide context.
+        """
+
+        old_context, self._context = self._context, context
+        return old_context
+
+
+    @contextmanager
+    def use( self, context ):
+        """
+            Returns a context manager, within the scope of which the given
+            context overrides the process-wide context for the current task
+            or thread.
+        """
+
+        token = self._override.set( context )
+        try: yield context
+        finally: self._override.reset( token )
+
+
+def _encoded_path_length( path ):
+    """
+        Returns the length, in bytes, of a path as encoded for the
+        filesystem.
+    """
+
+    if isinstance( path, bytes ): return len( path )
+    fsencode = getattr( os, "fsencode", None )
+    if None is not fsencode: return len( fsencode( path ) )
+    return len( path.encode( sys.getfilesystemencoding( ) or "utf-8" ) )
+
+
+def _memoize_once( method ):
+    """
+        Returns a function, which calls a method upon its first successful
+        call and then returns the same result, whatever its arguments.
+    """
+
+    results = [ ]
+
+    def memoized_method( *args ):
+        """ Returns the memoized result, calculating it upon first call. """
+
+        if not results: results.append( method( *args ) )
+        return results[ 0 ]
+
+    return memoized_method
+
+
+#: Names of the methods, whose results are shared by all of the standard paths
+#: calculated in one pass for a single context.
+_SINGLE_PASS_METHOD_NAMES = (
+    "_whereis_user_home",
+    "_choose_common_path_parts",
+    "_choose_user_path_parts",
+)
+
+
+#: Record of all of the standard paths for a software product.
+StandardPaths = namedtuple(
+    "StandardPaths",
+    "temp common_config common_resources common_programs "
+    "user_config user_resources saved_data runtime"
+)
 
 
 class StandardPath_BASE( AbstractBase_BASE ):
@@ -570,17 +1179,42 @@ class StandardPath_BASE( AbstractBase_BASE ):
     """
 
 
-    _context = None
+    _context        = None
+    _environment    = None
+    _facts          = None
+
+    #: Module with the path manipulation functions of the OS platform for
+    #: which standard paths are being derived.
+    _path_flavor = os.path
+
+    #: Names of the environment variables which path calculations may read.
+    _environment_variable_names = ( )
 
+    #: Maximum length, in bytes, of a Unix domain socket path.
+    #: (The size of 'sun_path' in 'struct sockaddr_un', less the terminator.)
+    _socket_path_max_length = 107
 
-    def __init__( self, context = None ):
+
+    def __init__( self, context = None, environment = None, facts = None ):
         """
             :param context: an object containing the context with which to
-                            calculate paths
+                            calculate paths; if ``None``, then the current
+                            context of the platform back-end is used at the
+                            time of each calculation
             :type context: :py:class:`StandardPathContext`
+            :param environment: mapping of environment variables from which
+                                to calculate paths; the process environment,
+                                if ``None``
+            :param facts: facts about the OS platform from which to calculate
+                          paths; the facts about the current OS platform, if
+                          ``None``
+            :type facts: :py:class:`PlatformFacts
+                         <utilia.filesystem.stdpath.facts.PlatformFacts>`
         """
 
-        self._context = context
+        self._context       = context
+        self._environment   = environment
+        self._facts         = facts
 
 
     def __repr__( self ):
@@ -601,22 +1235,66 @@ class StandardPath_BASE( AbstractBase_BASE ):
             calculated with the context currently in use.
         """
 
-        path_methods = OrderedDict( [
-            [ mn.replace( "whereis_", "", 1 ), mn ]
-            for mn in dir( self ) if mn.startswith( "whereis_" )
-        ] )
+        paths = self.resolve_all( )._asdict( )
         return "{{ {0} }}".format(
-            ", ".join( map(
-                lambda k, v: "{path_type}: {path}".format(
-                    path_type = repr( k ),
-                    path = repr( getattr( self, v )( ) )
-                ),
-                iter_dict_keys( path_methods ),
-                iter_dict_values( path_methods )
-            ) )
+            ", ".join( [
+                "{path_type}: {path}".format(
+                    path_type = repr( k ), path = repr( paths[ k ] )
+                )
+                for k in sorted( paths )
+            ] )
         )
 
 
+    def resolve_all( self, context = None ):
+        """
+            Returns all of the standard paths for the software product,
+            defined in ``context``, calculated together in one pass.
+
+            The parts, which the standard paths share, are calculated only
+            once per pass: a mutable context is frozen, so that the paths
+            derived from it, such as the normalized path fragment for the
+            software product, are shared; the environment variables, which
+            the calculations may read, are read once; and the home directory
+            and the base and specific paths chosen from the context are
+            determined once.
+
+            :rtype: :py:class:`StandardPaths`
+        """
+
+        context = self._find_context( context )
+        if isinstance( context, StandardPathContext_BASE ):
+            context = context.freeze( )
+        single_pass = self._begin_single_pass( )
+        return StandardPaths( *[
+            getattr( single_pass, "whereis_" + path_type )( context )
+            for path_type in StandardPaths._fields
+        ] )
+
+
+    def _begin_single_pass( self ):
+        """
+            Returns a copy of this object, which reads the environment and
+            the facts once and memoizes the parts shared by the standard
+            paths. The copy must only be used with a single context.
+        """
+
+        single_pass = _copy( self )
+        environment = self._get_environment( )
+        single_pass._environment = dict( [
+            [ evname, environment[ evname ] ]
+            for evname in self._environment_variable_names
+            if evname in environment
+        ] )
+        single_pass._facts = self._get_facts( )
+        for method_name in _SINGLE_PASS_METHOD_NAMES:
+            setattr(
+                single_pass, method_name,
+                _memoize_once( getattr( single_pass, method_name ) )
+            )
+        return single_pass
+
+
     # pylint: disable=W0613
 
 
@@ -725,6 +1403,24 @@ class StandardPath_BASE( AbstractBase_BASE ):
         )
 
 
+    @abstractmethod
+    def whereis_runtime( self, context = None ):
+        """
+            Returns the path to the directory where the current user's
+            runtime files, such as sockets, PID files, and lock files, for the
+            software product, defined in ``context``, are kept.
+
+            Where the OS platform provides a memory-backed directory for
+            these files, it is preferred.
+
+        """
+
+        raise InvokedAbstractMethodError(
+            _TD_( "Invoked abstract method '{1}' in class '{0}'." ),
+            self.__class__.__name__, "whereis_runtime"
+        )
+
+
     @abstractmethod
     def _is_absolute_path( self, the_path ):
         """
@@ -742,13 +1438,234 @@ class StandardPath_BASE( AbstractBase_BASE ):
     # pylint: enable=W0613
 
 
+    def socket_path( self, name, context = None, create_directory = True ):
+        """
+            Returns the path to a Unix domain socket with the given name in
+            the runtime directory for the software product, defined in
+            ``context``.
+
+            :param name: name of the socket
+            :param create_directory: If ``True``, then the runtime directory
+                                     is created, accessible to the current
+                                     user only, if it does not exist.
+
+            :raises: :py:exc:`UndeterminedPathError`, if the path is too long
+                     to be bound by a socket.
+        """
+
+        the_path = self._runtime_file_path( name, context, create_directory )
+        if _encoded_path_length( the_path ) > self._socket_path_max_length:
+            raise UndeterminedPathError(
+                _TD_( "Socket path '{0}' exceeds {1} bytes." ),
+                the_path, self._socket_path_max_length
+            )
+        return the_path
+
+
+    def pid_file_path( self, name, context = None, create_directory = True ):
+        """
+            Returns the path to a PID file with the given name, plus a
+            ``.pid`` extension, in the runtime directory for the software
+            product, defined in ``context``.
+
+            :param name: name of the PID file, without extension
+            :param create_directory: If ``True``, then the runtime directory
+                                     is created, accessible to the current
+                                     user only, if it does not exist.
+        """
+
+        return self._runtime_file_path(
+            name + ".pid", context, create_directory
+        )
+
+
+    def lock_file_path( self, name, context = None, create_directory = True ):
+        """
+            Returns the path to a lock file with the given name, plus a
+            ``.lock`` extension, in the runtime directory for the software
+            product, defined in ``context``.
+
+            :param name: name of the lock file, without extension
+            :param create_directory: If ``True``, then the runtime directory
+                                     is created, accessible to the current
+                                     user only, if it does not exist.
+        """
+
+        return self._runtime_file_path(
+            name + ".lock", context, create_directory
+        )
+
+
+    def _runtime_file_path( self, name, context, create_directory ):
+        """
+            Returns the path to a file in the runtime directory, creating the
+            directory if requested.
+        """
+
+        runtime_path = self.whereis_runtime( context )
+        if create_directory and not _is_directory( runtime_path ):
+            try:
+                _make_directories( runtime_path, 0o700 )
+            except OSError:
+                # Note: Another process may have created it in the meantime.
+                if not _is_directory( runtime_path ): raise
+        self._restrict_runtime_directory( runtime_path )
+        return self._path_flavor.join( runtime_path, name )
+
+
+    def _restrict_runtime_directory( self, runtime_path ):
+        """
+            Ensures that an existing runtime directory is accessible to the
+            current user only. Permissions for the group and for others are
+            removed from a directory, which the current user owns.
+
+            :raises: :py:exc:`UndeterminedPathError`, if the directory is a
+                     symbolic link or is owned by another user.
+        """
+
+        import stat
+
+        user_uid = self._get_facts( ).user_uid
+        # Note: Without numeric user IDs, there are no POSIX permissions.
+        if None is user_uid: return
+        if is_private_directory( runtime_path, user_uid ): return
+        try: stats = os.lstat( runtime_path )
+        except OSError: return
+        if      (not stat.S_ISDIR( stats.st_mode )) \
+            or  (user_uid != stats.st_uid):
+            raise UndeterminedPathError(
+                _TD_( "Runtime directory '{0}' is not owned by user {1}." ),
+                runtime_path, user_uid
+            )
+        os.chmod( runtime_path, 0o700 )
+
+
+    @staticmethod
+    def _get_current_context( ):
+        """
+            Returns the current standard path context of the platform
+            back-end.
+        """
+
+        return None
+
+
+    def _get_environment( self ):
+        """
+            Returns the mapping of environment variables from which to
+            calculate paths.
+        """
+
+        environment = self._environment
+        if None is environment: return _envvars
+        return environment
+
+
+    def _get_facts( self ):
+        """
+            Returns the facts about the OS platform from which to calculate
+            paths.
+        """
+
+        facts = self._facts
+        if None is facts: return get_platform_facts( )
+        return facts
+
+
+    def _whereis_user_home( self ):
+        """
+            Returns the path to the current user's home directory.
+
+            :raises: :py:exc:`UndeterminedPathError`, if the path cannot be
+                     determined.
+        """
+        # TODO: Consider users other than the current one from context.
+
+        facts           = self._get_facts( )
+        user_home_path  = facts.user_home
+
+        if None is user_home_path:
+            user_id = facts.user_id
+            if None is user_id:
+                raise UndeterminedPathError(
+                    _TD_(
+                        "Undetermined path to home directory "
+                        "because current user is unknown."
+                    )
+                )
+            else:
+                raise UndeterminedPathError(
+                    _TD_(
+                        "Undetermined path to home directory of user {0}."
+                    ),
+                    user_id
+                )
+
+        return user_home_path
+
+
+    def _whereis_user_base( self ):
+        """
+            Returns the path to the user base directory, specified by
+            :pep:`370`.
+
+            :raises: :py:exc:`UndeterminedPathError`, if the path cannot be
+                     determined.
+        """
+
+        user_base_path = self._get_facts( ).user_base
+        if None is user_base_path:
+            raise UndeterminedPathError(
+                _TD_( "Undetermined path to Python user base directory." )
+            )
+        return user_base_path
+
+
+    def _whereis_user_site( self ):
+        """
+            Returns the path to the user site packages directory, specified by
+            :pep:`370`.
+
+            :raises: :py:exc:`UndeterminedPathError`, if the path cannot be
+                     determined.
+        """
+
+        user_site_path = self._get_facts( ).user_site
+        if None is user_site_path:
+            raise UndeterminedPathError(
+                _TD_( "Undetermined path to Python user site directory." )
+            )
+        return user_site_path
+
+
+    def _whereis_Python_prefix( self, context ):
+        """
+            Returns the Python installation root path from the context, if it
+            is customized there, or else from the facts about the OS
+            platform.
+
+            :raises: :py:exc:`UndeterminedPathError`, if the path cannot be
+                     determined.
+        """
+
+        if "Python_prefix_path" in context:
+            return context[ "Python_prefix_path" ]
+        python_prefix_path = self._get_facts( ).python_prefix
+        if None is python_prefix_path:
+            raise UndeterminedPathError(
+                _TD_( "Undetermined path to Python installation root." )
+            )
+        return python_prefix_path
+
+
     def _find_context( self, context ):
         """
             Returns the first available standard path context found.
         """
 
         if not None is context: return context
-        return self._context
+        if not None is self._context: return self._context
+        return self._get_current_context( )
 
 
     def _choose_common_path_parts( self, context ):
@@ -783,5 +1700,113 @@ class StandardPath_BASE( AbstractBase_BASE ):
         return base_path, context.user_path
 
 
+class CachedStandardPath( object ):
+    """
+        Wraps a standard path object and memoizes the paths calculated by its
+        ``whereis_*`` and ``resolve_all`` methods.
+
+        A memoized path is keyed on the name of the method, the
+        :py:meth:`fingerprint <StandardPathContext_BASE.fingerprint>` of the
+        context used for the calculation, and the values of the environment
+        variables which the calculation may read, or the version of the
+        :py:class:`EnvironmentSnapshot
+        <utilia.os.environment.EnvironmentSnapshot>` from which the wrapped
+        object reads them. Customizing an option of the context or changing
+        one of those environment variables therefore causes the path to be
+        calculated anew. Other facts about the OS
+        platform are assumed to be constant; call :py:meth:`clear` after
+        refreshing them.
+
+        Paths which cannot be calculated are not memoized. Other attributes
+        are those of the wrapped object.
+    """
+
+
+    def __init__( self, standard_path, maxsize = 256 ):
+        """
+            :param standard_path: the standard path object to wrap
+            :param maxsize: maximum number of paths to memoize, after which
+                            the least recently used ones are discarded
+        """
+
+        self._standard_path = standard_path
+        self._cache         = LRUDict( maxsize )
+
+
+    def __getattr__( self, name ):
+        """
+            Returns the attribute of the wrapped object. The path calculation
+            methods are wrapped upon first access.
+        """
+
+        attribute = getattr( self._standard_path, name )
+        if not callable( attribute ) or not (
+            name.startswith( "whereis_" ) or "resolve_all" == name
+        ): return attribute
+        method = self._make_caching_method( name, attribute )
+        setattr( self, name, method )
+        return method
+
+
+    def __repr__( self ):
+        """
+            Returns a string which can be used by :py:func:`eval
+            <CPython3:eval>` to create an instance of the class, wrapping an
+            equivalent standard path object.
+        """
+
+        return "CachedStandardPath( {0!r}, maxsize = {1!r} )".format(
+            self._standard_path, self._cache.maxsize
+        )
+
+
+    def _make_caching_method( self, name, method ):
+        """
+            Returns a function which memoizes the results of a path
+            calculation method of the wrapped object.
+        """
+
+        cache                       = self._cache
+        find_context                = self._standard_path._find_context
+        get_environment             = self._standard_path._get_environment
+        environment_variable_names  = \
+        self._standard_path._environment_variable_names
+
+        def whereis( context = None ):
+            """ """
+
+            context = find_context( context )
+            if None is context: return method( context )
+            environment = get_environment( )
+            # Note: An environment snapshot only changes along with its
+            #       version, so the version stands in for the values.
+            environment_state = getattr( environment, "version", None )
+            if None is environment_state:
+                environment_state = tuple( [
+                    environment.get( evname )
+                    for evname in environment_variable_names
+                ] )
+            key = ( name, context.fingerprint( ), environment_state )
+            try:
+                return cache[ key ]
+            except _builtins_KeyError: pass
+            # Note: Options with unhashable values cannot be memoized.
+            except _builtins_TypeError: return method( context )
+            path = cache[ key ] = method( context )
+            return path
+
+        whereis.__name__    = name
+        whereis.__doc__     = method.__doc__
+        return whereis
+
+
+    def clear( self ):
+        """
+            Discards all memoized paths.
+        """
+
+        self._cache.clear( )
+
+
 ###############################################################################
 # vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
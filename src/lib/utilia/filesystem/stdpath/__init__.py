@@ -84,6 +84,20 @@
 
     * :py:func:`whereis_my_saved_data`
 
+    To calculate these paths for many software products at once, use
+    :py:func:`whereis_my_paths_by_columns`. To create the directories for
+    many software products at once, use :py:func:`materialize_layouts`. To
+    calculate the paths for an OS platform other than the current one, use
+    :py:func:`compute_standard_paths`. To record the paths once, such as at
+    install time, and read them at startup, use :py:func:`write_path_snapshot`
+    and :py:func:`load_standard_path`. To calculate the per-user paths for
+    many user accounts at once, use :py:func:`whereis_users_paths`. To avoid
+    reading the environment upon every calculation, use
+    :py:func:`snapshot_environment`. To read resource files without copying
+    them, use :py:class:`ResourceLocator`. To check for or create the
+    directories from :py:mod:`asyncio <CPython3:asyncio>` code, use the
+    coroutines of the :py:mod:`.aio` module.
+
     Please see their documentation and the
     :ref:`SECTION-utilia.filesystem.stdpath-Examples` section for details on 
     using them.
@@ -100,27 +114,22 @@ from __future__ import (
 __docformat__ = "reStructuredText"
 
 
-import sys
 from os import (
     environ                 as envvars,
 )
 from os.path import (
     join                    as join_path,
-    dirname                 as dirname_of_path,
-    expanduser              as expand_user_path,
 )
-import platform
-import site
-import functools
-import re
 
 
 from utilia import (
     _autodoc_function_parameters,
+    _make_lazy_attribute_loader,
     _TD_,
+    python_version          as _python_version,
 )
-from utilia.compat.builtins import ( # pylint: disable=W0622
-    reduce,
+from utilia.compat.collections import (
+    OrderedDict,
 )
 from utilia.exceptions import (
     Exception_WithReason,
@@ -128,6 +137,82 @@ from utilia.exceptions import (
 from .. import (
     Error_BASE              as FilesystemError_BASE,
 )
+from .facts import (
+    PlatformFacts,
+    get_platform_facts,
+    truncated_framework_path,
+)
+from .normalization import (
+    NameNormalizer,
+    get_name_normalizer,
+)
+from .xdg import (
+    XDGResolver,
+    get_xdg_resolver,
+)
+# Lazy Submodules
+# (The 'aio' module requires Python 3.5 or later.)
+# (The names, which are re-exported from the other submodules, are imported
+#  upon first access to them, so that importing this package does not import
+#  those submodules and their dependencies.)
+
+
+_LAZY_SUBMODULE_NAMES = frozenset( [
+    "aio", "layout", "offline", "resources", "snapshot", "users",
+] )
+
+#: Submodules, from which names are re-exported, by name.
+_LAZY_ATTRIBUTE_HOMES = dict( [
+    [ name, module_name ]
+    for module_name, names in [
+        [ "layout", [
+            "DEFAULT_LAYOUT_KINDS", "PRIVATE_LAYOUT_KINDS", "PRIVATE_MODE",
+            "LayoutReport", "materialize_layouts",
+        ] ],
+        [ "offline", [
+            "offline_platform_facts", "make_offline_standard_path",
+            "compute_standard_paths",
+        ] ],
+        [ "snapshot", [
+            "PathSnapshot", "SnapshotStandardPath", "take_path_snapshot",
+            "write_path_snapshot", "read_path_snapshot", "load_standard_path",
+        ] ],
+        [ "users", [
+            "DEFAULT_USER_PATH_KINDS", "UserAccount", "iter_user_accounts",
+            "whereis_users_paths",
+        ] ],
+        [ "resources", [ "DEFAULT_RESOURCE_KINDS", "ResourceLocator", ] ],
+    ]
+    for name in names
+] )
+
+
+__getattr__ = _make_lazy_attribute_loader(
+    __name__, _LAZY_SUBMODULE_NAMES, _LAZY_ATTRIBUTE_HOMES
+)
+
+del _make_lazy_attribute_loader
+
+
+def __dir__( ):
+    """
+        Returns the names in the module namespace, including the names of
+        attributes which have not been loaded yet.
+    """
+
+    return sorted(
+            set( globals( ) )
+        |   _LAZY_SUBMODULE_NAMES
+        |   set( _LAZY_ATTRIBUTE_HOMES )
+    )
+
+
+# Note: Module-level '__getattr__' hooks are only honored as of Python 3.7.
+#       Import the re-exported names eagerly on older Pythons.
+if (_python_version.major, _python_version.minor) < (3, 7):
+    globals( ).update( [
+        [ _name, __getattr__( _name ) ] for _name in _LAZY_ATTRIBUTE_HOMES
+    ] )
 
 
 # TODO: Move to another module.
@@ -140,11 +225,8 @@ def join_filtered_path( *posargs ):
     return join_path( *filter( None, posargs ) )
 
 
-def __DOCSTRING_FRAGMENTS( ):
-    """
-        Returns a dictionary of common docstring fragments.
-    """
-    return \
+#: Dictionary of common docstring fragments.
+__DOCSTRING_FRAGMENTS = \
     {
         "error_on_none": \
     """
@@ -217,20 +299,15 @@ def __decorate_docstring( func ):
         Appends additional documentation to a docstring.
     """
 
-    docs_DICT = __DOCSTRING_FRAGMENTS( )
-
-    _autodoc_function_parameters( func, docs_DICT )
-    func.__doc__ += docs_DICT[ "RTYPE_string_or_None" ]
-    func.__doc__ += docs_DICT[ "RAISES_Unsupported_and_Undetermined" ]
+    _autodoc_function_parameters(
+        func, __DOCSTRING_FRAGMENTS,
+        __DOCSTRING_FRAGMENTS[ "RTYPE_string_or_None" ],
+        __DOCSTRING_FRAGMENTS[ "RAISES_Unsupported_and_Undetermined" ]
+    )
 
     return func
 
 
-# Character Translators for Names
-__whitespace_to_underscore  = functools.partial( re.sub, r"\s+", "_" )
-__dot_to_underscore         = functools.partial( re.sub, r"\.{1,1}", "_" )
-
-
 class UnsupportedFilesystemLayout( Exception_WithReason, RuntimeError ):
     """
         Error if the standard filesystem layout associated with the current OS
@@ -354,20 +431,17 @@ def which_fs_layout( ):
                  classifier implemented for the OS in use.
     """
 
-    osa = platform.system( )
+    facts   = get_platform_facts( )
+    fsl     = facts.fs_layout
 
-    if   osa in [ "Linux", ]:
-        return "POSIX"
-    elif osa in [ "Darwin", ]:
-        return "MacOS X"
-    elif osa in [ "Windows", ]:
-        return "Windows"
-    else:
+    if None is fsl:
         raise UnsupportedFilesystemLayout(
-            "Unimplemented filesystem layout classifier for {0}.", osa
+            "Unimplemented filesystem layout classifier for {0}.",
+            facts.os_name
         )
+    return fsl
 
-_autodoc_function_parameters( which_fs_layout, __DOCSTRING_FRAGMENTS( ) )
+_autodoc_function_parameters( which_fs_layout, __DOCSTRING_FRAGMENTS )
 
 
 def __computed_MacOS_X_python_prefix( prefix ):
@@ -377,11 +451,19 @@ def __computed_MacOS_X_python_prefix( prefix ):
         Else, returns the prefix without alteration.
     """
 
-    match = re.findall( r".*/Python\.framework/Versions/.*", prefix )
-    if match:
-        return reduce( lambda x, f: f( x ), [ dirname_of_path ] * 4, prefix )
-    
-    return prefix
+    facts = get_platform_facts( )
+    if prefix == facts.python_prefix: return facts.python_prefix_truncated
+    return truncated_framework_path( prefix )
+
+
+def __is_MacOS_X_framework_python( ):
+    """
+        Returns ``True``, if the running Python is a MacOS X framework
+        installation.
+    """
+
+    facts = get_platform_facts( )
+    return facts.python_prefix != facts.python_prefix_truncated
 
 
 def __computed_Windows_program_files_path( error_on_none = False ):
@@ -395,10 +477,11 @@ def __computed_Windows_program_files_path( error_on_none = False ):
     location            = _TD_( "Windows program files" )
     evname              = None
 
-    if "64bit" in platform.architecture( ):
-        if sys.maxsize > 2**32: evname = "ProgramFiles"
-        else:                   evname = "ProgramFiles(x86)"
-    else:                       evname = "ProgramFiles"
+    facts = get_platform_facts( )
+    if 64 == facts.os_bit_width:
+        if 64 == facts.app_bit_width:   evname = "ProgramFiles"
+        else:                           evname = "ProgramFiles(x86)"
+    else:                               evname = "ProgramFiles"
     common_base_path = envvars.get( evname, None )
 
     __decide_upon_error_on_none(
@@ -407,6 +490,60 @@ def __computed_Windows_program_files_path( error_on_none = False ):
     return common_base_path
 
 
+def get_platform_backend( fs_layout = None ):
+    """
+        Returns the module which implements the object-oriented standard path
+        calculations for a filesystem layout classification, importing it
+        upon first use. If no classification is given, then the
+        classification for the current OS platform is used. Back-ends for
+        other filesystem layouts are never imported.
+
+        The module provides the ``StandardPath``, ``StandardPathContext``,
+        and ``FrozenStandardPathContext`` classes and the ``get_context``,
+        ``set_context``, and ``use_context`` functions.
+
+        :param fs_layout: filesystem layout classification, as returned by
+                          :py:func:`which_fs_layout`
+        :rtype: :py:class:`module <CPython3:types.ModuleType>`
+        :raises: :py:class:`UnsupportedFilesystemLayout`, if there is no
+                 back-end for the filesystem layout.
+    """
+
+    from ._INTERNAL_ import (
+        get_backend,
+    )
+
+    return get_backend( fs_layout )
+
+
+def snapshot_environment( fs_layout = None ):
+    """
+        Returns a snapshot of the environment variables, from which the
+        standard path objects of a platform back-end calculate paths. Pass
+        it as the ``environment`` argument of the ``StandardPath`` class of
+        the back-end, so that the environment is only read when the snapshot
+        is refreshed. A :py:class:`CachedStandardPath
+        <utilia.filesystem.stdpath._INTERNAL_.CachedStandardPath>`, wrapping
+        such an object, checks the validity of its memoized paths by the
+        version of the snapshot alone.
+
+        :param fs_layout: filesystem layout classification of the platform
+                          back-end; if ``None``, then the classification for
+                          the current OS platform is used
+        :rtype: :py:class:`EnvironmentSnapshot
+                <utilia.os.environment.EnvironmentSnapshot>`
+    """
+
+    from utilia.os.environment import (
+        EnvironmentSnapshot,
+    )
+
+    return EnvironmentSnapshot(
+        get_platform_backend( fs_layout ).StandardPath
+        ._environment_variable_names
+    )
+
+
 @__decorate_docstring
 def concatenated_software_path_fragment(
     software_name, vendor_name = None, version = None,
@@ -439,28 +576,12 @@ def concatenated_software_path_fragment(
 
     else:
 
-        if vendor_name:
-            vendor_name = vendor_name.strip( )
-            if   fsl in [ "POSIX", ]:
-                vendor_name = __whitespace_to_underscore( vendor_name )
-            elif fsl in [ "MacOS X", ]: pass
-            elif fsl in [ "Windows", ]: pass
-            else: __raise_UnsupportedFilesystemLayout( fsl )
-        
-        software_name = software_name.strip( )
-        if   fsl in [ "POSIX", ]:
-            software_name = __whitespace_to_underscore( software_name )
-        elif fsl in [ "MacOS X", ]: pass
-        elif fsl in [ "Windows", ]: pass
-        else: __raise_UnsupportedFilesystemLayout( fsl )
-        
-        if version:
-            version = version.strip( )
-            if   fsl in [ "POSIX", ]:
-                version = __whitespace_to_underscore( version )
-            elif fsl in [ "MacOS X", ]: pass
-            elif fsl in [ "Windows", ]:  pass
-            else: __raise_UnsupportedFilesystemLayout( fsl )
+        normalize = get_name_normalizer( fsl )
+        if None is normalize: __raise_UnsupportedFilesystemLayout( fsl )
+
+        if vendor_name: vendor_name = normalize( vendor_name )
+        software_name = normalize( software_name )
+        if version: version = normalize( version )
         
         path_fragment = \
         join_filtered_path( vendor_name, software_name, version )
@@ -713,13 +834,10 @@ def whereis_user_home( error_on_none = False ):
     user_home_path          = None
 
     fsl = which_fs_layout( )
-    if   fsl in [ "POSIX", "MacOS X", ]:
-        user_id         = envvars.get( "USER", None )
-        user_home_path  = expand_user_path( "~" )
-        if "~" == user_home_path: user_home_path = None
-    elif fsl in [ "Windows", ]:
-        user_id         = envvars.get( "UserName", None )
-        user_home_path  = envvars.get( "UserProfile", None )
+    if fsl in [ "POSIX", "MacOS X", "Windows", ]:
+        facts           = get_platform_facts( )
+        user_id         = facts.user_id
+        user_home_path  = facts.user_home
     else: __raise_UnsupportedFilesystemLayout( fsl )
     
     if (None is user_home_path) and error_on_none:
@@ -823,13 +941,13 @@ def whereis_preferred_temp_base(
 
     try: utbp = whereis_user_temp_base( error_on_none = error_on_none )
     except UndeterminedFilesystemPath as exc:
-        error_reason_format = exc.error_reason_format
-        error_reason_args   = exc.error_reason_args 
+        error_reason_format = exc.reason_format
+        error_reason_args   = exc.reason_args
 
     try: stbp = whereis_common_temp_base( error_on_none = error_on_none )
     except UndeterminedFilesystemPath as exc:
-        error_reason_format = exc.error_reason_format
-        error_reason_args   = exc.error_reason_args 
+        error_reason_format = exc.reason_format
+        error_reason_args   = exc.reason_args
 
     if   stbp and prefer_common:    temp_base_path = stbp
     elif utbp:                      temp_base_path = utbp
@@ -964,7 +1082,7 @@ def whereis_my_common_config_pythonic(
     """
 
     fsl         = which_fs_layout( )
-    base_path   = sys.prefix
+    base_path   = get_platform_facts( ).python_prefix
     full_path   = None
     evname      = None
 
@@ -1097,7 +1215,7 @@ def whereis_my_common_resources_pythonic(
     """
 
     fsl         = which_fs_layout( )
-    base_path   = sys.prefix
+    base_path   = get_platform_facts( ).python_prefix
     full_path   = None
     evname      = None
 
@@ -1153,8 +1271,7 @@ def whereis_my_user_config_at_base(
             full_path = \
             join_filtered_path( base_path, ".config", specific_path )
         elif fsl in [ "MacOS X", ]:
-            posix_flavor = \
-            sys.prefix == __computed_MacOS_X_python_prefix( sys.prefix )
+            posix_flavor = not __is_MacOS_X_framework_python( )
             if posix_flavor:    mid_path = ".config"
             else:               mid_path = "Preferences"
             full_path = \
@@ -1193,8 +1310,7 @@ def whereis_my_user_config(
     elif fsl in [ "MacOS X", ]:
         uhp = whereis_user_home( error_on_none = error_on_none )
         if uhp:
-            posix_flavor = \
-            sys.prefix == __computed_MacOS_X_python_prefix( sys.prefix )
+            posix_flavor = not __is_MacOS_X_framework_python( )
             if posix_flavor:    base_path = uhp
             else:               base_path = join_path( uhp, "Library" )
     elif fsl in [ "Windows", ]:
@@ -1218,7 +1334,7 @@ def whereis_my_user_config_pythonic(
     """
 
     fsl         = which_fs_layout( )
-    base_path   = site.USER_BASE
+    base_path   = get_platform_facts( ).user_base
     full_path   = None
     evname      = None
 
@@ -1228,8 +1344,7 @@ def whereis_my_user_config_pythonic(
         if   fsl in [ "POSIX", ]:
             full_path = join_filtered_path( base_path, "etc", specific_path )
         elif fsl in [ "MacOS X", ]:
-            posix_flavor = \
-            sys.prefix == __computed_MacOS_X_python_prefix( sys.prefix )
+            posix_flavor = not __is_MacOS_X_framework_python( )
             if posix_flavor:    mid_path = "etc"
             else:               mid_path = "Preferences"
             full_path = \
@@ -1267,8 +1382,7 @@ def whereis_my_user_resources_at_base(
             full_path = \
             join_filtered_path( base_path, ".local/share", specific_path )
         elif fsl in [ "MacOS X", ]:
-            posix_flavor = \
-            sys.prefix == __computed_MacOS_X_python_prefix( sys.prefix )
+            posix_flavor = not __is_MacOS_X_framework_python( )
             if posix_flavor:    mid_path = ".local/share"
             else:               mid_path = "Application Support"
             full_path = \
@@ -1306,8 +1420,7 @@ def whereis_my_user_resources(
     elif fsl in [ "MacOS X", ]:
         uhp = whereis_user_home( error_on_none = error_on_none )
         if uhp:
-            posix_flavor = \
-            sys.prefix == __computed_MacOS_X_python_prefix( sys.prefix )
+            posix_flavor = not __is_MacOS_X_framework_python( )
             if posix_flavor:    base_path = uhp
             else:               base_path = join_path( uhp, "Library" )
     elif fsl in [ "Windows", ]:
@@ -1331,7 +1444,7 @@ def whereis_my_user_resources_pythonic(
     """
 
     fsl         = which_fs_layout( )
-    base_path   = site.USER_BASE
+    base_path   = get_platform_facts( ).user_base
     full_path   = None
     evname      = None
 
@@ -1341,8 +1454,7 @@ def whereis_my_user_resources_pythonic(
         if   fsl in [ "POSIX", ]:
             full_path = join_filtered_path( base_path, "share", specific_path )
         elif fsl in [ "MacOS X", ]:
-            posix_flavor = \
-            sys.prefix == __computed_MacOS_X_python_prefix( sys.prefix )
+            posix_flavor = not __is_MacOS_X_framework_python( )
             if posix_flavor:    mid_path = "share"
             else:               mid_path = "Application Support"
             full_path = \
@@ -1402,7 +1514,7 @@ def whereis_my_saved_data( specific_path = None, error_on_none = False ):
     base_path   = None
 
     if   fsl in [ "POSIX", ]:   pass
-    if   fsl in [ "MacOS X", "Windows", ]:
+    elif fsl in [ "MacOS X", "Windows", ]:
         base_path = whereis_user_home( error_on_none = error_on_none )
     else: __raise_UnsupportedFilesystemLayout( fsl )
 
@@ -1411,5 +1523,152 @@ def whereis_my_saved_data( specific_path = None, error_on_none = False ):
     )
 
 
+#: Functions which calculate the paths to the locations for a specific
+#: software product, by names of the locations.
+__SPECIFIC_PATH_FINDERS = OrderedDict( [
+    [ "temp",                       whereis_my_temp ],
+    [ "common_config",              whereis_my_common_config ],
+    [ "common_config_pythonic",     whereis_my_common_config_pythonic ],
+    [ "common_resources",           whereis_my_common_resources ],
+    [ "common_resources_pythonic",  whereis_my_common_resources_pythonic ],
+    [ "user_config",                whereis_my_user_config ],
+    [ "user_config_pythonic",       whereis_my_user_config_pythonic ],
+    [ "user_resources",             whereis_my_user_resources ],
+    [ "user_resources_pythonic",    whereis_my_user_resources_pythonic ],
+    [ "saved_data",                 whereis_my_saved_data ],
+] )
+
+#: Stand-in for the specific part of a path, while calculating the rest of it.
+#: (A NUL character cannot appear in a real path.)
+__SPECIFIC_PATH_PLACEHOLDER = "\0"
+
+
+def whereis_my_paths_by_columns(
+    software_names, vendor_names = None, versions = None,
+    locations = None, error_on_none = False
+):
+    """
+        Returns the paths to locations for many software products at once.
+        The software products are described by parallel columns of names,
+        vendor names, and versions, and the paths are returned as parallel
+        columns, one per location.
+
+        The result is the same as calling
+        :py:func:`concatenated_software_path_fragment` for each software
+        product and then passing its path fragment as the specific path to
+        the function for each location, such as
+        :py:func:`whereis_my_user_config`. However, the path fragment is only
+        calculated once per distinct software product and the rest of each
+        path is only calculated once per location.
+
+        The locations are named after the functions which calculate the
+        paths to them, without the ``whereis_my_`` prefix:
+
+        .. csv-table::
+           :header: "Location", "Function"
+           :widths: 40, 60
+
+           "temp", ":py:func:`whereis_my_temp`"
+           "common_config", ":py:func:`whereis_my_common_config`"
+           "common_config_pythonic",
+           ":py:func:`whereis_my_common_config_pythonic`"
+           "common_resources", ":py:func:`whereis_my_common_resources`"
+           "common_resources_pythonic",
+           ":py:func:`whereis_my_common_resources_pythonic`"
+           "user_config", ":py:func:`whereis_my_user_config`"
+           "user_config_pythonic",
+           ":py:func:`whereis_my_user_config_pythonic`"
+           "user_resources", ":py:func:`whereis_my_user_resources`"
+           "user_resources_pythonic",
+           ":py:func:`whereis_my_user_resources_pythonic`"
+           "saved_data", ":py:func:`whereis_my_saved_data`"
+
+        :param software_names: Column of names of software products.
+        :param vendor_names: Column of names of the vendors of the software
+                             products, or ``None`` for no vendor names.
+        :param versions: Column of versions of the software products, or
+                         ``None`` for no versions.
+        :param locations: Names of the locations to calculate paths to, or
+                          ``None`` for all of them.
+        :rtype: :py:class:`OrderedDict <CPython3:collections.OrderedDict>`,
+                mapping each location name to a list of paths, each of which
+                is a :py:class:`string <CPython3:str>` or ``None``
+        :raises: :py:exc:`ValueError <CPython3:ValueError>`, if the columns
+                 differ in length or a location is unknown.
+    """
+
+    software_names = list( software_names )
+    row_count = len( software_names )
+    if None is vendor_names:    vendor_names = [ None ] * row_count
+    else:                       vendor_names = list( vendor_names )
+    if None is versions:        versions = [ None ] * row_count
+    else:                       versions = list( versions )
+    if not (row_count == len( vendor_names ) == len( versions )):
+        raise ValueError(
+            "Columns of software names, vendor names, and versions "
+            "differ in length."
+        )
+
+    if None is locations: locations = list( __SPECIFIC_PATH_FINDERS )
+    for location in locations:
+        if location not in __SPECIFIC_PATH_FINDERS:
+            raise ValueError( "Unknown location '{0}'.".format( location ) )
+
+    fragments_by_identity = { }
+    fragments = [ ]
+    for identity in zip( software_names, vendor_names, versions ):
+        try: fragment = fragments_by_identity[ identity ]
+        except KeyError:
+            fragment = fragments_by_identity[ identity ] = \
+            concatenated_software_path_fragment(
+                *identity, error_on_none = error_on_none
+            )
+        fragments.append( fragment )
+
+    placeholder = __SPECIFIC_PATH_PLACEHOLDER
+    columns = OrderedDict( )
+    for location in locations:
+        finder = __SPECIFIC_PATH_FINDERS[ location ]
+        paths_by_fragment = { }
+        column = [ ]
+        for fragment in fragments:
+            try: path = paths_by_fragment[ fragment ]
+            except KeyError:
+                if fragment:
+                    if placeholder not in paths_by_fragment:
+                        try:
+                            paths_by_fragment[ placeholder ] = finder(
+                                specific_path = placeholder,
+                                error_on_none = error_on_none
+                            )
+                        except UndeterminedFilesystemPath:
+                            # Note: Fail with the actual path fragment,
+                            #       rather than the placeholder, in the
+                            #       reason for the error.
+                            finder(
+                                specific_path = fragment,
+                                error_on_none = error_on_none
+                            )
+                            raise
+                    template = paths_by_fragment[ placeholder ]
+                    if template:
+                        path = template.replace( placeholder, fragment )
+                    else: path = template
+                else:
+                    path = finder(
+                        specific_path = None, error_on_none = error_on_none
+                    )
+                paths_by_fragment[ fragment ] = path
+            column.append( path )
+        columns[ location ] = column
+
+    return columns
+
+_autodoc_function_parameters(
+    whereis_my_paths_by_columns, __DOCSTRING_FRAGMENTS,
+    __DOCSTRING_FRAGMENTS[ "RAISES_Unsupported_and_Undetermined" ]
+)
+
+
 ###############################################################################
 # vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -0,0 +1,360 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides :py:mod:`asyncio <CPython3:asyncio>` coroutines, which check
+    for and create the directories at standard paths without blocking the
+    event loop.
+
+    The standard paths are calculated in the event loop, since doing so does
+    not touch the filesystem. The filesystem operations run in a bounded pool
+    of threads. Concurrent requests for the same operation on the same
+    directory, such as from many tasks, which start at once and share a
+    parent directory, are batched, so that the operation runs only once and
+    its outcome is shared among them.
+
+    This module requires Python 3.5 or later. It is not imported by its
+    package and is loaded upon first access to it as an attribute of its
+    package.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+import asyncio
+import threading
+from os.path import (
+    dirname                 as _parent_path,
+    isdir                   as _is_directory,
+    normpath                as _normalize_path,
+    sep                     as _path_separator,
+)
+
+from utilia.compat.collections import ( # pylint: disable=E0611
+    Mapping,
+    OrderedDict,
+)
+from .layout import (
+    DEFAULT_LAYOUT_KINDS,
+    PRIVATE_LAYOUT_KINDS,
+    PRIVATE_MODE,
+    LayoutReport,
+    _make_directory,
+)
+
+
+#: Number of threads in the default pool for filesystem operations.
+DEFAULT_MAX_WORKERS = 4
+
+#: Returns the event loop of the running coroutine.
+#: (Python versions before 3.7 only have 'get_event_loop'.)
+_get_running_loop = getattr(
+    asyncio, "get_running_loop", asyncio.get_event_loop
+)
+
+
+class BatchingExecutor( object ):
+    """
+        Runs blocking functions in a bounded pool of threads on behalf of
+        coroutines. Concurrent calls of the same function with the same
+        arguments are batched into one run.
+    """
+
+
+    def __init__( self, max_workers = DEFAULT_MAX_WORKERS, executor = None ):
+        """
+            :param max_workers: maximum number of threads in the pool
+            :param executor: :py:class:`concurrent.futures.Executor
+                             <CPython3:concurrent.futures.Executor>` to run
+                             functions in; if ``None``, then a pool of
+                             threads is created upon first need
+        """
+
+        self._max_workers   = max_workers
+        self._executor      = executor
+        self._in_flight     = { }
+        self._lock          = threading.Lock( )
+
+
+    def __repr__( self ):
+        """
+            Returns a string representation of the executor.
+        """
+
+        return "BatchingExecutor( max_workers = {0!r} )".format(
+            self._max_workers
+        )
+
+
+    @property
+    def executor( self ):
+        """
+            The executor, in which functions run.
+        """
+
+        with self._lock:
+            if None is self._executor:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor( self._max_workers )
+            return self._executor
+
+
+    async def run( self, function, *args ):
+        """
+            Runs a function with the given arguments in the pool and returns
+            its result. If the same call is already running for the same
+            event loop, then its result is awaited instead.
+
+            Cancelling the awaiting task does not cancel the run, since other
+            tasks may be awaiting it.
+        """
+
+        loop = _get_running_loop( )
+        key = ( loop, function, args )
+        in_flight = self._in_flight
+        future = in_flight.get( key )
+        if None is future:
+            future = loop.run_in_executor( self.executor, function, *args )
+            in_flight[ key ] = future
+            future.add_done_callback(
+                lambda _future: in_flight.pop( key, None )
+            )
+        return await asyncio.shield( future )
+
+
+    def shutdown( self, wait = True ):
+        """
+            Shuts the pool of threads down, if it was created by this object.
+        """
+
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if None is not executor: executor.shutdown( wait = wait )
+
+
+_default_executor       = None
+_default_executor_lock  = threading.Lock( )
+
+
+def get_default_executor( ):
+    """
+        Returns the shared :py:class:`BatchingExecutor`, which is used when
+        no other is given, creating it upon first use.
+    """
+
+    global _default_executor # pylint: disable=W0603
+
+    with _default_executor_lock:
+        if None is _default_executor:
+            _default_executor = BatchingExecutor( )
+        return _default_executor
+
+
+async def is_directory( path, executor = None ):
+    """
+        Returns ``True``, if a directory exists at the given path.
+
+        :param executor: the :py:class:`BatchingExecutor` to run the check in;
+                         the default one, if ``None``
+    """
+
+    if None is executor: executor = get_default_executor( )
+    return await executor.run( _is_directory, _normalize_path( path ) )
+
+
+async def make_directories( path, mode = 0o777, executor = None ):
+    """
+        Creates a directory and any missing parents of it.
+
+        :param mode: mode with which to create directories, as for
+                     :py:func:`os.mkdir <CPython3:os.mkdir>`
+        :param executor: the :py:class:`BatchingExecutor` to run the filesystem
+                         operations in; the default one, if ``None``
+        :returns: list of the directories which were created, parents first
+    """
+
+    if None is executor: executor = get_default_executor( )
+    created = [ ]
+    await _ensure_directory(
+        _normalize_path( path ), mode, executor, created
+    )
+    return created
+
+
+async def _ensure_directory(
+    path, mode, executor, created, parent_mode = None
+):
+    """
+        Creates a directory, after its missing parents, and appends the
+        paths to the created directories to a list. The parents are created
+        with their own mode, if one is given.
+    """
+
+    if None is parent_mode: parent_mode = mode
+    if await executor.run( _is_directory, path ): return
+    parent = _parent_path( path )
+    if parent and (parent != path):
+        await _ensure_directory( parent, parent_mode, executor, created )
+    if await executor.run( _make_directory, path, mode ):
+        created.append( path )
+
+
+def _calculate_paths( context, kinds, fs_layout ):
+    """
+        Returns an ordered dictionary from kind of standard path to path, as
+        calculated for a context.
+    """
+
+    from . import get_platform_backend
+
+    standard_path = get_platform_backend( fs_layout ).StandardPath( )
+    context = standard_path._find_context( context )
+    return OrderedDict( [
+        [ kind, getattr( standard_path, "whereis_" + kind )( context ) ]
+        for kind in kinds
+    ] )
+
+
+async def resolve_existing(
+    context = None,
+    kinds = DEFAULT_LAYOUT_KINDS, fs_layout = None, executor = None
+):
+    """
+        Returns the standard paths of the software product, defined in
+        ``context``, at which directories exist.
+
+        :param context: standard path context for the platform back-end; if
+                        ``None``, then the current context is used
+        :param kinds: names of the kinds of standard paths to check, as in the
+                      fields of the ``StandardPaths`` record returned by
+                      ``StandardPath.resolve_all``
+        :param fs_layout: filesystem layout classification of the platform
+                          back-end; if ``None``, then the classification for
+                          the current OS platform is used
+        :param executor: the :py:class:`BatchingExecutor` to run the checks in;
+                         the default one, if ``None``
+        :returns: ordered dictionary from kind of standard path to path, or
+                  to ``None``, if no directory exists at the path
+        :raises: :py:exc:`UndeterminedPathError
+                 <utilia.filesystem.stdpath._INTERNAL_.UndeterminedPathError>`,
+                 if a path cannot be calculated.
+    """
+
+    paths = _calculate_paths( context, kinds, fs_layout )
+    kinds = [ kind for kind, path in paths.items( ) if path ]
+    exist_flags = await asyncio.gather( *[
+        is_directory( paths[ kind ], executor ) for kind in kinds
+    ] )
+    for kind, exists in zip( kinds, exist_flags ):
+        if not exists: paths[ kind ] = None
+    return paths
+
+
+async def ensure_layout(
+    contexts,
+    kinds = DEFAULT_LAYOUT_KINDS, fs_layout = None,
+    mode = 0o777, executor = None
+):
+    """
+        Creates all of the missing directories of the standard layouts for
+        one or many software products. This is the coroutine counterpart of
+        :py:func:`materialize_layouts
+        <utilia.filesystem.stdpath.materialize_layouts>`.
+
+        :param contexts: a standard path context or an iterable of them, as
+                         accepted by the ``StandardPath`` class of the
+                         platform back-end
+        :param kinds: names of the kinds of standard paths to create
+        :param fs_layout: filesystem layout classification of the platform
+                          back-end; if ``None``, then the classification for
+                          the current OS platform is used
+        :param mode: mode with which to create directories, as for
+                     :py:func:`os.mkdir <CPython3:os.mkdir>`; directories
+                     of the kinds in :py:data:`PRIVATE_LAYOUT_KINDS
+                     <utilia.filesystem.stdpath.PRIVATE_LAYOUT_KINDS>`
+                     are created with :py:data:`PRIVATE_MODE
+                     <utilia.filesystem.stdpath.PRIVATE_MODE>` instead
+        :param executor: the :py:class:`BatchingExecutor` to run the filesystem
+                         operations in; the default one, if ``None``
+        :rtype: :py:class:`LayoutReport
+                <utilia.filesystem.stdpath.LayoutReport>`
+    """
+
+    from ._INTERNAL_ import UndeterminedPathError
+
+    if None is executor: executor = get_default_executor( )
+    if isinstance( contexts, Mapping ): contexts = [ contexts ]
+
+    failed = [ ]
+    targets = set( )
+    private_targets = set( )
+    for context in contexts:
+        try:
+            paths = _calculate_paths( context, kinds, fs_layout )
+        except UndeterminedPathError as exc:
+            failed.append( ( context, exc ) )
+            continue
+        for kind, path in paths.items( ):
+            if not path: continue
+            path = _normalize_path( path )
+            targets.add( path )
+            if kind in PRIVATE_LAYOUT_KINDS: private_targets.add( path )
+    targets = sorted( targets )
+
+    created = [ ]
+    existing = [ ]
+
+    async def ensure_target( path ):
+        """ Creates a requested directory and records the outcome. """
+        created_here = [ ]
+        if path in private_targets:
+            await _ensure_directory(
+                path, PRIVATE_MODE, executor, created_here, mode
+            )
+        else: await _ensure_directory( path, mode, executor, created_here )
+        if path not in created_here: existing.append( path )
+        created.extend( created_here )
+
+    outcomes = await asyncio.gather(
+        *[ ensure_target( path ) for path in targets ],
+        return_exceptions = True
+    )
+    for path, outcome in zip( targets, outcomes ):
+        if isinstance( outcome, Exception ): failed.append( ( path, outcome ) )
+
+    # Note: Batched creations are reported to every requester of them.
+    created = sorted(
+        set( created ),
+        key = lambda path: ( path.count( _path_separator ), path )
+    )
+    existing = sorted( set( existing ) - set( created ) )
+    return LayoutReport( created, existing, failed )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -0,0 +1,360 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides a snapshot of the facts about the OS platform and the Python
+    installation upon which standard path calculations depend.
+
+    Querying some of these facts is costly. For example,
+    :py:func:`platform.architecture <CPython3:platform.architecture>` may
+    start a subprocess. Therefore, each fact is determined at most once per
+    process, upon first use, and is then reused by all of the standard path
+    calculations. Use :py:meth:`PlatformFacts.refresh` to discard the
+    determined facts, such as after changing the environment in a test.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+import os
+import sys
+import stat
+from os import (
+    environ                 as _envvars,
+)
+from os.path import (
+    dirname                 as _dirname_of_path,
+    expanduser              as _expand_user_path,
+)
+
+
+#: Path of the runtime directory, which the system provides for the user with
+#: a given numeric ID.
+_SYSTEM_RUNTIME_DIR_FORMAT = "/run/user/{0}"
+
+#: Classifications of filesystem layouts by OS name.
+_FS_LAYOUTS_BY_OS_NAME = \
+{
+    "Linux":    "POSIX",
+    "Darwin":   "MacOS X",
+    "Windows":  "Windows",
+}
+
+
+def _determine_os_name( facts ):
+    """
+        Returns the name of the OS, as reported by the :py:mod:`platform
+        <CPython3:platform>` module.
+    """
+
+    import platform
+
+    return platform.system( )
+
+
+def _determine_fs_layout( facts ):
+    """
+        Returns the classification of the filesystem layout for the OS or
+        ``None``, if there is no classifier for the OS.
+    """
+
+    return _FS_LAYOUTS_BY_OS_NAME.get( facts.os_name )
+
+
+def _determine_os_bit_width( facts ):
+    """
+        Returns the bit width of the OS.
+    """
+
+    import platform
+
+    return 64 if "64bit" in platform.architecture( ) else 32
+
+
+def _determine_app_bit_width( facts ):
+    """
+        Returns the pointer size, in bits, of the running Python.
+    """
+
+    return 64 if sys.maxsize > 2 ** 32 else 32
+
+
+def _determine_user_id( facts ):
+    """
+        Returns the ID of the current user, according to the environment.
+    """
+
+    if "Windows" == facts.fs_layout: return _envvars.get( "UserName" )
+    return _envvars.get( "USER" )
+
+
+def _determine_user_home( facts ):
+    """
+        Returns the path to the home directory of the current user or
+        ``None``, if it cannot be determined.
+    """
+
+    if "Windows" == facts.fs_layout: return _envvars.get( "UserProfile" )
+    user_home_path = _expand_user_path( "~" )
+    if "~" == user_home_path: return None
+    return user_home_path
+
+
+def _determine_user_uid( facts ):
+    """
+        Returns the numeric ID of the current user or ``None``, if the OS
+        does not have numeric user IDs.
+    """
+
+    getuid = getattr( os, "getuid", None )
+    if None is getuid: return None
+    return getuid( )
+
+
+def _determine_system_runtime_dir( facts ):
+    """
+        Returns the path to the runtime directory, which the system provides
+        for the current user, or ``None``, if there is none. As required by
+        the XDG Base Directory Specification, the directory must be owned by
+        the user and be accessible to the user only. A symbolic link is not
+        accepted.
+    """
+
+    if "POSIX" != facts.fs_layout: return None
+    user_uid = facts.user_uid
+    if None is user_uid: return None
+    path = _SYSTEM_RUNTIME_DIR_FORMAT.format( user_uid )
+    if not is_private_directory( path, user_uid ): return None
+    return path
+
+
+def is_private_directory( path, user_uid ):
+    """
+        Tests whether a path is a directory, which is owned by the user with
+        the given numeric ID and is accessible to that user only. A symbolic
+        link is not accepted, even if it points to such a directory.
+    """
+
+    try: stats = os.lstat( path )
+    except OSError: return False
+    if not stat.S_ISDIR( stats.st_mode ): return False
+    if user_uid != stats.st_uid: return False
+    return 0o700 == stat.S_IMODE( stats.st_mode )
+
+
+def _determine_user_base( facts ):
+    """
+        Returns the user base directory, specified by :pep:`370`.
+    """
+
+    import site
+
+    return getattr( site, "USER_BASE", None )
+
+
+def _determine_user_site( facts ):
+    """
+        Returns the user site packages directory, specified by :pep:`370`.
+    """
+
+    import site
+
+    return getattr( site, "USER_SITE", None )
+
+
+def _determine_python_prefix( facts ):
+    """
+        Returns the installation root path of the running Python.
+    """
+
+    return sys.prefix
+
+
+def _determine_python_prefix_truncated( facts ):
+    """
+        Returns the installation root path of the running Python with the
+        path components of a MacOS X framework installation truncated.
+    """
+
+    return truncated_framework_path( facts.python_prefix )
+
+
+def truncated_framework_path( path ):
+    """
+        If the path is for a MacOS X framework installation of Python, then
+        returns the path with the components associated with the framework
+        truncated. Else, returns the path without alteration.
+    """
+
+    import re
+
+    if re.match( r".*/Python\.framework/Versions/.*", path ):
+        for i in range( 4 ): path = _dirname_of_path( path )
+    return path
+
+
+class PlatformFacts( object ):
+    """
+        Snapshot of the facts about the OS platform and the Python
+        installation upon which standard path calculations depend.
+
+        Each fact is determined upon first access to it and is then retained
+        until :py:meth:`refresh` is called. Facts may also be supplied to the
+        initializer, in which case they are never determined.
+
+        The available facts are:
+
+        .. csv-table::
+           :header: "Name", "Description"
+           :widths: 30, 70
+
+           "os_name", "name of the OS, such as ``Linux``"
+           "fs_layout", "classification of the filesystem layout"
+           "os_bit_width", "bit width of the OS"
+           "app_bit_width", "pointer size, in bits, of the running Python"
+           "user_id", "ID of the current user"
+           "user_home", "path to the home directory of the current user"
+           "user_uid", "numeric ID of the current user"
+           "system_runtime_dir", "path to the runtime directory, such as
+           ``/run/user/1000``, which the system provides for the current user"
+           "user_base", "user base directory from :pep:`370`"
+           "user_site", "user site packages directory from :pep:`370`"
+           "python_prefix", "installation root path of the running Python"
+           "python_prefix_truncated", "installation root path with any
+           MacOS X framework components truncated"
+    """
+
+
+    _determiners = \
+    {
+        "os_name":                  _determine_os_name,
+        "fs_layout":                _determine_fs_layout,
+        "os_bit_width":             _determine_os_bit_width,
+        "app_bit_width":            _determine_app_bit_width,
+        "user_id":                  _determine_user_id,
+        "user_home":                _determine_user_home,
+        "user_uid":                 _determine_user_uid,
+        "system_runtime_dir":       _determine_system_runtime_dir,
+        "user_base":                _determine_user_base,
+        "user_site":                _determine_user_site,
+        "python_prefix":            _determine_python_prefix,
+        "python_prefix_truncated":  _determine_python_prefix_truncated,
+    }
+
+    __slots__ = ( "_facts", "_supplied_facts", )
+
+
+    def __init__( self, **facts ):
+        """
+            :param **facts: Zero or more facts to use instead of determining
+                            them from the OS platform.
+
+            :raises: :py:exc:`TypeError <CPython3:TypeError>`, if an unknown
+                     fact is supplied.
+        """
+
+        for name in facts:
+            if name not in self._determiners:
+                raise TypeError(
+                    "Unknown platform fact '{0}'.".format( name )
+                )
+        self._supplied_facts    = dict( facts )
+        self._facts             = dict( facts )
+
+
+    def __getattr__( self, name ):
+        """
+            Determines a fact upon first access to it.
+        """
+
+        try:
+            determiner = self._determiners[ name ]
+        except KeyError:
+            raise AttributeError( name )
+        facts = self._facts
+        try:
+            return facts[ name ]
+        except KeyError:
+            value = facts[ name ] = determiner( self )
+            return value
+
+
+    def __repr__( self ):
+        """
+            Returns a string which can be used by :py:func:`eval
+            <CPython3:eval>` to create an instance of the class, having the
+            same supplied facts as the current instance.
+        """
+
+        return "PlatformFacts( {0} )".format(
+            ", ".join( [
+                "{0} = {1!r}".format( k, self._supplied_facts[ k ] )
+                for k in sorted( self._supplied_facts )
+            ] )
+        )
+
+
+    def refresh( self ):
+        """
+            Discards all determined facts, so that they will be determined
+            again upon next access. Supplied facts are retained.
+        """
+
+        self._facts = dict( self._supplied_facts )
+
+
+    def with_facts( self, **facts ):
+        """
+            Returns a new snapshot with the given facts supplied in addition
+            to the facts supplied to this one.
+        """
+
+        supplied_facts = dict( self._supplied_facts )
+        supplied_facts.update( facts )
+        return self.__class__( **supplied_facts )
+
+
+#: Snapshot of the facts about the current OS platform.
+_platform_facts = None
+
+
+def get_platform_facts( ):
+    """
+        Returns the snapshot of the facts about the current OS platform,
+        which is shared by all standard path calculations in the process.
+
+        :rtype: :py:class:`PlatformFacts`
+    """
+
+    global _platform_facts  # pylint: disable=W0603
+
+    if None is _platform_facts: _platform_facts = PlatformFacts( )
+    return _platform_facts
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
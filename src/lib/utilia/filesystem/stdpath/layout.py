@@ -0,0 +1,233 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides the creation of the standard directory layouts of many software
+    products in a single operation.
+
+    The directories of all of the layouts are gathered together first, so that
+    a directory shared by several layouts is examined and created only once.
+    The missing directories are then found by walking up from the deepest
+    ones, one level at a time, and created by walking back down, one level at
+    a time. The directories of each level are handled in parallel, which
+    hides the latency of network filesystems.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+import os
+import errno
+import threading
+from os.path import (
+    dirname                 as _parent_path,
+    isdir                   as _is_directory,
+    normpath                as _normalize_path,
+)
+
+from utilia.compat.collections import ( # pylint: disable=E0611
+    Mapping,
+    namedtuple,
+)
+
+
+#: Kinds of standard paths, which are created by default.
+DEFAULT_LAYOUT_KINDS = (
+    "user_config", "user_resources", "temp", "saved_data", "runtime",
+)
+
+#: Kinds of standard paths, whose directories are private to their owner.
+PRIVATE_LAYOUT_KINDS = frozenset( [ "runtime" ] )
+
+#: Mode with which the directories of private kinds are created, as required
+#: of the runtime directory by the XDG Base Directory Specification.
+PRIVATE_MODE = 0o700
+
+
+#: Record of the outcome of creating standard layouts.
+#: ``created`` lists the directories which were created, parents first.
+#: ``existing`` lists the requested directories which already existed.
+#: ``failed`` lists pairs of a directory, or a context whose paths could not
+#: be calculated, and the exception which occurred.
+LayoutReport = namedtuple( "LayoutReport", "created existing failed" )
+
+
+def _map_in_parallel( function, items, max_workers ):
+    """
+        Returns the results of applying a function to each of the items, in
+        order, using up to the given number of threads. An exception raised
+        by the function is returned as its result.
+    """
+
+    items = list( items )
+    results = [ None ] * len( items )
+    positions = iter( range( len( items ) ) )
+    lock = threading.Lock( )
+
+    def work( ):
+        while True:
+            with lock:
+                try: position = next( positions )
+                except StopIteration: return
+            try: results[ position ] = function( items[ position ] )
+            except Exception as exc: # pylint: disable=W0703
+                results[ position ] = exc
+
+    worker_count = min( max_workers, len( items ) )
+    if 1 >= worker_count:
+        work( )
+        return results
+    workers = [
+        threading.Thread( target = work ) for _ in range( worker_count )
+    ]
+    for worker in workers: worker.start( )
+    for worker in workers: worker.join( )
+    return results
+
+
+def _make_directory( path, mode ):
+    """
+        Creates a directory. Returns ``True``, if the directory was created,
+        or ``False``, if it already existed.
+    """
+
+    try:
+        os.mkdir( path, mode )
+    except OSError as exc:
+        if errno.EEXIST == exc.errno and _is_directory( path ): return False
+        raise
+    return True
+
+
+def materialize_layouts(
+    contexts,
+    kinds = DEFAULT_LAYOUT_KINDS, fs_layout = None,
+    max_workers = 8, mode = 0o777
+):
+    """
+        Creates all of the missing directories of the standard layouts for
+        one or many software products.
+
+        :param contexts: a standard path context or an iterable of them, as
+                         accepted by the ``StandardPath`` class of the
+                         :py:func:`platform back-end <get_platform_backend>`
+        :param kinds: names of the kinds of standard paths to create, as in
+                      the fields of the ``StandardPaths`` record returned by
+                      ``StandardPath.resolve_all``
+        :param fs_layout: filesystem layout classification of the platform
+                          back-end; if ``None``, then the classification for
+                          the current OS platform is used
+        :param max_workers: maximum number of threads to use
+        :param mode: mode with which to create directories, as for
+                     :py:func:`os.mkdir <CPython3:os.mkdir>`; directories
+                     of the kinds in :py:data:`PRIVATE_LAYOUT_KINDS` are
+                     created with :py:data:`PRIVATE_MODE` instead
+        :rtype: :py:class:`LayoutReport`
+    """
+
+    from . import get_platform_backend
+    from ._INTERNAL_ import UndeterminedPathError
+
+    if isinstance( contexts, Mapping ): contexts = [ contexts ]
+
+    standard_path = get_platform_backend( fs_layout ).StandardPath( )
+    failed = [ ]
+    targets = set( )
+    private_targets = set( )
+    for context in contexts:
+        context = standard_path._find_context( context )
+        try:
+            paths = [
+                [
+                    kind,
+                    getattr( standard_path, "whereis_" + kind )( context )
+                ]
+                for kind in kinds
+            ]
+        except UndeterminedPathError as exc:
+            failed.append( ( context, exc ) )
+            continue
+        for kind, path in paths:
+            if not path: continue
+            path = _normalize_path( path )
+            targets.add( path )
+            if kind in PRIVATE_LAYOUT_KINDS: private_targets.add( path )
+
+    # Walk up from the requested directories, one level at a time, until an
+    # existing ancestor is found for each of them. Shared parents are
+    # examined only once.
+    existing = [ ]
+    missing = [ ]
+    examined = set( targets )
+    candidates = sorted( targets )
+    while candidates:
+        exist_flags = _map_in_parallel(
+            _is_directory, candidates, max_workers
+        )
+        parents = [ ]
+        for path, exists in zip( candidates, exist_flags ):
+            if exists:
+                if path in targets: existing.append( path )
+                continue
+            missing.append( path )
+            parent = _parent_path( path )
+            if parent and (parent != path) and (parent not in examined):
+                examined.add( parent )
+                parents.append( parent )
+        candidates = parents
+
+    # Create the missing directories, parents before children, in parallel
+    # within each level.
+    created = [ ]
+    blocked = set( )
+    levels = { }
+    for path in missing:
+        levels.setdefault( path.count( os.sep ), [ ] ).append( path )
+    for depth in sorted( levels ):
+        level = [
+            path for path in sorted( levels[ depth ] )
+            if _parent_path( path ) not in blocked
+        ]
+        blocked.update( set( levels[ depth ] ) - set( level ) )
+        outcomes = _map_in_parallel(
+            lambda path: _make_directory(
+                path, PRIVATE_MODE if path in private_targets else mode
+            ),
+            level, max_workers
+        )
+        for path, outcome in zip( level, outcomes ):
+            if isinstance( outcome, Exception ):
+                failed.append( ( path, outcome ) )
+                blocked.add( path )
+            elif outcome: created.append( path )
+            elif path in targets: existing.append( path )
+
+    return LayoutReport( created, sorted( existing ), failed )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
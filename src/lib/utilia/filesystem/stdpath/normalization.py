@@ -0,0 +1,184 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides the normalization of the names of software products, their
+    vendors, and their versions into path fragments, according to the rules
+    of a filesystem layout.
+
+    The rules by filesystem layout classification are as follows:
+
+    .. csv-table::
+       :header: "Classification", "Rules"
+       :widths: 20, 80
+
+       "POSIX",     "Surrounding whitespace is stripped. Runs of whitespace
+       are converted to underscores, to facilitate command-line navigation."
+       "MacOS X",   "Surrounding whitespace is stripped."
+       "Windows",   "Surrounding whitespace is stripped."
+
+    Names tend to recur, so each normalizer remembers a bounded number of the
+    names which it has already normalized.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+from utilia.types.maps import (
+    LRUDict,
+)
+
+
+#: Pattern matching runs of whitespace.
+#: (Compiled upon first use, so that importing this module is cheap.)
+_whitespace_pattern = None
+
+
+def _compile_whitespace_pattern( ):
+    """
+        Returns the pattern matching runs of whitespace, compiling it if
+        necessary.
+    """
+
+    global _whitespace_pattern  # pylint: disable=W0603
+
+    if None is _whitespace_pattern:
+        import re
+        _whitespace_pattern = re.compile( r"\s+" )
+    return _whitespace_pattern
+
+
+class NameNormalizer( object ):
+    """
+        Callable, which normalizes a name into a path fragment and remembers
+        the result.
+
+        Once the memo holds the maximum number of names, the least recently
+        used name is forgotten for each new one, so that recurring names stay
+        remembered. The memo is safe to use from multiple threads.
+    """
+
+
+    __slots__ = ( "_strip", "_whitespace_to_underscore", "_maxsize", "_memo", )
+
+
+    def __init__(
+        self, strip = True, whitespace_to_underscore = False, maxsize = 4096
+    ):
+        """
+            :param strip: If ``True``, strip surrounding whitespace.
+            :param whitespace_to_underscore: If ``True``, convert runs of
+                                             whitespace to underscores.
+            :param maxsize: maximum number of normalized names to remember
+
+            :raises: :py:exc:`ValueError <CPython3:ValueError>`, if the
+                     maximum number is not positive.
+        """
+
+        self._strip                     = strip
+        self._whitespace_to_underscore  = whitespace_to_underscore
+        self._maxsize                   = maxsize
+        self._memo                      = LRUDict( maxsize )
+
+
+    def __repr__( self ):
+        """
+            Returns a string which can be used by :py:func:`eval
+            <CPython3:eval>` to create an equivalent normalizer.
+        """
+
+        return (
+            "NameNormalizer( strip = {0!r}, whitespace_to_underscore = {1!r}, "
+            "maxsize = {2!r} )"
+        ).format(
+            self._strip, self._whitespace_to_underscore, self._maxsize
+        )
+
+
+    def __call__( self, name ):
+        """
+            Returns the normalized name.
+
+            :param name: name to normalize
+            :type name: :py:class:`string <CPython3:str>`
+        """
+
+        memo = self._memo
+        try:
+            return memo[ name ]
+        except KeyError: pass
+
+        normalized_name = name
+        if self._strip:
+            normalized_name = normalized_name.strip( )
+        if self._whitespace_to_underscore:
+            normalized_name = \
+            _compile_whitespace_pattern( ).sub( "_", normalized_name )
+
+        memo[ name ] = normalized_name
+        return normalized_name
+
+
+    def clear( self ):
+        """
+            Forgets all of the remembered names.
+        """
+
+        self._memo.clear( )
+
+
+#: Shared normalizers, by filesystem layout classification and by whether
+#: surrounding whitespace is stripped.
+_normalizers = dict( [
+    [   ( fsl, strip ),
+        NameNormalizer(
+            strip = strip, whitespace_to_underscore = ("POSIX" == fsl)
+        )
+    ]
+    for fsl in [ "POSIX", "MacOS X", "Windows", ]
+    for strip in [ True, False, ]
+] )
+
+
+def get_name_normalizer( fs_layout, strip = True ):
+    """
+        Returns the shared normalizer for a filesystem layout classification,
+        or ``None``, if there are no rules for it.
+
+        :param fs_layout: filesystem layout classification, as returned by
+                          :py:func:`which_fs_layout
+                          <utilia.filesystem.stdpath.which_fs_layout>`
+        :param strip: If ``False``, the normalizer will not strip surrounding
+                      whitespace.
+        :rtype: :py:class:`NameNormalizer`
+    """
+
+    return _normalizers.get( ( fs_layout, strip ) )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
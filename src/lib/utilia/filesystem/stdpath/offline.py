@@ -0,0 +1,277 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides the calculation of standard paths for an OS platform other than
+    the current one.
+
+    The calculations use the platform back-end for a given filesystem layout
+    classification, a simulated environment, and simulated facts about the
+    OS platform. Nothing about the current OS platform is consulted, except
+    for the default of the ``Python_version`` context option, which should be
+    supplied for Pythonic calculations. The Python installation root path
+    must be supplied, either as the ``python_prefix`` fact or as the
+    ``Python_prefix_path`` context option, for Pythonic calculations of
+    common paths.
+    Paths are manipulated with the path functions of the target OS platform,
+    so that, for example, Windows paths can be calculated on Linux.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+from utilia.compat.collections import ( # pylint: disable=E0611
+    Mapping,
+)
+from .facts import (
+    PlatformFacts,
+    truncated_framework_path,
+)
+
+
+#: Typical OS names by filesystem layout classification.
+_OS_NAMES_BY_FS_LAYOUT = \
+{
+    "POSIX":    "Linux",
+    "MacOS X":  "Darwin",
+    "Windows":  "Windows",
+}
+
+
+def offline_platform_facts(
+    fs_layout, environment = None, python_version = None, **facts
+):
+    """
+        Returns a snapshot of simulated facts about an OS platform. Every
+        fact is supplied, so none is ever determined from the current OS
+        platform.
+
+        Facts which are not given are derived from the simulated environment,
+        where possible, as follows:
+
+        .. csv-table::
+           :header: "Name", "POSIX and MacOS X", "Windows"
+           :widths: 30, 35, 35
+
+           "user_id", "``$USER``", "``%UserName%``"
+           "user_home", "``$HOME``", "``%UserProfile%``"
+           "user_base", "``$HOME/.local``", "``%APPDATA%\\Python``"
+           "user_site", "``<user_base>/lib/pythonX.Y/site-packages``",
+           "``<user_base>\\PythonXY\\site-packages``"
+           "python_prefix_truncated", "``<python_prefix>``, truncated on
+           MacOS X", "``<python_prefix>``"
+
+        The user site packages directory is derived only, if a Python version
+        is given. The bit widths are assumed to be 64 and all other facts are
+        ``None``.
+
+        :param fs_layout: filesystem layout classification of the target OS
+                          platform
+        :param environment: mapping of simulated environment variables
+        :param python_version: version of the simulated Python, such as
+                               ``3.11``, from which to derive the user site
+                               packages directory
+        :param **facts: facts to supply, as for :py:class:`PlatformFacts
+                        <utilia.filesystem.stdpath.facts.PlatformFacts>`
+        :rtype: :py:class:`PlatformFacts
+                <utilia.filesystem.stdpath.facts.PlatformFacts>`
+        :raises: :py:class:`UnsupportedFilesystemLayout
+                 <utilia.filesystem.stdpath.UnsupportedFilesystemLayout>`, if
+                 the filesystem layout is unknown.
+    """
+
+    if fs_layout not in _OS_NAMES_BY_FS_LAYOUT:
+        from . import UnsupportedFilesystemLayout
+        raise UnsupportedFilesystemLayout(
+            "Unimplemented path determination logic for {0}.", fs_layout
+        )
+    if None is environment: environment = { }
+
+    if "Windows" == fs_layout:
+        import ntpath as path_flavor
+        user_id     = environment.get( "UserName" )
+        user_home   = \
+        facts.get( "user_home", environment.get( "UserProfile" ) )
+        user_base   = environment.get( "APPDATA" )
+        if user_base: user_base = path_flavor.join( user_base, "Python" )
+    else:
+        import posixpath as path_flavor
+        user_id     = environment.get( "USER" )
+        user_home   = facts.get( "user_home", environment.get( "HOME" ) )
+        user_base   = user_home
+        if user_base: user_base = path_flavor.join( user_base, ".local" )
+    user_base = facts.get( "user_base", user_base )
+
+    user_site = None
+    if user_base and python_version:
+        if "Windows" == fs_layout:
+            user_site = path_flavor.join(
+                user_base,
+                "Python" + python_version.replace( ".", "" ),
+                "site-packages"
+            )
+        else:
+            user_site = path_flavor.join(
+                user_base, "lib", "python" + python_version, "site-packages"
+            )
+
+    python_prefix_truncated = facts.get( "python_prefix" )
+    if python_prefix_truncated and "MacOS X" == fs_layout:
+        python_prefix_truncated = \
+        truncated_framework_path( python_prefix_truncated )
+
+    supplied_facts = dict( [
+        [ name, None ] for name in PlatformFacts._determiners
+    ] )
+    supplied_facts.update( dict(
+        os_name         = _OS_NAMES_BY_FS_LAYOUT[ fs_layout ],
+        fs_layout       = fs_layout,
+        os_bit_width    = 64,
+        app_bit_width   = 64,
+        user_id         = user_id,
+        user_home       = user_home,
+        user_base       = user_base,
+        user_site       = user_site,
+        python_prefix_truncated = python_prefix_truncated,
+    ) )
+    supplied_facts.update( facts )
+    return PlatformFacts( **supplied_facts )
+
+
+def make_offline_standard_path(
+    fs_layout, context, environment = None, python_version = None, **facts
+):
+    """
+        Returns a standard path object for a target OS platform, which
+        calculates paths from a simulated environment and simulated facts.
+
+        :param fs_layout: filesystem layout classification of the target OS
+                          platform
+        :param context: standard path context for the back-end of the target
+                        OS platform, or a mapping of options from which to
+                        create one; the current context of the back-end is
+                        never used, since it belongs to the current OS
+                        platform
+        :param environment: mapping of simulated environment variables
+        :param python_version: version of the simulated Python, as for
+                               :py:func:`offline_platform_facts`; also the
+                               default ``Python_version`` option of contexts
+                               created from mappings of options
+        :param **facts: facts to supply, as for
+                        :py:func:`offline_platform_facts`
+        :raises: :py:exc:`ValueError <CPython3:ValueError>`, if no context is
+                 given.
+    """
+
+    from . import get_platform_backend
+
+    if None is context:
+        raise ValueError( "Offline calculations require a context." )
+    backend = get_platform_backend( fs_layout )
+    return _make_offline_standard_path(
+        backend, fs_layout, _make_context( backend, context, python_version ),
+        environment, python_version, facts
+    )
+
+
+def compute_standard_paths(
+    fs_layout, contexts, environment = None, python_version = None, **facts
+):
+    """
+        Returns all of the standard paths for each of many software products
+        on a target OS platform, calculated from a simulated environment and
+        simulated facts.
+
+        :param fs_layout: filesystem layout classification of the target OS
+                          platform
+        :param contexts: iterable of standard path contexts for the back-end
+                         of the target OS platform or of mappings of options
+                         from which to create them
+        :param environment: mapping of simulated environment variables
+        :param python_version: version of the simulated Python, as for
+                               :py:func:`offline_platform_facts`; also the
+                               default ``Python_version`` option of contexts
+                               created from mappings of options
+        :param **facts: facts to supply, as for
+                        :py:func:`offline_platform_facts`
+        :returns: list of ``StandardPaths`` records, one per context
+        :raises: :py:exc:`ValueError <CPython3:ValueError>`, if one of the
+                 contexts is ``None``.
+    """
+
+    from . import get_platform_backend
+
+    backend = get_platform_backend( fs_layout )
+    contexts = [
+        _make_context( backend, context, python_version )
+        for context in contexts
+    ]
+    if any( [ None is context for context in contexts ] ):
+        raise ValueError( "Offline calculations require a context." )
+    standard_path = _make_offline_standard_path(
+        backend, fs_layout, backend.StandardPathContext( ).freeze( ),
+        environment, python_version, facts
+    )
+    return [ standard_path.resolve_all( context ) for context in contexts ]
+
+
+def _make_offline_standard_path(
+    backend, fs_layout, context, environment, python_version, facts
+):
+    """
+        Returns a standard path object of a back-end for a context, which
+        calculates paths from a simulated environment and simulated facts.
+    """
+
+    if None is environment: environment = { }
+    return backend.StandardPath(
+        context,
+        environment = environment,
+        facts = offline_platform_facts(
+            fs_layout, environment, python_version, **facts
+        )
+    )
+
+
+def _make_context( backend, context, python_version = None ):
+    """
+        Returns a context for a back-end, creating one from a mapping of
+        options, if necessary. A context created from a mapping, which has no
+        ``Python_version`` option, is given the Python version, if any.
+    """
+
+    if (None is context) or not isinstance( context, Mapping ): return context
+    if      isinstance( context, backend.StandardPathContext ) \
+        or  isinstance( context, backend.FrozenStandardPathContext ):
+        return context
+    options = dict( context )
+    if python_version: options.setdefault( "Python_version", python_version )
+    return backend.StandardPathContext( **options ).freeze( )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -0,0 +1,318 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides access to the resource files of a software product, as
+    read-only memory-mapped views, without copying their contents.
+
+    A resource is found by its relative name, searching the standard
+    directories for the user resources of the software product first and
+    then those for its common resources. The mapping of a resource is kept
+    open in a bounded pool, so that repeated accesses share it. A mapping is
+    replaced, if the file changes.
+
+    A mapping, which is evicted from the pool while views of it are still in
+    use, cannot be closed yet. It is closed once its views have been released
+    and the pool is next used or closed.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+import os
+import errno
+import mmap
+import threading
+from os.path import (
+    isfile                  as _is_file,
+    join                    as _join_path,
+)
+
+from utilia.compat.collections import ( # pylint: disable=E0611
+    OrderedDict,
+)
+
+
+#: Kinds of standard paths, which are searched for resources, in order.
+DEFAULT_RESOURCE_KINDS = ( "user_resources", "common_resources", )
+
+
+def _split_resource_name( name ):
+    """
+        Returns the components of a relative resource name.
+
+        :raises: :py:exc:`ValueError <CPython3:ValueError>`, if the name is
+                 empty, is absolute, has a drive, contains a colon in one of
+                 its components, or would leave the resource directories.
+    """
+
+    import ntpath
+
+    normalized_name = name.replace( "\\", "/" )
+    components = [
+        component for component in normalized_name.split( "/" )
+        if component not in ( "", ".", )
+    ]
+    if      (not components) or (".." in components) \
+        or  normalized_name.startswith( "/" ) \
+        or  ntpath.splitdrive( name )[ 0 ] \
+        or  [ component for component in components if ":" in component ]:
+        raise ValueError( "Invalid resource name {0!r}.".format( name ) )
+    return components
+
+
+def _file_signature( stats ):
+    """
+        Returns a value, which changes whenever a file is replaced or
+        modified.
+    """
+
+    return ( stats.st_dev, stats.st_ino, stats.st_size, stats.st_mtime )
+
+
+class ResourceLocator( object ):
+    """
+        Finds the resource files of a software product and provides
+        read-only, memory-mapped views of them.
+
+        Individual operations are safe to perform from multiple threads.
+    """
+
+
+    def __init__(
+        self, context = None,
+        kinds = DEFAULT_RESOURCE_KINDS, fs_layout = None, max_open = 16
+    ):
+        """
+            :param context: standard path context for the platform back-end;
+                            if ``None``, then the current context is used
+            :param kinds: names of the kinds of standard paths to search, in
+                          order, as in the fields of the ``StandardPaths``
+                          record returned by ``StandardPath.resolve_all``
+            :param fs_layout: filesystem layout classification of the
+                              platform back-end; if ``None``, then the
+                              classification for the current OS platform is
+                              used
+            :param max_open: maximum number of mappings to keep open
+        """
+
+        if 1 > max_open:
+            raise ValueError(
+                "Maximum number of open mappings must be positive, "
+                "not {0!r}.".format( max_open )
+            )
+        self._context       = context
+        self._kinds         = tuple( kinds )
+        self._fs_layout     = fs_layout
+        self._max_open      = max_open
+        self._directories   = None
+        self._mappings      = OrderedDict( )
+        self._retired       = [ ]
+        self._lock          = threading.RLock( )
+
+
+    def __repr__( self ):
+        """
+            Returns a string representation of the locator.
+        """
+
+        return "ResourceLocator( {0!r}, kinds = {1!r}, max_open = {2!r} )" \
+        "".format( self._context, self._kinds, self._max_open )
+
+
+    def __enter__( self ):
+        """
+            Returns the locator.
+        """
+
+        return self
+
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        """
+            Closes all of the mappings.
+        """
+
+        self.close( )
+        return False
+
+
+    @property
+    def directories( self ):
+        """
+            The directories, which are searched for resources, in order.
+            Kinds of standard paths, which cannot be calculated, are skipped.
+        """
+
+        with self._lock:
+            directories = self._directories
+            if None is directories:
+                directories = self._directories = self._find_directories( )
+            return directories
+
+
+    def _find_directories( self ):
+        """
+            Returns the directories, which are searched for resources.
+        """
+
+        from . import get_platform_backend
+        from ._INTERNAL_ import UndeterminedPathError
+
+        standard_path = \
+        get_platform_backend( self._fs_layout ).StandardPath( )
+        context = standard_path._find_context( self._context )
+        directories = [ ]
+        for kind in self._kinds:
+            try:
+                directory = \
+                getattr( standard_path, "whereis_" + kind )( context )
+            except UndeterminedPathError: continue
+            if directory and directory not in directories:
+                directories.append( directory )
+        return directories
+
+
+    def find( self, name ):
+        """
+            Returns the path to the most preferred file for a relative
+            resource name, such as ``tables/lookup.bin``, or ``None``, if
+            there is no such file.
+
+            :raises: :py:exc:`ValueError <CPython3:ValueError>`, if the name
+                     is empty or would leave the resource directories.
+        """
+
+        components = _split_resource_name( name )
+        for directory in self.directories:
+            path = _join_path( directory, *components )
+            if _is_file( path ): return path
+        return None
+
+
+    def open( self, name ):
+        """
+            Returns a read-only :py:class:`memoryview
+            <CPython3:memoryview>` of the contents of the most preferred file
+            for a relative resource name. Release the view, when done with
+            it, so that its mapping can be closed upon eviction from the
+            pool.
+
+            :raises: :py:exc:`IOError <CPython3:IOError>`, with an error
+                     number of ``ENOENT``, if there is no such file.
+            :raises: :py:exc:`ValueError <CPython3:ValueError>`, if the name
+                     is empty or would leave the resource directories.
+        """
+
+        path = self.find( name )
+        if None is path:
+            raise IOError(
+                errno.ENOENT, "No resource named {0!r}.".format( name ), name
+            )
+        return memoryview( self._map_file( path ) )
+
+
+    def _map_file( self, path ):
+        """
+            Returns an open mapping of a file, from the pool, if it is still
+            current, or else a new mapping, which is added to the pool.
+        """
+
+        with open( path, "rb" ) as resource_file:
+            signature = _file_signature( os.fstat( resource_file.fileno( ) ) )
+            with self._lock:
+                self._close_retired( )
+                entry = self._mappings.pop( path, None )
+                if None is not entry:
+                    if signature == entry[ 0 ]:
+                        self._mappings[ path ] = entry
+                        return entry[ 1 ]
+                    self._retire( entry[ 1 ] )
+                if 0 == signature[ 2 ]:
+                    # Note: Empty files cannot be mapped.
+                    mapping = b""
+                else:
+                    mapping = mmap.mmap(
+                        resource_file.fileno( ), 0,
+                        access = mmap.ACCESS_READ
+                    )
+                self._mappings[ path ] = ( signature, mapping )
+                while len( self._mappings ) > self._max_open:
+                    evicted_entry = self._mappings.popitem( last = False )
+                    self._retire( evicted_entry[ 1 ][ 1 ] )
+                return mapping
+
+
+    def _retire( self, mapping ):
+        """
+            Schedules a mapping to be closed. Must be called with the lock
+            held.
+        """
+
+        if isinstance( mapping, mmap.mmap ): self._retired.append( mapping )
+
+
+    def _close_retired( self ):
+        """
+            Closes the retired mappings, which have no views in use. Must be
+            called with the lock held.
+        """
+
+        still_in_use = [ ]
+        for mapping in self._retired:
+            try: mapping.close( )
+            except BufferError: still_in_use.append( mapping )
+        self._retired = still_in_use
+
+
+    def invalidate( self ):
+        """
+            Discards the searched directories, so that they are calculated
+            anew upon the next lookup, and retires all of the mappings.
+        """
+
+        with self._lock:
+            self._directories = None
+            self.close( )
+
+
+    def close( self ):
+        """
+            Closes all of the mappings, which have no views in use. The
+            others are closed by a later call, once their views have been
+            released.
+        """
+
+        with self._lock:
+            for signature, mapping in self._mappings.values( ):
+                self._retire( mapping )
+            self._mappings.clear( )
+            self._close_retired( )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
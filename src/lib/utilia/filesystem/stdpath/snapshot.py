@@ -0,0 +1,418 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides snapshots of resolved standard paths, which are written once,
+    such as at install time, and read at startup instead of calculating the
+    paths anew.
+
+    A snapshot is a small JSON file, which may be placed next to the package
+    of the software product or in the directory given by
+    :py:func:`whereis_my_common_config
+    <utilia.filesystem.stdpath.whereis_my_common_config>`. It records all of
+    the standard paths for one context, along with a fingerprint of what the
+    paths were calculated from: the environment variables which the
+    calculations read, the variables which identify the user and locate the
+    home directory, the Python installation prefix and version, and the
+    platform. Checking the fingerprint at startup only involves
+    reading these values, so it is far cheaper than the calculations. If the
+    fingerprint no longer matches, then the snapshot is stale and the paths
+    are calculated as usual.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+import os
+import sys
+
+
+#: Version of the snapshot file format.
+SNAPSHOT_FORMAT_VERSION = 1
+
+#: Environment variables, which identify the user and locate the home
+#: directory.
+_USER_VARIABLE_NAMES = (
+    "HOME", "USER", "LOGNAME", "UserProfile", "UserName",
+)
+
+
+def _calculate_fingerprint( environment_variable_names, environment = None ):
+    """
+        Returns a digest of the values from which standard paths are
+        calculated.
+    """
+
+    import json
+    import hashlib
+
+    if None is environment: environment = os.environ
+    state = dict(
+        environment = dict( [
+            [ evname, environment.get( evname ) ]
+            for evname in environment_variable_names
+        ] ),
+        prefix      = sys.prefix,
+        version     = list( sys.version_info[ : 2 ] ),
+        platform    = sys.platform,
+    )
+    return hashlib.sha1(
+        json.dumps( state, sort_keys = True ).encode( "utf-8" )
+    ).hexdigest( )
+
+
+class PathSnapshot( object ):
+    """
+        Standard paths for one context, as recorded in a snapshot file.
+    """
+
+
+    def __init__(
+        self, paths, fs_layout, context_options,
+        environment_variable_names, fingerprint
+    ):
+        """
+            :param paths: mapping of the kinds of standard paths to the paths
+            :param fs_layout: filesystem layout classification for which the
+                              paths were calculated
+            :param context_options: mapping of the customized options of the
+                                    context for which the paths were
+                                    calculated
+            :param environment_variable_names: names of the environment
+                                               variables covered by the
+                                               fingerprint
+            :param fingerprint: digest of the values from which the paths were
+                                calculated
+        """
+
+        self.paths                          = dict( paths )
+        self.fs_layout                      = fs_layout
+        self.context_options                = dict( context_options )
+        self.environment_variable_names     = \
+        tuple( environment_variable_names )
+        self.fingerprint                    = fingerprint
+
+
+    def __repr__( self ):
+        """
+            Returns a string representation of the snapshot.
+        """
+
+        return "PathSnapshot( fs_layout = {0!r}, fingerprint = {1!r} )" \
+        "".format( self.fs_layout, self.fingerprint )
+
+
+    def is_fresh( self, environment = None ):
+        """
+            Returns ``True``, if the values from which the paths were
+            calculated are still the same.
+
+            :param environment: mapping of environment variables to check; the
+                                process environment, if ``None``
+        """
+
+        return self.fingerprint == _calculate_fingerprint(
+            self.environment_variable_names, environment
+        )
+
+
+    def to_dict( self ):
+        """
+            Returns a dictionary, which represents the snapshot in the snapshot
+            file format.
+        """
+
+        return dict(
+            format                      = SNAPSHOT_FORMAT_VERSION,
+            fs_layout                   = self.fs_layout,
+            context_options             = self.context_options,
+            environment_variable_names  = list(
+                self.environment_variable_names
+            ),
+            fingerprint                 = self.fingerprint,
+            paths                       = self.paths,
+        )
+
+
+    @classmethod
+    def from_dict( cls, data ):
+        """
+            Returns a snapshot from a dictionary in the snapshot file format.
+
+            :raises: :py:exc:`ValueError <CPython3:ValueError>`, if the
+                     dictionary is not in a supported format.
+        """
+
+        if SNAPSHOT_FORMAT_VERSION != data.get( "format" ):
+            raise ValueError(
+                "Unsupported snapshot format {0!r}.".format(
+                    data.get( "format" )
+                )
+            )
+        try:
+            return cls(
+                data[ "paths" ], data[ "fs_layout" ],
+                data[ "context_options" ],
+                data[ "environment_variable_names" ], data[ "fingerprint" ]
+            )
+        except KeyError as exc:
+            raise ValueError(
+                "Missing snapshot field {0!r}.".format( exc.args[ 0 ] )
+            )
+
+
+def take_path_snapshot( context = None, fs_layout = None ):
+    """
+        Calculates all of the standard paths for a context and returns a
+        snapshot of them.
+
+        :param context: standard path context for the platform back-end; if
+                        ``None``, then the current context is used
+        :param fs_layout: filesystem layout classification; if ``None``, then
+                          the classification for the current OS platform is
+                          used
+        :rtype: :py:class:`PathSnapshot`
+    """
+
+    from . import get_platform_backend, which_fs_layout
+
+    if None is fs_layout: fs_layout = which_fs_layout( )
+    standard_path = get_platform_backend( fs_layout ).StandardPath( context )
+    if None is context: context = standard_path._find_context( None )
+    environment_variable_names = tuple( sorted( set(
+        standard_path._environment_variable_names + _USER_VARIABLE_NAMES
+    ) ) )
+    return PathSnapshot(
+        standard_path.resolve_all( context )._asdict( ),
+        fs_layout, dict( context ), environment_variable_names,
+        _calculate_fingerprint( environment_variable_names )
+    )
+
+
+def write_path_snapshot( snapshot_path, context = None, fs_layout = None ):
+    """
+        Calculates all of the standard paths for a context and writes a
+        snapshot of them to a file. The file is replaced atomically.
+
+        :param snapshot_path: path to the snapshot file
+        :param context: standard path context for the platform back-end; if
+                        ``None``, then the current context is used
+        :param fs_layout: filesystem layout classification; if ``None``, then
+                          the classification for the current OS platform is
+                          used
+        :rtype: :py:class:`PathSnapshot`
+    """
+
+    import json
+    import tempfile
+
+    snapshot = take_path_snapshot( context, fs_layout )
+    fd, temp_path = tempfile.mkstemp(
+        prefix = ".snapshot", suffix = ".tmp",
+        dir = os.path.dirname( os.path.abspath( snapshot_path ) )
+    )
+    try:
+        with os.fdopen( fd, "w" ) as temp_file:
+            json.dump( snapshot.to_dict( ), temp_file, sort_keys = True )
+        getattr( os, "replace", os.rename )( temp_path, snapshot_path )
+    except BaseException:
+        os.remove( temp_path )
+        raise
+    return snapshot
+
+
+def read_path_snapshot( snapshot_path ):
+    """
+        Returns the snapshot from a file or ``None``, if the file does not
+        exist or cannot be read as a snapshot.
+
+        :param snapshot_path: path to the snapshot file
+        :rtype: :py:class:`PathSnapshot`
+    """
+
+    import json
+
+    try:
+        with open( snapshot_path, "r" ) as snapshot_file:
+            return PathSnapshot.from_dict( json.load( snapshot_file ) )
+    except ( IOError, OSError, ValueError, TypeError, AttributeError ):
+        return None
+
+
+class SnapshotStandardPath( object ):
+    """
+        Standard path object, which answers from a snapshot, if the
+        snapshot is fresh and the context is the recorded one, and otherwise
+        calculates paths with a standard path object of the platform
+        back-end.
+
+        When no context is given, the current context of the back-end is
+        used, just as by the standard path object itself. Paths are
+        answered from the snapshot only while the current context has the
+        recorded options.
+    """
+
+
+    def __init__( self, snapshot, standard_path = None ):
+        """
+            :param snapshot: the snapshot, or ``None``
+            :type snapshot: :py:class:`PathSnapshot`
+            :param standard_path: standard path object, with which to
+                                  calculate paths; if ``None``, then one is
+                                  created for the back-end of the recorded
+                                  filesystem layout upon first need
+        """
+
+        self._recorded_snapshot = snapshot
+        if None is not snapshot and not snapshot.is_fresh( ): snapshot = None
+        self._snapshot          = snapshot
+        self._standard_path     = standard_path
+        self._recorded_context  = None
+
+
+    def __repr__( self ):
+        """
+            Returns a string representation of the object.
+        """
+
+        return "SnapshotStandardPath( {0!r} )".format( self._snapshot )
+
+
+    def __getattr__( self, name ):
+        """
+            Returns the attribute of the standard path object. The path
+            calculation methods are answered from the snapshot, if possible.
+        """
+
+        if name.startswith( "whereis_" ):
+            path_type = name[ len( "whereis_" ) : ]
+            snapshot = self._snapshot
+            if None is not snapshot and path_type in snapshot.paths:
+                return self._make_snapshot_method( name, path_type )
+        return getattr( self.standard_path, name )
+
+
+    @property
+    def is_from_snapshot( self ):
+        """
+            ``True``, if the paths for the current context are answered from
+            a fresh snapshot.
+        """
+
+        return self._is_recorded_context( None )
+
+
+    @property
+    def standard_path( self ):
+        """
+            The standard path object, with which paths are calculated.
+        """
+
+        standard_path = self._standard_path
+        if None is standard_path:
+            from . import get_platform_backend
+            snapshot = self._recorded_snapshot
+            fs_layout = None
+            if None is not snapshot: fs_layout = snapshot.fs_layout
+            standard_path = get_platform_backend( fs_layout ).StandardPath( )
+            self._standard_path = standard_path
+        return standard_path
+
+
+    def resolve_all( self, context = None ):
+        """
+            Returns all of the standard paths, from the snapshot, if
+            possible.
+        """
+
+        if self._is_recorded_context( context ):
+            from ._INTERNAL_ import StandardPaths
+            paths = self._snapshot.paths
+            return StandardPaths( **dict( [
+                [ path_type, paths.get( path_type ) ]
+                for path_type in StandardPaths._fields
+            ] ) )
+        return self.standard_path.resolve_all( context )
+
+
+    def _is_recorded_context( self, context ):
+        """
+            Tests whether the snapshot is fresh and a context, or the current
+            one, if ``None``, has the recorded options.
+        """
+
+        from ._INTERNAL_ import StandardPathContext_BASE
+
+        snapshot = self._snapshot
+        if None is snapshot: return False
+        standard_path = self.standard_path
+        recorded_context = self._recorded_context
+        if None is recorded_context:
+            from . import get_platform_backend
+            backend = get_platform_backend( snapshot.fs_layout )
+            recorded_context = self._recorded_context = \
+            backend.StandardPathContext( **snapshot.context_options ).freeze( )
+        context = standard_path._find_context( context )
+        if isinstance( context, StandardPathContext_BASE ):
+            context = context.freeze( )
+        return recorded_context == context
+
+
+    def _make_snapshot_method( self, name, path_type ):
+        """
+            Returns a function which answers a path calculation method from
+            the snapshot, when the context is the recorded one.
+        """
+
+        path = self._snapshot.paths[ path_type ]
+
+        def whereis( context = None ):
+            """ """
+
+            if self._is_recorded_context( context ): return path
+            return getattr( self.standard_path, name )( context )
+
+        whereis.__name__ = name
+        setattr( self, name, whereis )
+        return whereis
+
+
+def load_standard_path( snapshot_path ):
+    """
+        Returns a standard path object, which answers from the snapshot in a
+        file for the recorded context, if the snapshot exists and is fresh,
+        and otherwise calculates paths as usual.
+
+        :param snapshot_path: path to the snapshot file
+        :rtype: :py:class:`SnapshotStandardPath`
+    """
+
+    return SnapshotStandardPath( read_path_snapshot( snapshot_path ) )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -0,0 +1,233 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides the calculation of the per-user standard paths of a software
+    product for many user accounts at once.
+
+    The user accounts are enumerated in a single pass, either over the
+    system user database or over a ``passwd`` file. The standard paths are
+    calculated only once, for a placeholder home directory, and the home
+    directory of each account is then substituted into them. No per-user
+    lookups, such as :py:func:`os.path.expanduser
+    <CPython3:os.path.expanduser>`, are made.
+
+    The environment of the other users is unknown, so the paths are
+    calculated from an empty environment by default. On POSIX platforms,
+    this means that the defaults of the XDG Base Directory Specification
+    apply. Likewise, the Python user base and user site packages directories
+    of the current user apply to other users only, if they are under the
+    home directory; otherwise, Pythonic per-user paths cannot be determined.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+from utilia.compat.collections import ( # pylint: disable=E0611
+    namedtuple,
+    OrderedDict,
+)
+
+
+#: Record of a user account.
+UserAccount = namedtuple( "UserAccount", "name uid gid home shell" )
+
+#: Kinds of standard paths, which are calculated by default.
+DEFAULT_USER_PATH_KINDS = ( "user_config", "user_resources", "saved_data", )
+
+#: Stands in for the home directory during path calculations.
+_HOME_PLACEHOLDER = "\0HOME\0"
+
+
+def _parse_passwd_line( line ):
+    """
+        Returns the user account from a line of a ``passwd`` file or ``None``,
+        if the line does not describe an account.
+    """
+
+    line = line.rstrip( "\r\n" )
+    if not line or line.startswith( ( "#", "+", "-" ) ): return None
+    fields = line.split( ":" )
+    if 7 != len( fields ): return None
+    try:
+        uid, gid = int( fields[ 2 ] ), int( fields[ 3 ] )
+    except ValueError:
+        return None
+    return UserAccount( fields[ 0 ], uid, gid, fields[ 5 ], fields[ 6 ] )
+
+
+def iter_user_accounts( passwd_path = None, min_uid = None, max_uid = None ):
+    """
+        Returns an iterator over the user accounts, read in a single pass.
+
+        :param passwd_path: path to a file in the format of ``/etc/passwd``;
+                            if ``None``, then the system user database is
+                            enumerated with :py:func:`pwd.getpwall
+                            <CPython3:pwd.getpwall>`
+        :param min_uid: least user ID to include; if ``None``, then there is
+                        no lower bound
+        :param max_uid: greatest user ID to include; if ``None``, then there
+                        is no upper bound
+
+        :raises: :py:class:`UnsupportedFilesystemLayout
+                 <utilia.filesystem.stdpath.UnsupportedFilesystemLayout>`, if
+                 no file is given and the OS platform has no user database.
+    """
+
+    if None is passwd_path:
+        try:
+            import pwd # pylint: disable=F0401
+        except ImportError:
+            from . import UnsupportedFilesystemLayout
+            raise UnsupportedFilesystemLayout(
+                "No user database on this OS platform."
+            )
+        accounts = [
+            UserAccount(
+                entry.pw_name, entry.pw_uid, entry.pw_gid,
+                entry.pw_dir, entry.pw_shell
+            )
+            for entry in pwd.getpwall( )
+        ]
+    else:
+        with open( passwd_path, "r" ) as passwd_file:
+            accounts = [
+                account for account in map( _parse_passwd_line, passwd_file )
+                if None is not account
+            ]
+
+    for account in accounts:
+        if (None is not min_uid) and (account.uid < min_uid): continue
+        if (None is not max_uid) and (account.uid > max_uid): continue
+        yield account
+
+
+def whereis_users_paths(
+    context = None, accounts = None,
+    kinds = DEFAULT_USER_PATH_KINDS, fs_layout = None, environment = None,
+    passwd_path = None, min_uid = None, max_uid = None
+):
+    """
+        Returns the per-user standard paths of the software product, defined
+        in ``context``, for many user accounts.
+
+        :param context: standard path context for the platform back-end; if
+                        ``None``, then the current context is used
+        :param accounts: iterable of :py:class:`UserAccount` records; if
+                         ``None``, then the accounts are enumerated with
+                         :py:func:`iter_user_accounts`, to which the
+                         ``passwd_path``, ``min_uid``, and ``max_uid``
+                         arguments are passed
+        :param kinds: names of the kinds of standard paths to calculate, as
+                      in the fields of the ``StandardPaths`` record returned
+                      by ``StandardPath.resolve_all``
+        :param fs_layout: filesystem layout classification; if ``None``, then
+                          the classification for the current OS platform is
+                          used
+        :param environment: mapping of environment variables, which applies to
+                            all of the users; empty, if ``None``
+        :returns: ordered dictionary from user name to an ordered dictionary
+                  from kind of standard path to path
+    """
+
+    from . import get_platform_backend
+    from .facts import get_platform_facts
+    from ._INTERNAL_ import StandardPathContext_BASE
+
+    if None is accounts:
+        accounts = iter_user_accounts( passwd_path, min_uid, max_uid )
+    if None is environment: environment = { }
+
+    backend = get_platform_backend( fs_layout )
+    facts = get_platform_facts( )
+    standard_path = backend.StandardPath(
+        context, environment = environment,
+        facts = facts.with_facts(
+            user_id             = None,
+            user_home           = _HOME_PLACEHOLDER,
+            user_base           = _template_home_path(
+                facts.user_base, facts.user_home
+            ),
+            user_site           = _template_home_path(
+                facts.user_site, facts.user_home
+            ),
+            user_uid            = None,
+            system_runtime_dir  = None,
+        )
+    )
+
+    context = standard_path._find_context( None )
+    if isinstance( context, StandardPathContext_BASE ):
+        context = context.freeze( )
+    templates = [
+        [ kind, getattr( standard_path, "whereis_" + kind )( context ) ]
+        for kind in kinds
+    ]
+
+    users_paths = OrderedDict( )
+    for account in accounts:
+        home = account.home
+        users_paths[ account.name ] = OrderedDict( [
+            [ kind, _substitute_home( template, home ) ]
+            for kind, template in templates
+        ] )
+    return users_paths
+
+
+def _template_home_path( path, home ):
+    """
+        Returns a path under the home directory of the current user with the
+        home directory replaced by the placeholder for it. Returns ``None``
+        for any other path, since it cannot be known to apply to other users.
+    """
+
+    if not path or not home: return None
+    home = home.rstrip( "/\\" )
+    if path.rstrip( "/\\" ) == home: return _HOME_PLACEHOLDER
+    if not path.startswith( home ) or path[ len( home ) ] not in "/\\":
+        return None
+    return _HOME_PLACEHOLDER + path[ len( home ) : ]
+
+
+def _substitute_home( template, home ):
+    """
+        Returns a path with the placeholder for the home directory replaced
+        by an actual home directory.
+    """
+
+    if not template or not template.startswith( _HOME_PLACEHOLDER ):
+        return template
+    remainder = template[ len( _HOME_PLACEHOLDER ) : ]
+    # Note: A home directory, such as '/', may end with a separator already.
+    separators = ( "/", "\\", )
+    if home.endswith( separators ) and remainder.startswith( separators ):
+        remainder = remainder[ 1 : ]
+    return home + remainder
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -0,0 +1,299 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides the lookup of configuration and data files across the search
+    paths of the XDG Base Directory Specification.
+
+    The search path for a kind of file consists of a user directory followed
+    by the system directories, in order of preference:
+
+    .. csv-table::
+       :header: "Kind", "User Directory", "System Directories"
+       :widths: 10, 45, 45
+
+       "config", "``$XDG_CONFIG_HOME`` or ``~/.config``",
+       "``$XDG_CONFIG_DIRS`` or ``/etc/xdg``"
+       "data", "``$XDG_DATA_HOME`` or ``~/.local/share``",
+       "``$XDG_DATA_DIRS`` or ``/usr/local/share:/usr/share``"
+
+    Rather than probing for a file in each directory, the entries of each
+    directory are listed once and remembered, so that further lookups in the
+    same directory make no system calls.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+import os
+from os.path import (
+    isabs                   as _is_absolute_path,
+    join                    as _join_path,
+    split                   as _split_path,
+)
+try:                from time import perf_counter as _clock
+except ImportError: from time import time as _clock
+
+from .facts import (
+    get_platform_facts,
+)
+
+
+#: Environment variables and defaults for the directories, by kind of file.
+#: Each entry consists of the variable for the user directory, the default
+#: user directory relative to the home directory, the variable for the
+#: system directories, and the default system directories.
+_SEARCH_PATH_SPECS = \
+{
+    "config":   (
+        "XDG_CONFIG_HOME", ".config",
+        "XDG_CONFIG_DIRS", "/etc/xdg",
+    ),
+    "data":     (
+        "XDG_DATA_HOME", ".local/share",
+        "XDG_DATA_DIRS", "/usr/local/share/:/usr/share/",
+    ),
+}
+
+
+if hasattr( os, "scandir" ):
+
+
+    def _list_directory( path ):
+        """
+            Returns the names of the entries in a directory.
+        """
+
+        return frozenset( [ entry.name for entry in os.scandir( path ) ] )
+
+
+else: # Python prior to 3.5.
+
+
+    def _list_directory( path ):
+        """
+            Returns the names of the entries in a directory.
+        """
+
+        return frozenset( os.listdir( path ) )
+
+
+def _directory_mtime( path ):
+    """
+        Returns the modification time of a directory or ``None``, if it does
+        not exist.
+    """
+
+    try:
+        return os.stat( path ).st_mtime
+    except OSError:
+        return None
+
+
+class XDGResolver( object ):
+    """
+        Finds files by their paths relative to the directories of an XDG
+        search path.
+
+        The entries of each directory are listed upon first lookup in it and
+        the listing is reused for later lookups. A listing is refreshed if
+        the modification time of its directory has changed, but the
+        modification time is only checked if the listing is older than a
+        given age. By default, listings are never refreshed and
+        :py:meth:`invalidate` must be called to discard them.
+    """
+
+
+    def __init__( self, kind, revalidate_after = None, environment = None ):
+        """
+            :param kind: kind of file to find: ``config`` or ``data``
+            :param revalidate_after: age, in seconds, beyond which a listing
+                                     is checked against the modification
+                                     time of its directory; if ``None``, then
+                                     listings are not checked
+            :param environment: mapping of environment variables from which
+                                to read the search path; the process
+                                environment, if ``None``
+
+            :raises: :py:exc:`ValueError <CPython3:ValueError>`, if the kind
+                     of file is unknown.
+        """
+
+        if kind not in _SEARCH_PATH_SPECS:
+            raise ValueError( "Unknown kind of file '{0}'.".format( kind ) )
+        self._kind              = kind
+        self._revalidate_after  = revalidate_after
+        self._environment       = environment
+        self._directories       = None
+        self._listings          = { }
+
+
+    def __repr__( self ):
+        """
+            Returns a string representation of the resolver.
+        """
+
+        return "XDGResolver( {0!r}, revalidate_after = {1!r} )".format(
+            self._kind, self._revalidate_after
+        )
+
+
+    @property
+    def directories( self ):
+        """
+            The directories of the search path, in order of preference.
+        """
+
+        directories = self._directories
+        if None is directories:
+            directories = self._directories = self._read_search_path( )
+        return directories
+
+
+    def _read_search_path( self ):
+        """
+            Returns the directories of the search path, as determined from
+            the environment.
+        """
+
+        environment = self._environment
+        if None is environment: environment = os.environ
+        user_evname, user_default, system_evname, system_default = \
+        _SEARCH_PATH_SPECS[ self._kind ]
+
+        directories = [ ]
+
+        # Note: The specification requires relative paths to be ignored.
+        user_directory = environment.get( user_evname )
+        if not user_directory or not _is_absolute_path( user_directory ):
+            user_home = get_platform_facts( ).user_home
+            if user_home:
+                user_directory = _join_path( user_home, user_default )
+            else: user_directory = None
+        if user_directory: directories.append( user_directory )
+
+        system_directories = environment.get( system_evname ) or system_default
+        for directory in system_directories.split( ":" ):
+            if not directory or not _is_absolute_path( directory ): continue
+            directory = directory.rstrip( "/" ) or "/"
+            if directory not in directories: directories.append( directory )
+
+        return directories
+
+
+    def _list( self, directory ):
+        """
+            Returns the names of the entries in a directory, listing it if
+            there is no current listing for it.
+        """
+
+        listing = self._listings.get( directory )
+        if None is not listing:
+            names, mtime, listed_at = listing
+            revalidate_after = self._revalidate_after
+            if      (None is revalidate_after) \
+                or  (_clock( ) - listed_at <= revalidate_after):
+                return names
+            if mtime == _directory_mtime( directory ):
+                self._listings[ directory ] = ( names, mtime, _clock( ) )
+                return names
+
+        mtime = _directory_mtime( directory )
+        if None is mtime: names = frozenset( )
+        else:
+            try:
+                names = _list_directory( directory )
+            except OSError:
+                names = frozenset( )
+        self._listings[ directory ] = ( names, mtime, _clock( ) )
+        return names
+
+
+    def _iter_matches( self, name ):
+        """
+            Returns an iterator over the paths to the matches for a relative
+            name, in order of preference.
+        """
+
+        head, tail = _split_path( name.strip( "/" ) )
+        if not tail: return
+        for base_directory in self.directories:
+            directory = _join_path( base_directory, head )
+            if tail in self._list( directory ):
+                yield _join_path( directory, tail )
+
+
+    def find( self, name ):
+        """
+            Returns the path to the most preferred match for a relative name,
+            such as ``myapp/settings.conf``, or ``None``, if there is no
+            match.
+        """
+
+        for path in self._iter_matches( name ): return path
+        return None
+
+
+    def find_all( self, name ):
+        """
+            Returns the paths to all of the matches for a relative name, in
+            order of preference.
+        """
+
+        return list( self._iter_matches( name ) )
+
+
+    def invalidate( self ):
+        """
+            Discards all directory listings and the search path, so that they
+            are determined anew upon the next lookup.
+        """
+
+        self._listings      = { }
+        self._directories   = None
+
+
+#: Shared resolvers, by kind of file.
+_resolvers = { }
+
+
+def get_xdg_resolver( kind ):
+    """
+        Returns the shared resolver for a kind of file, ``config`` or
+        ``data``, which reads its search path from the process environment.
+
+        :rtype: :py:class:`XDGResolver`
+    """
+
+    try:
+        return _resolvers[ kind ]
+    except KeyError:
+        return _resolvers.setdefault( kind, XDGResolver( kind ) )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -0,0 +1,388 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides the management of scratch space for a process, on top of the
+    temporary storage calculated by :py:func:`whereis_my_temp
+    <utilia.filesystem.stdpath.whereis_my_temp>`.
+
+    Each process receives a private scratch tree, which is created upon first
+    use. The tree is split into a fixed number of shard directories, so that
+    no single directory grows too large, and the files and directories handed
+    out are spread across them. Directories are created ahead of demand, in
+    batches, and handed out from a pool.
+
+    Nothing is deleted piecemeal: the whole tree is removed at once, either
+    by :py:meth:`TempSpace.cleanup` or when the process exits.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+import os
+import atexit
+import threading
+from os.path import (
+    isdir                   as _is_directory,
+    join                    as _join_path,
+)
+
+
+#: Directory backed by shared memory on Linux.
+MEMORY_BACKED_PATH = "/dev/shm"
+
+#: Roots of the scratch trees, which remain to be removed at exit, mapped to
+#: the IDs of the processes which own them. Only the paths are held, so that
+#: the managers themselves can be garbage collected.
+_scratch_roots          = { }
+_scratch_roots_lock     = threading.Lock( )
+
+
+def _remove_scratch_trees( ):
+    """
+        Removes the scratch trees of the current process, which remain when
+        it exits.
+    """
+
+    import shutil
+
+    pid = os.getpid( )
+    with _scratch_roots_lock:
+        roots = [
+            root for root, owner_pid in _scratch_roots.items( )
+            if pid == owner_pid
+        ]
+        _scratch_roots.clear( )
+    for root in roots: shutil.rmtree( root, ignore_errors = True )
+
+atexit.register( _remove_scratch_trees )
+
+
+def free_space( path ):
+    """
+        Returns the number of bytes available to unprivileged users on the
+        filesystem containing a path, or ``None``, if it cannot be determined.
+    """
+
+    statvfs = getattr( os, "statvfs", None )
+    if None is statvfs: return None
+    try:
+        stats = statvfs( path )
+    except OSError:
+        return None
+    return stats.f_bavail * stats.f_frsize
+
+
+class TempSpace( object ):
+    """
+        Manager of a private scratch tree for the current process.
+
+        The tree is created upon first use, in the directory given by
+        ``base_path`` or else in the temporary storage for the software
+        product. If memory-backed storage is preferred and
+        :py:data:`MEMORY_BACKED_PATH` has at least ``minimum_free_space``
+        bytes available, then the tree is created there instead, under the
+        specific path of the software product, if any.
+
+        A forked child process does not remove the tree of its parent; it
+        creates a tree of its own upon first use.
+    """
+
+
+    def __init__(
+        self,
+        specific_path = None, base_path = None,
+        prefer_memory = False, minimum_free_space = 64 * 1024 * 1024,
+        shard_count = 16, pool_size = 32
+    ):
+        """
+            :param specific_path: path fragment for the software product, as
+                                  passed to :py:func:`whereis_my_temp
+                                  <utilia.filesystem.stdpath.whereis_my_temp>`
+            :param base_path: directory in which to create the scratch tree;
+                              if ``None``, then temporary storage is used
+            :param prefer_memory: If ``True``, then create the scratch tree in
+                                  memory-backed storage, if enough space is
+                                  available there.
+            :param minimum_free_space: number of bytes, which memory-backed
+                                       storage must have available to be used
+            :param shard_count: number of shard directories in the tree
+            :param pool_size: number of directories to create in each batch
+
+            :raises: :py:exc:`ValueError <CPython3:ValueError>`, if the shard
+                     count or pool size is less than one.
+        """
+
+        if shard_count < 1:
+            raise ValueError(
+                "Shard count must be at least 1, not {0!r}.".format(
+                    shard_count
+                )
+            )
+        if pool_size < 1:
+            raise ValueError(
+                "Pool size must be at least 1, not {0!r}.".format( pool_size )
+            )
+
+        self._specific_path         = specific_path
+        self._base_path             = base_path
+        self._prefer_memory         = prefer_memory
+        self._minimum_free_space    = minimum_free_space
+        self._shard_count           = shard_count
+        self._pool_size             = pool_size
+
+        self._lock                  = threading.Lock( )
+        self._root                  = None
+        self._shards                = None
+        self._owner_pid             = None
+        self._counter               = 0
+        self._directory_pool        = [ ]
+
+
+    def __repr__( self ):
+        """
+            Returns a string representation of the manager.
+        """
+
+        return "TempSpace( specific_path = {0!r}, root = {1!r} )".format(
+            self._specific_path, self._root
+        )
+
+
+    def __enter__( self ):
+        """
+            Creates the scratch tree, if necessary, and returns the manager.
+        """
+
+        self._ensure_tree( )
+        return self
+
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        """
+            Removes the scratch tree.
+        """
+
+        self.cleanup( )
+        return False
+
+
+    @property
+    def root( self ):
+        """
+            The root of the scratch tree, which is created if necessary.
+        """
+
+        return self._ensure_tree( )
+
+
+    def choose_base_path( self ):
+        """
+            Returns the directory in which the scratch tree is to be created.
+        """
+
+        if      self._prefer_memory \
+            and _is_directory( MEMORY_BACKED_PATH ):
+            available = free_space( MEMORY_BACKED_PATH )
+            if      (None is not available) \
+                and (available >= self._minimum_free_space):
+                if self._specific_path:
+                    return _join_path(
+                        MEMORY_BACKED_PATH, self._specific_path
+                    )
+                return MEMORY_BACKED_PATH
+
+        if None is not self._base_path: return self._base_path
+
+        from .stdpath import whereis_my_temp
+        return whereis_my_temp(
+            specific_path = self._specific_path, error_on_none = True
+        )
+
+
+    def new_file_path( self, suffix = "" ):
+        """
+            Returns a unique path in the scratch tree, at which a file may be
+            created. Nothing is created at the path.
+
+            :param suffix: string to append to the file name
+        """
+
+        with self._lock:
+            shards = self._create_tree( )
+            number = self._counter
+            self._counter += 1
+        return _join_path(
+            shards[ number % len( shards ) ],
+            "{0:x}{1}".format( number, suffix )
+        )
+
+
+    def new_file( self, suffix = "", mode = "w+b" ):
+        """
+            Creates a file in the scratch tree and returns it open.
+            The file is readable and writable by the current user only.
+
+            :param suffix: string to append to the file name
+            :param mode: mode in which to open the file, as for
+                         :py:func:`open <CPython3:open>`
+        """
+
+        the_path = self.new_file_path( suffix )
+        fd = os.open(
+            the_path,
+            os.O_RDWR | os.O_CREAT | os.O_EXCL | getattr( os, "O_BINARY", 0 ),
+            0o600
+        )
+        try:
+            return os.fdopen( fd, mode )
+        except BaseException:
+            os.close( fd )
+            raise
+
+
+    def new_directory( self ):
+        """
+            Returns the path to an empty directory in the scratch tree.
+            The directory is taken from the pool, which is refilled when it
+            runs dry.
+        """
+
+        with self._lock:
+            shards = self._create_tree( )
+            pool = self._directory_pool
+            if not pool:
+                first_number = self._counter
+                self._counter += self._pool_size
+                for number in range(
+                    first_number + self._pool_size - 1, first_number - 1, -1
+                ):
+                    the_path = _join_path(
+                        shards[ number % len( shards ) ],
+                        "{0:x}.d".format( number )
+                    )
+                    os.mkdir( the_path, 0o700 )
+                    pool.append( the_path )
+            return pool.pop( )
+
+
+    def cleanup( self ):
+        """
+            Removes the scratch tree and everything in it. A new tree is
+            created upon next use.
+        """
+
+        with self._lock:
+            root = self._root
+            owned = os.getpid( ) == self._owner_pid
+            self._root              = None
+            self._shards            = None
+            self._owner_pid         = None
+            self._directory_pool    = [ ]
+        if (None is not root) and owned:
+            import shutil
+            with _scratch_roots_lock: _scratch_roots.pop( root, None )
+            shutil.rmtree( root, ignore_errors = True )
+
+
+    def _ensure_tree( self ):
+        """
+            Returns the root of the scratch tree, creating the tree if
+            necessary.
+        """
+
+        with self._lock:
+            self._create_tree( )
+            return self._root
+
+
+    def _create_tree( self ):
+        """
+            Returns the shard directories of the scratch tree, creating the
+            tree if necessary. Must be called with the lock held.
+        """
+
+        pid = os.getpid( )
+        if (None is not self._shards) and (pid == self._owner_pid):
+            return self._shards
+
+        # Note: A tree inherited across 'fork' belongs to the parent.
+        base_path = self.choose_base_path( )
+        if not _is_directory( base_path ):
+            try:
+                os.makedirs( base_path, 0o700 )
+            except OSError:
+                if not _is_directory( base_path ): raise
+
+        import tempfile
+        root = tempfile.mkdtemp(
+            prefix = "scratch-{0}-".format( pid ), dir = base_path
+        )
+        shards = tuple( [
+            _join_path( root, "{0:02x}".format( index ) )
+            for index in range( self._shard_count )
+        ] )
+        for shard in shards: os.mkdir( shard, 0o700 )
+
+        self._root              = root
+        self._shards            = shards
+        self._owner_pid         = pid
+        self._counter           = 0
+        self._directory_pool    = [ ]
+        with _scratch_roots_lock: _scratch_roots[ root ] = pid
+        return shards
+
+
+#: Shared managers, by specific path and preference for memory.
+_temp_spaces = { }
+
+
+def get_temp_space( specific_path = None, prefer_memory = False ):
+    """
+        Returns the shared scratch space manager for a software product.
+
+        :param specific_path: path fragment for the software product, as
+                              passed to :py:func:`whereis_my_temp
+                              <utilia.filesystem.stdpath.whereis_my_temp>`
+        :param prefer_memory: If ``True``, then prefer memory-backed storage.
+        :rtype: :py:class:`TempSpace`
+    """
+
+    key = ( specific_path, prefer_memory )
+    try:
+        return _temp_spaces[ key ]
+    except KeyError:
+        return _temp_spaces.setdefault(
+            key,
+            TempSpace(
+                specific_path = specific_path, prefer_memory = prefer_memory
+            )
+        )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
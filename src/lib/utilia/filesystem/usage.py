@@ -0,0 +1,611 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides the accounting of the disk space used under the standard
+    directories of many software products, or tenants, at once.
+
+    The directory trees are walked in parallel, by a pool of threads. Files
+    with several hard links are counted only once per accounting, no matter
+    how many of the trees link to them. Symbolic links are counted as files
+    and are not followed. By default, sizes are the space allocated on disk,
+    as reported by :command:`du`, rather than the apparent sizes of the files.
+
+    An optional :py:class:`UsageCache` summarizes the files directly in each
+    directory, keyed on the modification time of the directory. A directory
+    whose modification time is unchanged is not listed again, so repeated
+    accountings only examine the directories in which files were added,
+    removed, or renamed. Note that a file which is rewritten in place, without
+    being replaced, does not change the modification time of its directory;
+    such changes are only seen once the directory changes or the cache is
+    discarded.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+import os
+import stat
+import threading
+from os.path import (
+    abspath                 as _absolute_path,
+    dirname                 as _parent_path,
+    join                    as _join_path,
+    lexists                 as _path_exists,
+    normpath                as _normalize_path,
+)
+
+from utilia.compat.collections import ( # pylint: disable=E0611
+    namedtuple,
+    OrderedDict,
+)
+
+
+#: Kinds of standard paths, which are accounted for by default.
+DEFAULT_USAGE_KINDS = (
+    "user_config", "user_resources", "temp", "saved_data",
+)
+
+#: Version of the usage cache file format.
+USAGE_CACHE_FORMAT_VERSION = 1
+
+
+#: Record of the disk usage of a directory tree.
+DirectoryUsage = namedtuple(
+    "DirectoryUsage", "size file_count directory_count"
+)
+
+#: Record of the outcome of a disk usage accounting.
+#: ``tenants`` maps each tenant to an ordered dictionary from kind of standard
+#: path to :py:class:`DirectoryUsage`. ``kinds`` maps each kind of standard
+#: path to its total over the distinct directories of all tenants. ``total``
+#: is the grand total. ``failed`` lists pairs of a path, or a tenant whose
+#: paths could not be calculated, and the exception which occurred.
+UsageReport = namedtuple( "UsageReport", "tenants kinds total failed" )
+
+#: Summary of the entries directly in a directory: the size and number of the
+#: singly linked files, the device, inode, and size of each multiply linked
+#: file, and the names of the subdirectories.
+_DirectorySummary = namedtuple(
+    "_DirectorySummary", "size file_count linked_files subdirectory_names"
+)
+
+_EMPTY_USAGE = DirectoryUsage( 0, 0, 0 )
+
+
+def _file_size( stats, apparent_size ):
+    """
+        Returns the size of a file, either apparent or allocated on disk.
+    """
+
+    if apparent_size: return stats.st_size
+    blocks = getattr( stats, "st_blocks", None )
+    if None is blocks: return stats.st_size
+    return blocks * 512
+
+
+def _summarize_entry( summary, name, stats, apparent_size ):
+    """
+        Adds an entry of a directory to the parts of a summary.
+    """
+
+    size, file_count, linked_files, subdirectory_names = summary
+    if stat.S_ISDIR( stats.st_mode ):
+        subdirectory_names.append( name )
+    elif 1 < stats.st_nlink:
+        linked_files.append( (
+            stats.st_dev, stats.st_ino, _file_size( stats, apparent_size )
+        ) )
+    else:
+        summary[ 0 ] = size + _file_size( stats, apparent_size )
+        summary[ 1 ] = file_count + 1
+
+
+if hasattr( os, "scandir" ):
+
+
+    def _summarize_directory( path, apparent_size ):
+        """
+            Returns a summary of the entries directly in a directory.
+        """
+
+        summary = [ 0, 0, [ ], [ ] ]
+        for entry in os.scandir( path ):
+            try:
+                stats = entry.stat( follow_symlinks = False )
+            except OSError: continue
+            _summarize_entry( summary, entry.name, stats, apparent_size )
+        return _DirectorySummary( *summary )
+
+
+else: # Python prior to 3.5.
+
+
+    def _summarize_directory( path, apparent_size ):
+        """
+            Returns a summary of the entries directly in a directory.
+        """
+
+        summary = [ 0, 0, [ ], [ ] ]
+        for name in os.listdir( path ):
+            try:
+                stats = os.lstat( _join_path( path, name ) )
+            except OSError: continue
+            _summarize_entry( summary, name, stats, apparent_size )
+        return _DirectorySummary( *summary )
+
+
+class UsageCache( object ):
+    """
+        Summaries of the entries directly in directories, keyed on the
+        modification times of the directories, and stored in a JSON file
+        between accountings.
+
+        Individual operations are safe to perform from multiple threads.
+    """
+
+
+    def __init__( self, path, apparent_size = False ):
+        """
+            :param path: path to the cache file; it is read, if it exists
+            :param apparent_size: If ``True``, then the summaries hold
+                                  apparent sizes rather than sizes allocated
+                                  on disk.
+        """
+
+        self._path          = path
+        self._apparent_size = apparent_size
+        self._entries       = { }
+        self._used_paths    = set( )
+        self._lock          = threading.Lock( )
+        self._load( )
+
+
+    def __repr__( self ):
+        """
+            Returns a string representation of the cache.
+        """
+
+        return "UsageCache( {0!r}, apparent_size = {1!r} )".format(
+            self._path, self._apparent_size
+        )
+
+
+    def __len__( self ):
+        """
+            Returns the number of summarized directories.
+        """
+
+        return len( self._entries )
+
+
+    @property
+    def path( self ):
+        """
+            The path to the cache file.
+        """
+
+        return self._path
+
+
+    @property
+    def apparent_size( self ):
+        """
+            ``True``, if the summaries hold apparent sizes.
+        """
+
+        return self._apparent_size
+
+
+    def lookup( self, path, mtime ):
+        """
+            Returns the summary of a directory, or ``None``, if there is none
+            for the given modification time.
+        """
+
+        with self._lock:
+            entry = self._entries.get( path )
+            if None is entry or entry[ 0 ] != mtime: return None
+            self._used_paths.add( path )
+            return entry[ 1 ]
+
+
+    def store( self, path, mtime, summary ):
+        """
+            Stores the summary of a directory for its modification time.
+        """
+
+        with self._lock:
+            self._entries[ path ] = ( mtime, summary )
+            self._used_paths.add( path )
+
+
+    def clear( self ):
+        """
+            Discards all summaries.
+        """
+
+        with self._lock:
+            self._entries.clear( )
+            self._used_paths.clear( )
+
+
+    def save( self, prune = False ):
+        """
+            Writes the summaries to the cache file. The file is replaced
+            atomically.
+
+            :param prune: If ``True``, then the summaries, which were neither
+                          looked up nor stored since the cache was read, are
+                          discarded first.
+        """
+
+        import json
+        import tempfile
+
+        with self._lock:
+            if prune:
+                for path in set( self._entries ) - self._used_paths:
+                    del self._entries[ path ]
+            data = dict(
+                format          = USAGE_CACHE_FORMAT_VERSION,
+                apparent_size   = self._apparent_size,
+                directories     = dict( [
+                    [ path, [ mtime, list( summary ) ] ]
+                    for path, ( mtime, summary ) in self._entries.items( )
+                ] ),
+            )
+
+        directory_path = _parent_path( _absolute_path( self._path ) )
+        fd, temp_path = tempfile.mkstemp(
+            prefix = ".usage", suffix = ".tmp", dir = directory_path
+        )
+        try:
+            with os.fdopen( fd, "w" ) as temp_file:
+                json.dump( data, temp_file )
+            getattr( os, "replace", os.rename )( temp_path, self._path )
+        except BaseException:
+            os.remove( temp_path )
+            raise
+
+
+    def _load( self ):
+        """
+            Reads the summaries from the cache file, if it exists and matches
+            the format and the kind of sizes.
+        """
+
+        import json
+
+        try:
+            with open( self._path, "r" ) as cache_file:
+                data = json.load( cache_file )
+            if      USAGE_CACHE_FORMAT_VERSION != data.get( "format" ) \
+                or  self._apparent_size != data.get( "apparent_size" ):
+                return
+            entries = dict( [
+                [
+                    path,
+                    (
+                        mtime,
+                        _DirectorySummary(
+                            size, file_count,
+                            [ tuple( linked ) for linked in linked_files ],
+                            subdirectory_names
+                        )
+                    )
+                ]
+                for path, (
+                    mtime,
+                    ( size, file_count, linked_files, subdirectory_names )
+                ) in data[ "directories" ].items( )
+            ] )
+        except ( IOError, OSError, ValueError, TypeError, KeyError,
+                 AttributeError ):
+            return
+        self._entries = entries
+
+
+class _LinkRegistry( object ):
+    """
+        Registry of the multiply linked files, which have been counted.
+    """
+
+
+    def __init__( self ):
+        """ """
+
+        self._seen  = set( )
+        self._lock  = threading.Lock( )
+
+
+    def claim( self, device, inode ):
+        """
+            Returns ``True``, if the file has not been counted before, and
+            marks it as counted.
+        """
+
+        key = ( device, inode )
+        with self._lock:
+            if key in self._seen: return False
+            self._seen.add( key )
+            return True
+
+
+def _measure_tree( root, links, cache, apparent_size, failed, excluded ):
+    """
+        Returns the disk usage of a directory tree, without the subtrees at
+        the excluded paths. Errors, which occur below the root, are appended
+        to a list and the affected directories are skipped.
+    """
+
+    size = file_count = directory_count = 0
+    pending_paths = [ root ]
+    while pending_paths:
+        path = pending_paths.pop( )
+        try:
+            mtime = os.lstat( path ).st_mtime
+            summary = None
+            if None is not cache: summary = cache.lookup( path, mtime )
+            if None is summary:
+                summary = _summarize_directory( path, apparent_size )
+                if None is not cache: cache.store( path, mtime, summary )
+        except OSError as exc:
+            if path == root: raise
+            failed.append( ( path, exc ) )
+            continue
+        directory_count += 1
+        size += summary.size
+        file_count += summary.file_count
+        for device, inode, linked_size in summary.linked_files:
+            if not links.claim( device, inode ): continue
+            size += linked_size
+            file_count += 1
+        pending_paths.extend( [
+            subdirectory_path for subdirectory_path in [
+                _join_path( path, name )
+                for name in summary.subdirectory_names
+            ] if subdirectory_path not in excluded
+        ] )
+    return DirectoryUsage( size, file_count, directory_count )
+
+
+def measure_usage(
+    paths, max_workers = 8, cache = None, apparent_size = False
+):
+    """
+        Returns the disk usage of each of many directory trees. Files with
+        several hard links are counted once, in whichever tree is measured
+        first. A tree, which is nested in another one, is walked only once;
+        its usage is included in the usage of the enclosing tree.
+
+        :param paths: iterable of paths to the roots of the trees
+        :param max_workers: maximum number of threads to use
+        :param cache: :py:class:`UsageCache` to consult and update; it must
+                      hold the same kind of sizes
+        :param apparent_size: If ``True``, then apparent sizes are used rather
+                              than sizes allocated on disk.
+        :returns: pair of an ordered dictionary from path to
+                  :py:class:`DirectoryUsage` and a list of pairs of a path
+                  and the exception which occurred; a tree, whose root does
+                  not exist, has no usage
+    """
+
+    paths = list( OrderedDict.fromkeys( [
+        _normalize_path( path ) for path in paths
+    ] ) )
+    own_usages, failed = _measure_own_usage(
+        paths, max_workers, cache, apparent_size
+    )
+    return _include_nested_usages(
+        own_usages, _find_nested_paths( paths )
+    ), failed
+
+
+def _find_nested_paths( paths ):
+    """
+        Returns a dictionary from each of the given normalized paths to the
+        list of the given paths, which are the same as or below it.
+    """
+
+    # Note: Walking up from each path visits only its ancestors, so the cost
+    #       grows with the number of paths times their depth, rather than
+    #       with the square of the number of paths.
+    nested_paths = dict( [ [ path, [ path ] ] for path in paths ] )
+    for path in paths:
+        child_path, parent_path = path, _parent_path( path )
+        while parent_path != child_path:
+            if parent_path in nested_paths:
+                nested_paths[ parent_path ].append( path )
+            child_path, parent_path = \
+            parent_path, _parent_path( parent_path )
+    return nested_paths
+
+
+def _include_nested_usages( own_usages, nested_paths ):
+    """
+        Returns an ordered dictionary from path to the disk usage of the
+        whole tree, given the usages of the trees without their nested trees.
+    """
+
+    return OrderedDict( [
+        [
+            path,
+            _add_usages( [
+                own_usages[ nested_path ]
+                for nested_path in nested_paths[ path ]
+            ] )
+        ]
+        for path in own_usages
+    ] )
+
+
+def _measure_own_usage( paths, max_workers, cache, apparent_size ):
+    """
+        Returns the disk usage of each of many distinct, normalized directory
+        trees, without the trees nested in it, so that no directory is
+        walked twice, and a list of pairs of a path and the exception which
+        occurred.
+    """
+
+    from .stdpath.layout import _map_in_parallel
+
+    if (None is not cache) and (cache.apparent_size != apparent_size):
+        raise ValueError( "Usage cache holds the other kind of sizes." )
+
+    excluded = frozenset( paths )
+    links = _LinkRegistry( )
+    failed = [ ]
+    failed_lock = threading.Lock( )
+
+    def measure( path ):
+        """ Measures one tree and records its errors. """
+        tree_failed = [ ]
+        try:
+            usage = _measure_tree(
+                path, links, cache, apparent_size, tree_failed, excluded
+            )
+        except OSError as exc:
+            usage = _EMPTY_USAGE
+            if _path_exists( path ): tree_failed.append( ( path, exc ) )
+        if tree_failed:
+            with failed_lock: failed.extend( tree_failed )
+        return usage
+
+    usages = _map_in_parallel( measure, paths, max_workers )
+    for position, ( path, usage ) in enumerate( zip( paths, usages ) ):
+        # Note: Unexpected errors are returned in place of the usages.
+        if isinstance( usage, Exception ):
+            failed.append( ( path, usage ) )
+            usages[ position ] = _EMPTY_USAGE
+    return OrderedDict( zip( paths, usages ) ), failed
+
+
+def _add_usages( usages ):
+    """
+        Returns the sum of disk usages.
+    """
+
+    return DirectoryUsage( *[ sum( parts ) for parts in zip(
+        _EMPTY_USAGE, *usages
+    ) ] )
+
+
+def measure_standard_usage(
+    tenants,
+    kinds = DEFAULT_USAGE_KINDS, fs_layout = None,
+    max_workers = 8, cache = None, apparent_size = False
+):
+    """
+        Returns the disk usage under the standard directories of many
+        software products, or tenants.
+
+        A directory, which is the standard path of several tenants or kinds,
+        such as a shared temporary directory, is measured once. Its usage is
+        reported for each of them, but counted only once in the totals. The
+        same holds for a directory, which is nested in another one, such as
+        a configuration directory under a home directory, which holds saved
+        data.
+
+        :param tenants: mapping from tenant name to the standard path context
+                        of the tenant, as accepted by the ``StandardPath``
+                        class of the :py:func:`platform back-end
+                        <utilia.filesystem.stdpath.get_platform_backend>`
+        :param kinds: names of the kinds of standard paths to account for, as
+                      in the fields of the ``StandardPaths`` record returned
+                      by ``StandardPath.resolve_all``
+        :param fs_layout: filesystem layout classification of the platform
+                          back-end; if ``None``, then the classification for
+                          the current OS platform is used
+        :param max_workers: maximum number of threads to use
+        :param cache: :py:class:`UsageCache` to consult and update
+        :param apparent_size: If ``True``, then apparent sizes are used rather
+                              than sizes allocated on disk.
+        :rtype: :py:class:`UsageReport`
+    """
+
+    from .stdpath import get_platform_backend
+    from .stdpath._INTERNAL_ import UndeterminedPathError
+
+    standard_path = get_platform_backend( fs_layout ).StandardPath( )
+    failed = [ ]
+    tenant_paths = OrderedDict( )
+    for tenant, context in tenants.items( ):
+        try:
+            context = standard_path._find_context( context )
+            tenant_paths[ tenant ] = OrderedDict( [
+                [
+                    kind,
+                    getattr( standard_path, "whereis_" + kind )( context )
+                ]
+                for kind in kinds
+            ] )
+        except UndeterminedPathError as exc:
+            failed.append( ( tenant, exc ) )
+
+    all_paths = list( OrderedDict.fromkeys( [
+        _normalize_path( path )
+        for paths in tenant_paths.values( ) for path in paths.values( )
+        if path
+    ] ) )
+    own_usages, measure_failed = _measure_own_usage(
+        all_paths, max_workers, cache, apparent_size
+    )
+    failed.extend( measure_failed )
+    nested_paths = _find_nested_paths( all_paths )
+    usages = _include_nested_usages( own_usages, nested_paths )
+
+    tenant_usages = OrderedDict( )
+    kind_paths = OrderedDict( [ [ kind, set( ) ] for kind in kinds ] )
+    for tenant, paths in tenant_paths.items( ):
+        tenant_usages[ tenant ] = OrderedDict( )
+        for kind, path in paths.items( ):
+            if not path:
+                tenant_usages[ tenant ][ kind ] = _EMPTY_USAGE
+                continue
+            path = _normalize_path( path )
+            tenant_usages[ tenant ][ kind ] = usages[ path ]
+            kind_paths[ kind ].add( path )
+
+    kind_usages = OrderedDict( [
+        [
+            kind,
+            _add_usages( [
+                own_usages[ nested_path ] for nested_path in set( [
+                    nested_path
+                    for path in paths for nested_path in nested_paths[ path ]
+                ] )
+            ] )
+        ]
+        for kind, paths in kind_paths.items( )
+    ] )
+    total = _add_usages( list( own_usages.values( ) ) )
+    return UsageReport( tenant_usages, kind_usages, total, failed )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
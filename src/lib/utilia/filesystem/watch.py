@@ -0,0 +1,553 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides the watching of directories for changes and the invalidation of
+    caches, which depend upon their contents, when changes occur.
+
+    On Linux, changes are reported by the kernel through ``inotify``, which
+    is accessed with :py:mod:`ctypes <CPython3:ctypes>`, and are seen within
+    milliseconds. Elsewhere, or if ``inotify`` is unavailable, the watched
+    directories are polled at a fixed interval instead.
+
+    Directories, which do not exist yet, are checked for at the polling
+    interval and are watched once they appear. Their appearance is reported
+    as a change.
+
+    Changes are reported to registered callbacks, each of which receives the
+    path to the watched directory, in which the change occurred. Changes,
+    which arrive together, are coalesced, so that each directory is reported
+    at most once per batch. If the kernel drops events, because its queue
+    of them overflows, then every watched directory is reported as changed.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+import os
+import sys
+import errno
+import struct
+import threading
+from os.path import (
+    isdir                   as _is_directory,
+    join                    as _join_path,
+    normpath                as _normalize_path,
+)
+
+
+# Flags from '<sys/inotify.h>'.
+_IN_MODIFY          = 0x00000002
+_IN_ATTRIB          = 0x00000004
+_IN_CLOSE_WRITE     = 0x00000008
+_IN_MOVED_FROM      = 0x00000040
+_IN_MOVED_TO        = 0x00000080
+_IN_CREATE          = 0x00000100
+_IN_DELETE          = 0x00000200
+_IN_DELETE_SELF     = 0x00000400
+_IN_MOVE_SELF       = 0x00000800
+_IN_Q_OVERFLOW      = 0x00004000
+_IN_IGNORED         = 0x00008000
+_IN_NONBLOCK        = 0x00000800
+_IN_CLOEXEC         = 0x00080000
+
+_WATCH_MASK = \
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM \
+|   _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+
+#: Layout of the fixed part of 'struct inotify_event'.
+_EVENT_HEADER = struct.Struct( "iIII" )
+
+
+def _load_inotify( ):
+    """
+        Returns the C library, if it provides ``inotify``, or ``None``.
+    """
+
+    if not sys.platform.startswith( "linux" ): return None
+    try:
+        import ctypes
+        libc = ctypes.CDLL( None, use_errno = True )
+        for name in [
+            "inotify_init1", "inotify_add_watch", "inotify_rm_watch",
+        ]:
+            getattr( libc, name )
+    except ( ImportError, OSError, AttributeError ):
+        return None
+    libc.inotify_add_watch.argtypes = \
+    [ ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32 ]
+    return libc
+
+
+def _snapshot_directory( path ):
+    """
+        Returns a value, which changes whenever the entries of a directory or
+        their sizes or modification times change, or ``None``, if the
+        directory does not exist.
+    """
+
+    try:
+        stats = os.stat( path )
+        names = os.listdir( path )
+    except OSError:
+        return None
+    entries = [ ]
+    for name in names:
+        try:
+            entry_stats = os.stat( _join_path( path, name ) )
+        except OSError: continue
+        entries.append(
+            ( name, entry_stats.st_size, entry_stats.st_mtime )
+        )
+    entries.sort( )
+    return ( stats.st_ino, stats.st_mtime, tuple( entries ) )
+
+
+class DirectoryWatcher( object ):
+    """
+        Watches directories for changes and reports them to callbacks.
+
+        Call :py:meth:`start` to watch from a background thread, or call
+        :py:meth:`check` periodically to watch from the calling thread.
+        Exceptions raised by callbacks are suppressed, so that one faulty
+        callback cannot stop the reporting of changes to the others.
+    """
+
+
+    def __init__( self, paths = ( ), poll_interval = 1.0, use_inotify = None ):
+        """
+            :param paths: directories to watch
+            :param poll_interval: interval, in seconds, at which directories
+                                  are polled for changes, if ``inotify`` is
+                                  not used, or for their appearance
+            :param use_inotify: If ``False``, then always poll. If ``None``,
+                                then use ``inotify``, if available.
+
+            :raises: :py:exc:`ValueError <CPython3:ValueError>`, if
+                     ``inotify`` is requested but is not available.
+        """
+
+        self._poll_interval     = poll_interval
+        self._lock              = threading.RLock( )
+        self._callbacks         = [ ]
+        self._paths             = set( )
+        self._pending_paths     = set( )
+        self._snapshots         = { }
+        self._watch_descriptors = { }
+        self._thread            = None
+        self._stop_requested    = threading.Event( )
+
+        self._libc = None
+        self._fd = None
+        if False is not use_inotify:
+            self._libc = _load_inotify( )
+            if None is not self._libc:
+                fd = self._libc.inotify_init1( _IN_NONBLOCK | _IN_CLOEXEC )
+                if 0 <= fd: self._fd = fd
+            if (None is self._fd) and use_inotify:
+                raise ValueError( "The 'inotify' facility is unavailable." )
+
+        for path in paths: self.add_path( path )
+
+
+    def __repr__( self ):
+        """
+            Returns a string representation of the watcher.
+        """
+
+        return "DirectoryWatcher( {0!r}, uses_inotify = {1!r} )".format(
+            sorted( self._paths ), self.uses_inotify
+        )
+
+
+    def __enter__( self ):
+        """
+            Starts watching from a background thread and returns the watcher.
+        """
+
+        self.start( )
+        return self
+
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        """
+            Stops watching and releases the ``inotify`` instance.
+        """
+
+        self.close( )
+        return False
+
+
+    @property
+    def uses_inotify( self ):
+        """
+            ``True``, if changes are reported by ``inotify``.
+        """
+
+        return None is not self._fd
+
+
+    @property
+    def paths( self ):
+        """
+            The watched directories.
+        """
+
+        with self._lock:
+            return frozenset( self._paths )
+
+
+    def add_path( self, path ):
+        """
+            Starts watching a directory. If the directory does not exist,
+            then it is watched once it appears.
+        """
+
+        path = _normalize_path( path )
+        with self._lock:
+            if path in self._paths: return
+            self._paths.add( path )
+            if not self._start_watching( path ):
+                self._pending_paths.add( path )
+
+
+    def remove_path( self, path ):
+        """
+            Stops watching a directory.
+        """
+
+        path = _normalize_path( path )
+        with self._lock:
+            self._paths.discard( path )
+            self._pending_paths.discard( path )
+            self._snapshots.pop( path, None )
+            for wd, watched_path in list( self._watch_descriptors.items( ) ):
+                if watched_path != path: continue
+                del self._watch_descriptors[ wd ]
+                self._libc.inotify_rm_watch( self._fd, wd )
+
+
+    def register( self, callback ):
+        """
+            Registers a callback, which is called with the path to a watched
+            directory, whenever a change occurs in it. Returns the callback,
+            so that this method can serve as a decorator.
+        """
+
+        with self._lock:
+            self._callbacks.append( callback )
+        return callback
+
+
+    def register_cache( self, cache, paths = None ):
+        """
+            Registers a cache to be invalidated, whenever a change occurs in a
+            watched directory. The ``invalidate``, ``rescan``, or ``clear``
+            method of the cache, whichever is found first, is called.
+
+            :param cache: the cache, such as an :py:class:`XDGResolver
+                          <utilia.filesystem.stdpath.xdg.XDGResolver>`
+            :param paths: directories to limit the invalidation to; any
+                          watched directory, if ``None``
+            :returns: the callback, which invalidates the cache
+        """
+
+        for name in [ "invalidate", "rescan", "clear" ]:
+            invalidate = getattr( cache, name, None )
+            if callable( invalidate ): break
+        else:
+            raise TypeError(
+                "Cache {0!r} cannot be invalidated.".format( cache )
+            )
+        if None is not paths:
+            paths = frozenset( [ _normalize_path( path ) for path in paths ] )
+
+        def invalidate_cache( path ):
+            """ Invalidates the cache upon a change in a directory. """
+            if (None is paths) or (path in paths): invalidate( )
+
+        return self.register( invalidate_cache )
+
+
+    def unregister( self, callback ):
+        """
+            Unregisters a callback.
+        """
+
+        with self._lock:
+            try: self._callbacks.remove( callback )
+            except ValueError: pass
+
+
+    def check( self, timeout = 0 ):
+        """
+            Reports the changes, which have occurred since the previous check,
+            waiting up to the given number of seconds for one to occur.
+            Returns the paths to the directories, in which changes occurred.
+        """
+
+        if None is not self._fd:
+            changed_paths = self._read_events( timeout )
+        else:
+            if timeout: self._stop_requested.wait( timeout )
+            changed_paths = self._poll( )
+        changed_paths |= self._check_pending_paths( )
+        self._notify( changed_paths )
+        return changed_paths
+
+
+    def start( self ):
+        """
+            Starts watching from a background thread, if not already
+            watching.
+        """
+
+        with self._lock:
+            if None is not self._thread: return
+            self._stop_requested.clear( )
+            self._thread = threading.Thread(
+                target = self._run, name = "DirectoryWatcher"
+            )
+            self._thread.daemon = True
+            self._thread.start( )
+
+
+    def stop( self ):
+        """
+            Stops watching from the background thread and waits for it to
+            finish.
+        """
+
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if None is thread: return
+        self._stop_requested.set( )
+        thread.join( )
+
+
+    def close( self ):
+        """
+            Stops watching and releases the ``inotify`` instance.
+        """
+
+        self.stop( )
+        with self._lock:
+            if None is not self._fd:
+                os.close( self._fd )
+                self._fd = None
+            self._watch_descriptors.clear( )
+
+
+    def _run( self ):
+        """
+            Reports changes until asked to stop.
+        """
+
+        while not self._stop_requested.is_set( ):
+            self.check( self._poll_interval )
+
+
+    def _start_watching( self, path ):
+        """
+            Starts watching an existing directory. Returns ``False``, if the
+            directory does not exist. Must be called with the lock held.
+        """
+
+        if None is self._fd:
+            snapshot = _snapshot_directory( path )
+            if None is snapshot: return False
+            self._snapshots[ path ] = snapshot
+            return True
+
+        encoded_path = path
+        if not isinstance( encoded_path, bytes ):
+            encoded_path = path.encode( sys.getfilesystemencoding( ) )
+        wd = \
+        self._libc.inotify_add_watch( self._fd, encoded_path, _WATCH_MASK )
+        if 0 > wd:
+            import ctypes
+            error_number = ctypes.get_errno( )
+            if error_number in ( errno.ENOENT, errno.ENOTDIR, ): return False
+            raise OSError( error_number, os.strerror( error_number ), path )
+        self._watch_descriptors[ wd ] = path
+        return True
+
+
+    def _check_pending_paths( self ):
+        """
+            Starts watching the directories, which have appeared, and returns
+            their paths.
+        """
+
+        appeared_paths = set( )
+        with self._lock:
+            for path in list( self._pending_paths ):
+                if not _is_directory( path ): continue
+                if self._start_watching( path ):
+                    self._pending_paths.discard( path )
+                    appeared_paths.add( path )
+        return appeared_paths
+
+
+    def _read_events( self, timeout ):
+        """
+            Reads the pending ``inotify`` events, waiting up to the given
+            number of seconds for one to arrive, and returns the paths to the
+            directories, in which changes occurred.
+        """
+
+        import select
+
+        try:
+            readable = select.select( [ self._fd ], [ ], [ ], timeout )[ 0 ]
+        except select.error: readable = [ ]
+        if not readable: return set( )
+
+        try:
+            data = os.read( self._fd, 65536 )
+        except OSError as exc:
+            if exc.errno in ( errno.EAGAIN, errno.EINTR, ): return set( )
+            raise
+
+        changed_paths = set( )
+        header_size = _EVENT_HEADER.size
+        offset = 0
+        with self._lock:
+            while offset + header_size <= len( data ):
+                wd, mask, cookie, name_length = \
+                _EVENT_HEADER.unpack_from( data, offset )
+                offset += header_size + name_length
+                if mask & _IN_Q_OVERFLOW:
+                    # Note: Events were lost; any directory may have changed.
+                    changed_paths.update( self._watch_descriptors.values( ) )
+                    continue
+                path = self._watch_descriptors.get( wd )
+                if None is path: continue
+                changed_paths.add( path )
+                if mask & ( _IN_IGNORED | _IN_DELETE_SELF | _IN_MOVE_SELF ):
+                    # Note: The directory is gone; wait for it to reappear.
+                    del self._watch_descriptors[ wd ]
+                    if path in self._paths: self._pending_paths.add( path )
+        return changed_paths
+
+
+    def _poll( self ):
+        """
+            Polls the watched directories and returns the paths to those, in
+            which changes occurred.
+        """
+
+        changed_paths = set( )
+        with self._lock:
+            for path, snapshot in list( self._snapshots.items( ) ):
+                new_snapshot = _snapshot_directory( path )
+                if new_snapshot == snapshot: continue
+                changed_paths.add( path )
+                if None is new_snapshot:
+                    del self._snapshots[ path ]
+                    self._pending_paths.add( path )
+                else: self._snapshots[ path ] = new_snapshot
+        return changed_paths
+
+
+    def _notify( self, changed_paths ):
+        """
+            Reports changes to the registered callbacks.
+        """
+
+        if not changed_paths: return
+        with self._lock:
+            callbacks = list( self._callbacks )
+        for path in sorted( changed_paths ):
+            for callback in callbacks:
+                try: callback( path )
+                except Exception: pass # pylint: disable=W0703
+
+
+def watch_standard_paths(
+    watcher,
+    context = None,
+    kinds = ( "common_config", "common_resources", "user_config",
+              "user_resources", ),
+    xdg_kinds = ( "config", "data", ),
+    caches = ( )
+):
+    """
+        Adds the standard directories of the software product, defined in
+        ``context``, to a watcher. On POSIX platforms, the directories of the
+        XDG search paths are added as well, and the shared
+        :py:class:`XDGResolver <utilia.filesystem.stdpath.xdg.XDGResolver>`
+        objects are registered to be invalidated upon changes in them.
+
+        Other caches, which depend upon the contents of the standard
+        directories, are not known to the watcher. Pass them as ``caches``,
+        or register them with :py:meth:`DirectoryWatcher.register_cache`,
+        to have them invalidated as well. For example, a
+        :py:class:`ResourceLocator
+        <utilia.filesystem.stdpath.resources.ResourceLocator>` should be
+        invalidated upon changes in the resource directories, and a
+        ``CachedStandardPath`` upon changes in the directories from which
+        its paths were calculated.
+
+        :param watcher: the watcher
+        :type watcher: :py:class:`DirectoryWatcher`
+        :param context: standard path context for the platform back-end; if
+                        ``None``, then the current context is used
+        :param kinds: names of the kinds of standard paths to watch, as in the
+                      fields of the ``StandardPaths`` record returned by
+                      ``StandardPath.resolve_all``
+        :param xdg_kinds: kinds of XDG search paths to watch
+        :param caches: caches to register with the watcher, as for
+                       :py:meth:`DirectoryWatcher.register_cache`, so that
+                       they are invalidated upon changes in the standard
+                       directories
+        :returns: the watched directories
+    """
+
+    from .stdpath import get_platform_backend, which_fs_layout
+
+    paths = [ ]
+    standard_path = get_platform_backend( ).StandardPath( context )
+    for kind in kinds:
+        path = getattr( standard_path, "whereis_" + kind )( context )
+        if path: paths.append( path )
+    for cache in caches: watcher.register_cache( cache, paths )
+
+    if "POSIX" == which_fs_layout( ):
+        from .stdpath.xdg import get_xdg_resolver
+        for kind in xdg_kinds:
+            resolver = get_xdg_resolver( kind )
+            watcher.register_cache( resolver, resolver.directories )
+            paths.extend( resolver.directories )
+
+    for path in paths: watcher.add_path( path )
+    return paths
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -54,16 +54,16 @@ from __future__ import (
 __docformat__ = "reStructuredText"
 
 
+from utilia import (
+    _append_docstring,
+)
 from utilia.compat.builtins import ( # pylint: disable=W0622
     reduce,
 )
 
 
-def __DOCSTRING_FRAGMENTS( ):
-    """
-        Returns a dictionary of common docstring fragments.
-    """
-    return \
+#: Dictionary of common docstring fragments.
+__DOCSTRING_FRAGMENTS = \
     {
         "posargs": \
     """
@@ -107,8 +107,11 @@ def andf( *posargs ):
 
     return all( posargs )
 
-andf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-andf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_boolean" ]
+_append_docstring(
+    andf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_boolean" ],
+)
 
 
 def nandf( *posargs ):
@@ -132,8 +135,11 @@ def nandf( *posargs ):
 
     return not all( posargs )
 
-nandf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-nandf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_boolean" ]
+_append_docstring(
+    nandf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_boolean" ],
+)
 
 
 def orf( *posargs ):
@@ -157,8 +163,11 @@ def orf( *posargs ):
 
     return any( posargs )
 
-orf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-orf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_boolean" ]
+_append_docstring(
+    orf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_boolean" ],
+)
 
 
 def norf( *posargs ):
@@ -182,8 +191,11 @@ def norf( *posargs ):
 
     return not any( posargs )
 
-norf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-norf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_boolean" ]
+_append_docstring(
+    norf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_boolean" ],
+)
 
 
 def xorf( *posargs ):
@@ -207,10 +219,12 @@ def xorf( *posargs ):
 
     return reduce( lambda p, q: p != q, map( bool, posargs ) )
 
-xorf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-xorf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_boolean" ]
-xorf.__doc__ += \
-__DOCSTRING_FRAGMENTS( )[ "RAISES_TypeError (on missing argument)" ]
+_append_docstring(
+    xorf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_boolean" ],
+    __DOCSTRING_FRAGMENTS[ "RAISES_TypeError (on missing argument)" ],
+)
 
 
 def xnorf( *posargs ):
@@ -234,10 +248,12 @@ def xnorf( *posargs ):
 
     return not reduce( lambda p, q: p != q, map( bool, posargs ) )
 
-xnorf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-xnorf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_boolean" ]
-xnorf.__doc__ += \
-__DOCSTRING_FRAGMENTS( )[ "RAISES_TypeError (on missing argument)" ]
+_append_docstring(
+    xnorf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_boolean" ],
+    __DOCSTRING_FRAGMENTS[ "RAISES_TypeError (on missing argument)" ],
+)
 
 
 def impliesf( *posargs ):
@@ -261,10 +277,12 @@ def impliesf( *posargs ):
 
     return reduce( lambda p, q: not p or q, map( bool, posargs ) )
 
-impliesf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-impliesf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_boolean" ]
-impliesf.__doc__ += \
-__DOCSTRING_FRAGMENTS( )[ "RAISES_TypeError (on missing argument)" ]
+_append_docstring(
+    impliesf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_boolean" ],
+    __DOCSTRING_FRAGMENTS[ "RAISES_TypeError (on missing argument)" ],
+)
 
 
 def nimpliesf( *posargs ):
@@ -288,10 +306,12 @@ def nimpliesf( *posargs ):
 
     return not reduce( lambda p, q: not p or q, map( bool, posargs ) )
 
-nimpliesf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-nimpliesf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_boolean" ]
-nimpliesf.__doc__ += \
-__DOCSTRING_FRAGMENTS( )[ "RAISES_TypeError (on missing argument)" ]
+_append_docstring(
+    nimpliesf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_boolean" ],
+    __DOCSTRING_FRAGMENTS[ "RAISES_TypeError (on missing argument)" ],
+)
 
 
 def cimpliesf( *posargs ):
@@ -315,10 +335,12 @@ def cimpliesf( *posargs ):
 
     return reduce( lambda p, q: p or not q, map( bool, posargs ) )
 
-cimpliesf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-cimpliesf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_boolean" ]
-cimpliesf.__doc__ += \
-__DOCSTRING_FRAGMENTS( )[ "RAISES_TypeError (on missing argument)" ]
+_append_docstring(
+    cimpliesf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_boolean" ],
+    __DOCSTRING_FRAGMENTS[ "RAISES_TypeError (on missing argument)" ],
+)
 
 
 def cnimpliesf( *posargs ):
@@ -342,10 +364,12 @@ def cnimpliesf( *posargs ):
 
     return not reduce( lambda p, q: p or not q, map( bool, posargs ) )
 
-cnimpliesf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-cnimpliesf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_boolean" ]
-cnimpliesf.__doc__ += \
-__DOCSTRING_FRAGMENTS( )[ "RAISES_TypeError (on missing argument)" ]
+_append_docstring(
+    cnimpliesf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_boolean" ],
+    __DOCSTRING_FRAGMENTS[ "RAISES_TypeError (on missing argument)" ],
+)
 
 
 def o_andf( *posargs ):
@@ -368,8 +392,11 @@ def o_andf( *posargs ):
 
     return reduce( lambda p, q: p and q, posargs, True )
 
-o_andf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-o_andf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_any" ]
+_append_docstring(
+    o_andf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_any" ],
+)
 
 
 def o_orf( *posargs ):
@@ -392,8 +419,11 @@ def o_orf( *posargs ):
 
     return reduce( lambda p, q: p or q, posargs, False )
 
-o_orf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "posargs" ]
-o_orf.__doc__ += __DOCSTRING_FRAGMENTS( )[ "RTYPE_any" ]
+_append_docstring(
+    o_orf,
+    __DOCSTRING_FRAGMENTS[ "posargs" ],
+    __DOCSTRING_FRAGMENTS[ "RTYPE_any" ],
+)
 
 
 ###############################################################################
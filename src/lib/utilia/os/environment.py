@@ -0,0 +1,261 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Provides snapshots of selected environment variables.
+
+    A snapshot records the values of only the variables which it tracks and
+    is read like any other mapping of environment variables. It changes only
+    when it is refreshed. Each refresh which finds changed values increments
+    the version of the snapshot, so that anything computed from the snapshot
+    can be checked for validity by comparing a single number. Values derived
+    from specific variables are recomputed only when one of those variables
+    has changed.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+__docformat__ = "reStructuredText"
+
+
+import os
+import threading
+
+from utilia.compat.collections import ( # pylint: disable=E0611
+    Mapping,
+)
+
+
+class EnvironmentSnapshot( Mapping ):
+    """
+        Mapping of the recorded values of the tracked environment variables.
+        Variables, which were unset when recorded, are absent.
+
+        Individual operations are safe to perform from multiple threads.
+
+        Inherits from :py:class:`collections.Mapping
+        <CPython3:collections.Mapping>`.
+    """
+
+
+    def __init__( self, names = ( ), environment = None ):
+        """
+            :param names: names of the environment variables to track
+            :param environment: mapping of environment variables from which
+                                to record values; the process environment,
+                                if ``None``
+        """
+
+        if None is environment: environment = os.environ
+        self._environment   = environment
+        self._values        = { }
+        self._changed_at    = { }
+        self._version       = 0
+        self._callbacks     = [ ]
+        self._lock          = threading.RLock( )
+        self.track( *names )
+
+
+    def __getitem__( self, name ):
+        """
+            Returns the recorded value of an environment variable.
+
+            :param name: name of the environment variable
+        """
+
+        return self._values[ name ]
+
+
+    def __contains__( self, name ):
+        """
+            Tests whether an environment variable was set when recorded.
+        """
+
+        return name in self._values
+
+
+    def __iter__( self ):
+        """
+            Returns an iterator over the names of the environment variables,
+            which were set when recorded.
+        """
+
+        with self._lock:
+            names = list( self._values )
+        return iter( names )
+
+
+    def __len__( self ):
+        """
+            Returns the number of environment variables, which were set when
+            recorded.
+        """
+
+        return len( self._values )
+
+
+    def __repr__( self ):
+        """
+            Returns a string representation of the snapshot.
+        """
+
+        return "EnvironmentSnapshot( {0!r} ) <version {1}>".format(
+            sorted( self._changed_at ), self._version
+        )
+
+
+    @property
+    def version( self ):
+        """
+            Number, which is incremented whenever a refresh finds changed
+            values.
+        """
+
+        return self._version
+
+
+    @property
+    def names( self ):
+        """
+            The names of the tracked environment variables.
+        """
+
+        with self._lock:
+            return frozenset( self._changed_at )
+
+
+    def track( self, *names ):
+        """
+            Starts tracking environment variables and records their values.
+            Tracking a variable, which is already tracked, has no effect.
+        """
+
+        environment = self._environment
+        with self._lock:
+            for name in names:
+                if name in self._changed_at: continue
+                self._changed_at[ name ] = self._version
+                value = environment.get( name )
+                if None is not value: self._values[ name ] = value
+
+
+    def refresh( self ):
+        """
+            Records the current values of the tracked environment variables.
+            If any of them have changed, then the version is incremented and
+            the registered callbacks are called with the names of the changed
+            variables.
+
+            :returns: frozen set of the names of the changed variables
+        """
+
+        environment = self._environment
+        with self._lock:
+            values = self._values
+            changed_names = [ ]
+            for name in self._changed_at:
+                value = environment.get( name )
+                if value == values.get( name ): continue
+                changed_names.append( name )
+                if None is value: del values[ name ]
+                else: values[ name ] = value
+            if changed_names:
+                self._version += 1
+                for name in changed_names:
+                    self._changed_at[ name ] = self._version
+            callbacks = list( self._callbacks )
+        changed_names = frozenset( changed_names )
+        if changed_names:
+            for callback in callbacks: callback( changed_names )
+        return changed_names
+
+
+    def changed_since( self, version, names = None ):
+        """
+            Tests whether any of the given environment variables have changed
+            after the given version of the snapshot.
+
+            :param version: version of the snapshot
+            :param names: names of the environment variables; all of the
+                          tracked ones, if ``None``
+        """
+
+        if None is names: return version < self._version
+        changed_at = self._changed_at
+        for name in names:
+            if version < changed_at.get( name, self._version ): return True
+        return False
+
+
+    def register( self, callback ):
+        """
+            Registers a callback, which is called with a frozen set of the
+            names of the changed variables, whenever a refresh finds changed
+            values. Returns the callback, so that this method can serve as a
+            decorator.
+        """
+
+        with self._lock:
+            self._callbacks.append( callback )
+        return callback
+
+
+    def derive( self, function, names ):
+        """
+            Returns a function, which returns the value computed by the given
+            function and recomputes it only after one of the given environment
+            variables has changed. Every given variable is tracked.
+
+            :param function: function without arguments, which computes the
+                             value from the snapshot
+            :param names: names of the environment variables on which the
+                          value depends
+        """
+
+        names = tuple( names )
+        self.track( *names )
+        state = [ None, None ]  # Version and value.
+        lock = threading.Lock( )
+
+        def get_derived_value( ):
+            """ Returns the derived value, recomputed if necessary. """
+
+            with lock:
+                version, value = state
+                if (None is not version) and not self.changed_since(
+                    version, names
+                ): return value
+                version = self._version
+                value = function( )
+                state[ : ] = [ version, value ]
+                return value
+
+        get_derived_value.__name__  = getattr( function, "__name__", "derive" )
+        get_derived_value.__doc__   = function.__doc__
+        return get_derived_value
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -39,5 +39,19 @@ from __future__ import (
 __docformat__ = "reStructuredText"
 
 
+# Lazy Submodules
+
+
+from utilia import (
+    _make_lazy_attribute_loader,
+)
+
+__getattr__ = _make_lazy_attribute_loader(
+    __name__, frozenset( [ "maps" ] )
+)
+
+del _make_lazy_attribute_loader
+
+
 ###############################################################################
 # vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
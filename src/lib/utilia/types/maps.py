@@ -21,6 +21,9 @@
     across Python versions. The collection of map types consists of:
         
         * :py:class:`OrderedDict <CPython2:collections.OrderedDict>`
+
+        * :py:class:`LRUDict`, which holds a bounded number of entries and
+          evicts the least recently used ones
 """
 
 
@@ -35,10 +38,140 @@ from __future__ import (
 __docformat__ = "reStructuredText"
 
 
-from utilia.compat.collections import ( # pylint: disable=W0611
+import threading
+
+from utilia.compat.collections import ( # pylint: disable=W0611,E0611
+    MutableMapping,
     OrderedDict,
 )
 
 
+class LRUDict( MutableMapping ):
+    """
+        Mapping which holds at most a given number of entries. When an entry
+        is added to a full mapping, the least recently used entry is evicted.
+        Both lookups and assignments count as uses of an entry.
+
+        Individual operations are safe to perform from multiple threads.
+
+        Inherits from :py:class:`collections.MutableMapping
+        <CPython3:collections.MutableMapping>`.
+    """
+
+
+    def __init__( self, maxsize = 128 ):
+        """
+            :param maxsize: maximum number of entries to hold; must be
+                            positive
+        """
+
+        if 1 > maxsize:
+            raise ValueError(
+                "Maximum size must be positive, not {0!r}.".format( maxsize )
+            )
+        self._maxsize   = maxsize
+        self._entries   = OrderedDict( )
+        self._lock      = threading.Lock( )
+
+
+    @property
+    def maxsize( self ):
+        """
+            The maximum number of entries which the mapping holds.
+        """
+
+        return self._maxsize
+
+
+    def __getitem__( self, key ):
+        """
+            Gets an entry and marks it as the most recently used one.
+
+            :param key: key of the entry
+        """
+
+        entries = self._entries
+        with self._lock:
+            value = entries.pop( key )
+            entries[ key ] = value
+        return value
+
+
+    def __setitem__( self, key, value ):
+        """
+            Sets an entry and marks it as the most recently used one. Evicts
+            the least recently used entry, if the mapping is full.
+
+            :param key: key of the entry
+            :param value: new value of the entry
+        """
+
+        entries = self._entries
+        with self._lock:
+            entries.pop( key, None )
+            entries[ key ] = value
+            while len( entries ) > self._maxsize:
+                entries.popitem( last = False )
+
+
+    def __delitem__( self, key ):
+        """
+            Deletes an entry.
+
+            :param key: key of the entry
+        """
+
+        with self._lock:
+            del self._entries[ key ]
+
+
+    def __contains__( self, key ):
+        """
+            Tests whether an entry exists, without marking it as used.
+        """
+
+        return key in self._entries
+
+
+    def __iter__( self ):
+        """
+            Returns an iterator over a snapshot of the keys, from the least to
+            the most recently used.
+        """
+
+        with self._lock:
+            keys = list( self._entries )
+        return iter( keys )
+
+
+    def __len__( self ):
+        """
+            Returns the number of entries.
+        """
+
+        return len( self._entries )
+
+
+    def __repr__( self ):
+        """
+            Returns a string representation of the mapping.
+        """
+
+        with self._lock:
+            items = list( self._entries.items( ) )
+        return "LRUDict( maxsize = {0!r} ) <{1!r}>".format(
+            self._maxsize, items
+        )
+
+
+    def clear( self ):
+        """
+            Deletes all entries.
+        """
+
+        with self._lock:
+            self._entries.clear( )
+
+
 ###############################################################################
 # vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
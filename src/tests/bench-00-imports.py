@@ -0,0 +1,362 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Measures the import-time cost of the :py:mod:`utilia` package and its
+    subpackages, modules, and internal platform back-ends.
+
+    For each module, the following measurements are taken:
+
+    * *Cold* import time: the time to import the module into a freshly
+      started interpreter. Each sample is taken in a separate subprocess.
+
+    * *Warm* import time: the time to import the module again within the
+      same interpreter, after evicting all :py:mod:`utilia` modules from
+      :py:data:`sys.modules <CPython3:sys.modules>`. Standard library
+      dependencies remain loaded, so this isolates the cost of the package's
+      own module bodies.
+
+    * Module count: the number of modules, in total and from within
+      :py:mod:`utilia`, which are loaded as a result of the import.
+
+    * Memory footprint: the peak number of bytes allocated during the
+      import, as reported by :py:mod:`tracemalloc <CPython3:tracemalloc>`,
+      or the growth of the maximum resident set size on Pythons which lack
+      it. Since tracing slows imports down, the footprint is measured by a
+      separate cold import, which is not timed.
+
+    Modules which fail to import have an ``error`` entry in place of their
+    measurements.
+
+    The results are written as JSON, so that they can be compared across
+    releases. Comparison against a previous set of results is supported via
+    the ``--compare`` option::
+
+        python src/tests/bench-00-imports.py --output new.json
+        python src/tests/bench-00-imports.py --compare old.json
+
+    This script is not collected as a test.
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import sys
+import json
+import platform
+import subprocess
+from os.path import (
+    join                    as _join_path,
+    dirname                 as _dirname_of_path,
+    abspath                 as _absolute_path,
+)
+
+
+#: Path to the library under test.
+_path_to_lib = \
+_absolute_path( _join_path( _dirname_of_path( __file__ ), "..", "lib" ) )
+
+sys.path.insert( 0, _path_to_lib )
+
+from utilia.compat import argparse
+import utilia.os.exit_codes as _exit_codes
+
+
+#: Modules to measure, in order from the least to the most dependent.
+MODULE_NAMES = [
+    "utilia",
+    "utilia.compat",
+    "utilia.compat.builtins",
+    "utilia.compat.collections",
+    "utilia.compat.configparser",
+    "utilia.compat.argparse",
+    "utilia.compat._INTERNAL_",
+    "utilia.compat._INTERNAL_.argparse",
+    "utilia.compat._INTERNAL_.collections",
+    "utilia.compat._INTERNAL_.collections.ordered_dict",
+    "utilia.exceptions",
+    "utilia.os.environment",
+    "utilia.os.exit_codes",
+    "utilia.types.maps",
+    "utilia.functional.logic",
+    "utilia.config_parsers",
+    "utilia.filesystem",
+    "utilia.filesystem.diskcache",
+    "utilia.filesystem.stdpath",
+    "utilia.filesystem.stdpath.facts",
+    "utilia.filesystem.stdpath.normalization",
+    "utilia.filesystem.stdpath.xdg",
+    "utilia.filesystem.stdpath.layout",
+    "utilia.filesystem.stdpath.offline",
+    "utilia.filesystem.stdpath.snapshot",
+    "utilia.filesystem.stdpath.users",
+    "utilia.filesystem.stdpath.resources",
+    "utilia.filesystem.stdpath.aio",
+    "utilia.filesystem.stdpath._INTERNAL_",
+    "utilia.filesystem.stdpath._INTERNAL_.POSIX",
+    "utilia.filesystem.stdpath._INTERNAL_.POSIX.Linux",
+    "utilia.filesystem.stdpath._INTERNAL_.POSIX.MacOSX",
+    "utilia.filesystem.stdpath._INTERNAL_.Windows",
+    "utilia.filesystem.tempspace",
+    "utilia.filesystem.usage",
+    "utilia.filesystem.watch",
+]
+
+
+#: Source code of the probe, which runs in a fresh interpreter.
+#: Arguments: path to library, module name, number of warm samples, and
+#: either 'time' or 'memory' for the kind of measurements to take.
+_PROBE_SOURCE = """
+import sys
+import json
+try:                from time import perf_counter as clock
+except ImportError: from time import time as clock
+try:                import tracemalloc
+except ImportError: tracemalloc = None
+try:                import resource
+except ImportError: resource = None
+
+sys.path.insert( 0, sys.argv[ 1 ] )
+module_name     = sys.argv[ 2 ]
+warm_samples    = int( sys.argv[ 3 ] )
+probe_mode      = sys.argv[ 4 ]
+
+if "memory" == probe_mode:
+    rss_before  = resource and resource.getrusage( resource.RUSAGE_SELF )[ 2 ]
+    if tracemalloc: tracemalloc.start( )
+    __import__( module_name )
+    if tracemalloc:
+        memory_bytes = tracemalloc.get_traced_memory( )[ 1 ]
+        tracemalloc.stop( )
+    elif resource:
+        memory_bytes = \\
+        1024 * (resource.getrusage( resource.RUSAGE_SELF )[ 2 ] - rss_before)
+    else: memory_bytes = None
+    print( json.dumps( { "memory_bytes": memory_bytes, } ) )
+    sys.exit( 0 )
+
+def utilia_module_names( ):
+    return [
+        mn for mn in list( sys.modules )
+        if ("utilia" == mn) or mn.startswith( "utilia." )
+    ]
+
+modules_before  = set( sys.modules )
+
+t0 = clock( )
+__import__( module_name )
+cold_seconds = clock( ) - t0
+
+modules_loaded = set( sys.modules ) - modules_before
+
+warm_seconds = [ ]
+for i in range( warm_samples ):
+    for mn in utilia_module_names( ): del sys.modules[ mn ]
+    t0 = clock( )
+    __import__( module_name )
+    warm_seconds.append( clock( ) - t0 )
+
+print( json.dumps( {
+    "cold_seconds":         cold_seconds,
+    "warm_seconds":         warm_seconds,
+    "module_count":         len( modules_loaded ),
+    "utilia_module_count":  len( [
+        mn for mn in modules_loaded
+        if ("utilia" == mn) or mn.startswith( "utilia." )
+    ] ),
+} ) )
+"""
+
+
+def _median( values ):
+    """
+        Returns the median of a non-empty sequence of numbers.
+    """
+
+    values = sorted( values )
+    middle = len( values ) // 2
+    if len( values ) % 2: return values[ middle ]
+    return (values[ middle - 1 ] + values[ middle ]) / 2
+
+
+def _run_probe( module_name, warm_samples, probe_mode = "time" ):
+    """
+        Runs the probe for a module in a fresh interpreter and returns the
+        decoded measurements.
+    """
+
+    process = subprocess.Popen(
+        [   sys.executable, "-c", _PROBE_SOURCE,
+            _path_to_lib, module_name, str( warm_samples ), probe_mode
+        ],
+        stdout = subprocess.PIPE, stderr = subprocess.PIPE
+    )
+    stdout, stderr = process.communicate( )
+    if process.returncode:
+        raise ImportError(
+            stderr.decode( "utf-8", "replace" ).strip( ).splitlines( )[ -1 ]
+        )
+    return json.loads( stdout.decode( "utf-8" ) )
+
+
+def measure_module( module_name, cold_samples = 5, warm_samples = 5 ):
+    """
+        Returns a dictionary of import-time measurements for a module.
+    """
+
+    # Note: Some modules, such as compatibility shims and platform back-ends,
+    #       are not importable on every Python. Record why instead of failing.
+    try:
+        probes = [
+            _run_probe( module_name, warm_samples )
+            for i in range( cold_samples )
+        ]
+        memory_bytes = _run_probe( module_name, 0, "memory" )[ "memory_bytes" ]
+    except ImportError as exc:
+        return { "module": module_name, "error": str( exc ), }
+    cold_seconds = [ probe[ "cold_seconds" ] for probe in probes ]
+    warm_seconds = sum( [ probe[ "warm_seconds" ] for probe in probes ], [ ] )
+    return {
+        "module":               module_name,
+        "cold_seconds_min":     min( cold_seconds ),
+        "cold_seconds_median":  _median( cold_seconds ),
+        "warm_seconds_min":     min( warm_seconds ) if warm_seconds else None,
+        "warm_seconds_median":
+            _median( warm_seconds ) if warm_seconds else None,
+        "module_count":         probes[ 0 ][ "module_count" ],
+        "utilia_module_count":  probes[ 0 ][ "utilia_module_count" ],
+        "memory_bytes":         memory_bytes,
+    }
+
+
+def measure_all( module_names, cold_samples = 5, warm_samples = 5 ):
+    """
+        Returns a dictionary, containing information about the interpreter
+        and a list of measurements for each of the given modules.
+    """
+
+    return {
+        "python":       sys.version.split( )[ 0 ],
+        "implementation": platform.python_implementation( ),
+        "platform":     platform.platform( ),
+        "cold_samples": cold_samples,
+        "warm_samples": warm_samples,
+        "results":      [
+            measure_module( mn, cold_samples, warm_samples )
+            for mn in module_names
+        ],
+    }
+
+
+def compare( baseline, current, threshold ):
+    """
+        Returns a list of regression descriptions for modules whose median
+        cold import time, module count, or memory footprint grew by more than
+        the given fraction relative to the baseline.
+    """
+
+    regressions = [ ]
+    baseline_results = dict(
+        ( result[ "module" ], result ) for result in baseline[ "results" ]
+    )
+    for result in current[ "results" ]:
+        old_result = baseline_results.get( result[ "module" ] )
+        if None is old_result: continue
+        if ("error" in result) and ("error" not in old_result):
+            regressions.append(
+                "{0}: no longer importable ({1})".format(
+                    result[ "module" ], result[ "error" ]
+                )
+            )
+            continue
+        for key in [ "cold_seconds_median", "module_count", "memory_bytes" ]:
+            old_value, new_value = old_result.get( key ), result.get( key )
+            if not old_value or None is new_value: continue
+            if new_value > old_value * (1 + threshold):
+                regressions.append(
+                    "{0}: {1} grew from {2} to {3}".format(
+                        result[ "module" ], key, old_value, new_value
+                    )
+                )
+    return regressions
+
+
+def main( ):
+    """
+        Runs the benchmarks according to the command-line arguments.
+    """
+
+    parser = argparse.ArgumentParser(
+        description = "Measure import-time cost of utilia modules."
+    )
+    parser.add_argument(
+        "modules", nargs = "*", default = MODULE_NAMES,
+        help = "names of modules to measure (default: all)"
+    )
+    parser.add_argument(
+        "--cold-samples", type = int, default = 5,
+        help = "number of fresh interpreters per module"
+    )
+    parser.add_argument(
+        "--warm-samples", type = int, default = 5,
+        help = "number of re-imports per interpreter"
+    )
+    parser.add_argument(
+        "--output", default = None,
+        help = "write JSON results to this file rather than standard output"
+    )
+    parser.add_argument(
+        "--compare", default = None, metavar = "BASELINE",
+        help = "report regressions relative to a previous JSON results file"
+    )
+    parser.add_argument(
+        "--threshold", type = float, default = 0.10,
+        help = "fractional growth tolerated before reporting a regression"
+    )
+    args = parser.parse_args( )
+
+    results = measure_all( args.modules, args.cold_samples, args.warm_samples )
+
+    if args.output:
+        with open( args.output, "w" ) as output_file:
+            json.dump( results, output_file, indent = 2, sort_keys = True )
+    elif not args.compare:
+        print( json.dumps( results, indent = 2, sort_keys = True ) )
+
+    if args.compare:
+        with open( args.compare ) as baseline_file:
+            baseline = json.load( baseline_file )
+        regressions = compare( baseline, results, args.threshold )
+        for regression in regressions: print( regression )
+        if regressions: return _exit_codes.FAILURE( )
+
+    return _exit_codes.SUCCESS( )
+
+
+if "__main__" == __name__:
+    sys.exit( main( ) )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
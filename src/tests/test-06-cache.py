@@ -0,0 +1,154 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Does the LRU mapping evict its least recently used entry, when full?
+
+    * Does the caching standard path object memoize the calculated paths?
+
+    * Are the memoized paths calculated anew, after a context option or an
+      environment variable, on which they depend, has changed?
+
+    * Are the memoized paths discarded upon clearing?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+def __make_cached_standard_path( environment, maxsize = 256 ):
+    """
+        Returns a POSIX context and a caching standard path object, which
+        reads the given environment variables.
+    """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+    from utilia.filesystem.stdpath._INTERNAL_ import CachedStandardPath
+
+    backend = get_platform_backend( "POSIX" )
+    context = backend.StandardPathContext(
+        software_name = "foo", calculate_path = True
+    )
+    standard_path = CachedStandardPath(
+        backend.StandardPath( environment = environment ), maxsize = maxsize
+    )
+    return context, standard_path
+
+
+def test_LRU_EVICTION( ):
+    """ Does the LRU mapping evict its least recently used entry? """
+
+    from utilia.types.maps import LRUDict
+
+    lru = LRUDict( 2 )
+    lru[ "a" ] = 1
+    lru[ "b" ] = 2
+    assert 1 == lru[ "a" ]
+    lru[ "c" ] = 3
+    assert [ "a", "c" ] == list( lru ), lru
+    assert "b" not in lru
+    lru[ "a" ] = 4
+    lru[ "d" ] = 5
+    assert [ "a", "d" ] == list( lru ), lru
+    assert 4 == lru[ "a" ]
+    lru.clear( )
+    assert 0 == len( lru )
+
+    try: LRUDict( 0 )
+    except ValueError: pass
+    else: assert False, "Expected ValueError for non-positive size."
+
+
+def test_MEMOIZED_PATHS( ):
+    """ Does the caching standard path object memoize paths? """
+
+    environment = { "HOME": "/home/foo", "XDG_CONFIG_HOME": "/x/config", }
+    context, standard_path = __make_cached_standard_path( environment )
+
+    path = standard_path.whereis_user_config( context )
+    assert "/x/config/foo" == path, path
+    assert 1 == len( standard_path._cache )
+    assert path == standard_path.whereis_user_config( context )
+    assert 1 == len( standard_path._cache )
+    standard_path.resolve_all( context )
+    assert 2 == len( standard_path._cache )
+
+
+def test_INVALIDATION( ):
+    """ Are memoized paths calculated anew after relevant changes? """
+
+    environment = { "HOME": "/home/foo", "XDG_CONFIG_HOME": "/x/config", }
+    context, standard_path = __make_cached_standard_path( environment )
+    standard_path.whereis_user_config( context )
+
+    context[ "software_name" ] = "bar"
+    path = standard_path.whereis_user_config( context )
+    assert "/x/config/bar" == path, path
+
+    environment[ "XDG_CONFIG_HOME" ] = "/y/config"
+    path = standard_path.whereis_user_config( context )
+    assert "/y/config/bar" == path, path
+
+    # Note: Variables, which the calculation does not read, do not matter.
+    environment[ "UNRELATED" ] = "1"
+    standard_path.whereis_user_config( context )
+    assert 3 == len( standard_path._cache ), standard_path._cache
+
+    standard_path.clear( )
+    assert 0 == len( standard_path._cache )
+
+
+def test_SNAPSHOT_INVALIDATION( ):
+    """ Are memoized paths calculated anew after a snapshot refresh? """
+
+    from utilia.os.environment import EnvironmentSnapshot
+
+    variables = { "HOME": "/home/foo", "XDG_CONFIG_HOME": "/x/config", }
+    environment = EnvironmentSnapshot( list( variables ), variables )
+    context, standard_path = __make_cached_standard_path( environment )
+
+    assert "/x/config/foo" == standard_path.whereis_user_config( context )
+    variables[ "XDG_CONFIG_HOME" ] = "/y/config"
+    # Note: The snapshot holds the recorded values until refreshed.
+    assert "/x/config/foo" == standard_path.whereis_user_config( context )
+    environment.refresh( )
+    assert "/y/config/foo" == standard_path.whereis_user_config( context )
+
+
+def test_LRU_BOUND( ):
+    """ Does the caching standard path object hold a bounded number? """
+
+    environment = { "HOME": "/home/foo", }
+    context, standard_path = __make_cached_standard_path(
+        environment, maxsize = 2
+    )
+    for software_name in ( "a", "b", "c", ):
+        context[ "software_name" ] = software_name
+        standard_path.whereis_user_config( context )
+    assert 2 == len( standard_path._cache ), standard_path._cache
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
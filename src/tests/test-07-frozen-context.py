@@ -0,0 +1,159 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Are frozen contexts with the same options equal and equally hashed?
+
+    * Do frozen contexts differ, if their options or classes differ?
+
+    * Are frozen contexts immutable?
+
+    * Do frozen contexts survive pickling?
+
+    * Does a frozen context calculate the same paths as its mutable
+      counterpart?
+
+    * Do the docstrings of the context classes, as shown by help(), list
+      all of their options?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import pickle
+
+
+def __freeze( fs_layout, **options ):
+    """
+        Returns a frozen context for the given platform back-end.
+    """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+
+    backend = get_platform_backend( fs_layout )
+    return backend.StandardPathContext( **options ).freeze( )
+
+
+def test_HASH_AND_EQUALITY( ):
+    """ Are frozen contexts with the same options equal? """
+
+    first = __freeze( "POSIX", software_name = "foo", software_version = "1" )
+    second = __freeze(
+        "POSIX", software_version = "1", software_name = "foo"
+    )
+
+    assert first == second
+    assert not (first != second)
+    assert hash( first ) == hash( second )
+    assert first.fingerprint( ) == second.fingerprint( )
+    assert 1 == len( set( [ first, second ] ) )
+
+
+def test_INEQUALITY( ):
+    """ Do frozen contexts differ, if their options or classes differ? """
+
+    first = __freeze( "POSIX", software_name = "foo" )
+
+    assert first != __freeze( "POSIX", software_name = "bar" )
+    assert first != __freeze( "Windows", software_name = "foo" )
+    assert first != __freeze( "POSIX" )
+
+
+def test_IMMUTABILITY( ):
+    """ Are frozen contexts immutable? """
+
+    context = __freeze( "POSIX", software_name = "foo" )
+
+    for alter in (
+        lambda: setattr( context, "software_name", "bar" ),
+        lambda: delattr( context, "software_name" ),
+        lambda: context.__setitem__( "software_name", "bar" ),
+    ):
+        try: alter( )
+        except ( AttributeError, TypeError, ): pass
+        else: assert False, "Expected the context to be immutable."
+    assert "foo" == context.software_name
+    assert "foo" == context[ "software_name" ]
+
+
+def test_PICKLING( ):
+    """ Do frozen contexts survive pickling? """
+
+    for fs_layout in ( "POSIX", "MacOS X", "Windows", ):
+        context = __freeze(
+            fs_layout,
+            software_name = "foo", software_provider_name = "Acme"
+        )
+        for protocol in range( pickle.HIGHEST_PROTOCOL + 1 ):
+            copy = pickle.loads( pickle.dumps( context, protocol ) )
+            assert context == copy, ( fs_layout, protocol, )
+            assert hash( context ) == hash( copy ), ( fs_layout, protocol, )
+            assert "foo" == copy.software_name
+
+
+def test_SAME_PATHS( ):
+    """ Does a frozen context calculate the same paths? """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+
+    backend = get_platform_backend( "POSIX" )
+    environment = { "HOME": "/home/foo", }
+    standard_path = backend.StandardPath( environment = environment )
+    context = backend.StandardPathContext(
+        software_name = "foo", software_provider_name = "Acme",
+        calculate_path = True
+    )
+    frozen_context = context.freeze( )
+
+    assert context.user_path == frozen_context.user_path
+    assert context.common_path == frozen_context.common_path
+    assert standard_path.resolve_all( context ) \
+    == standard_path.resolve_all( frozen_context )
+    assert dict( context ) == dict( frozen_context.thaw( ) )
+
+
+def test_OPTIONS_TABLES( ):
+    """ Do the docstrings of the context classes list all options? """
+
+    import pydoc
+    from utilia.filesystem.stdpath import get_platform_backend
+
+    for fs_layout in ( "POSIX", "MacOS X", "Windows", ):
+        backend = get_platform_backend( fs_layout )
+        for cls in (
+            backend.StandardPathContext, backend.FrozenStandardPathContext
+        ):
+            # Note: Docstrings are stripped under '-OO'.
+            if not cls.__dict__.get( "__doc__" ): continue
+            rendered_docstring = pydoc.plain( pydoc.render_doc( cls ) )
+            for option_name in cls._option_validators:
+                row_start = "\"{0}\",".format( option_name )
+                assert row_start in cls.__doc__, ( cls, option_name, )
+                assert row_start in rendered_docstring, ( cls, option_name, )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -0,0 +1,96 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Are the columns of paths the same as those calculated one software
+      product at a time?
+
+    * Are columns of different lengths and unknown locations rejected?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+#: Columns of software names, vendor names, and versions, with repetitions.
+__SOFTWARE_NAMES    = [ "foo", "Bar Baz", "foo", None, "foo", ]
+__VENDOR_NAMES      = [ "Acme", None, "Acme", None, None, ]
+__VERSIONS          = [ "1.0", None, "1.0", None, "2", ]
+
+
+def test_EQUIVALENCE( ):
+    """ Are the columns of paths the same as the per-product paths? """
+
+    from utilia.filesystem import stdpath
+
+    columns = stdpath.whereis_my_paths_by_columns(
+        __SOFTWARE_NAMES, __VENDOR_NAMES, __VERSIONS
+    )
+
+    assert columns, columns
+    for location, column in columns.items( ):
+        assert len( __SOFTWARE_NAMES ) == len( column ), ( location, column, )
+        finder = getattr( stdpath, "whereis_my_" + location )
+        for identity, path in zip(
+            zip( __SOFTWARE_NAMES, __VENDOR_NAMES, __VERSIONS ), column
+        ):
+            fragment = stdpath.concatenated_software_path_fragment(
+                *identity
+            )
+            expected_path = finder( specific_path = fragment )
+            assert expected_path == path, ( location, identity, path, )
+
+
+def test_SELECTED_LOCATIONS( ):
+    """ Are only the requested locations calculated, in order? """
+
+    from utilia.filesystem import stdpath
+
+    locations = [ "user_config", "temp", ]
+    columns = stdpath.whereis_my_paths_by_columns(
+        __SOFTWARE_NAMES, locations = locations
+    )
+
+    assert locations == list( columns ), columns
+
+
+def test_INVALID_COLUMNS( ):
+    """ Are columns of different lengths and unknown locations rejected? """
+
+    from utilia.filesystem import stdpath
+
+    for arguments in (
+        dict( software_names = [ "foo", "bar", ], versions = [ "1", ] ),
+        dict( software_names = [ "foo", ], vendor_names = [ ] ),
+        dict( software_names = [ "foo", ], locations = [ "nowhere", ] ),
+    ):
+        try: stdpath.whereis_my_paths_by_columns( **arguments )
+        except ValueError: pass
+        else:
+            assert False, "Expected ValueError for {0!r}.".format( arguments )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
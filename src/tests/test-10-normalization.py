@@ -0,0 +1,104 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Do the shared normalizers give the same results as normalizing each
+      name anew, both upon first and upon repeated calls?
+
+    * Are the least recently used names forgotten, once the memo is full?
+
+    * Is a maximum number of remembered names, which is not positive,
+      rejected?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import re
+
+
+#: Names with various whitespace.
+__NAMES = (
+    "Foo", " Foo ", "Foo Bar", "Foo  Bar", "\tFoo \n Bar\t", "Foo\t\tBar ",
+    "1.0 beta", "", "   ", "Acme, Inc.",
+)
+
+
+def __normalize( fs_layout, strip, name ):
+    """
+        Returns a name, normalized anew by the rules of a filesystem layout.
+    """
+
+    if strip: name = name.strip( )
+    if "POSIX" == fs_layout: name = re.sub( r"\s+", "_", name )
+    return name
+
+
+def test_SAME_RESULTS( ):
+    """ Do the shared normalizers give the same results as anew? """
+
+    from utilia.filesystem.stdpath.normalization import get_name_normalizer
+
+    for fs_layout in ( "POSIX", "MacOS X", "Windows", ):
+        for strip in ( True, False, ):
+            normalizer = get_name_normalizer( fs_layout, strip )
+            # Note: The second pass is answered from the memo.
+            for name in __NAMES + __NAMES:
+                expected_name = __normalize( fs_layout, strip, name )
+                assert expected_name == normalizer( name ), \
+                ( fs_layout, strip, name, normalizer( name ), )
+    assert None is get_name_normalizer( "Plan 9" )
+
+
+def test_LEAST_RECENTLY_USED( ):
+    """ Are the least recently used names forgotten, once it is full? """
+
+    from utilia.filesystem.stdpath.normalization import NameNormalizer
+
+    normalizer = NameNormalizer( whitespace_to_underscore = True, maxsize = 2 )
+    assert "a_b" == normalizer( "a b" )
+    assert "c_d" == normalizer( "c d" )
+    assert "a_b" == normalizer( "a b" )
+    assert "e_f" == normalizer( "e f" )
+    assert [ "a b", "e f", ] == sorted( normalizer._memo ), \
+    list( normalizer._memo )
+    assert "c_d" == normalizer( "c d" )
+
+    normalizer.clear( )
+    assert not len( normalizer._memo )
+
+
+def test_INVALID_MAXSIZE( ):
+    """ Is a maximum number of names, which is not positive, rejected? """
+
+    from utilia.filesystem.stdpath.normalization import NameNormalizer
+
+    try: NameNormalizer( maxsize = 0 )
+    except ValueError: pass
+    else: assert False, "Expected ValueError."
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
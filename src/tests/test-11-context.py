@@ -0,0 +1,146 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Does leaving the scope of a context restore the previous one, also
+      when the scope is left by an exception?
+
+    * Does each thread see its own context?
+
+    * Does each asyncio task see its own context?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import threading
+
+
+def __make_context( backend, software_name ):
+    """
+        Returns a context for a software product.
+    """
+
+    return backend.StandardPathContext(
+        software_name = software_name, calculate_path = True
+    )
+
+
+def test_RESTORATION( ):
+    """ Does leaving the scope of a context restore the previous one? """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+
+    backend = get_platform_backend( "POSIX" )
+    process_context = backend.get_context( )
+    outer_context = __make_context( backend, "outer" )
+    inner_context = __make_context( backend, "inner" )
+
+    with backend.use_context( outer_context ):
+        assert outer_context is backend.get_context( )
+        with backend.use_context( inner_context ):
+            assert inner_context is backend.get_context( )
+        assert outer_context is backend.get_context( )
+        try:
+            with backend.use_context( inner_context ):
+                raise RuntimeError( "Leaving the scope." )
+        except RuntimeError: pass
+        assert outer_context is backend.get_context( )
+    assert process_context is backend.get_context( )
+
+
+def test_THREADS( ):
+    """ Does each thread see its own context? """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+
+    backend = get_platform_backend( "POSIX" )
+    process_context = backend.get_context( )
+    contexts = [
+        __make_context( backend, "thread{0}".format( i ) ) for i in range( 2 )
+    ]
+    entered = [ threading.Event( ) for context in contexts ]
+    seen = { }
+
+    def use( index ):
+        with backend.use_context( contexts[ index ] ):
+            entered[ index ].set( )
+            # Note: Wait until every thread is in the scope of its context.
+            for event in entered: event.wait( 10 )
+            seen[ index ] = backend.get_context( )
+        seen[ -1 - index ] = backend.get_context( )
+
+    threads = [
+        threading.Thread( target = use, args = ( i, ) )
+        for i in range( len( contexts ) )
+    ]
+    for thread in threads: thread.start( )
+    for thread in threads: thread.join( 10 )
+
+    for index, context in enumerate( contexts ):
+        assert context is seen[ index ], ( index, seen )
+        assert process_context is seen[ -1 - index ], ( index, seen )
+    assert process_context is backend.get_context( )
+
+
+def test_TASKS( ):
+    """ Does each asyncio task see its own context? """
+
+    import asyncio
+    from utilia.filesystem.stdpath import get_platform_backend
+
+    backend = get_platform_backend( "POSIX" )
+    process_context = backend.get_context( )
+    contexts = [
+        __make_context( backend, "task{0}".format( i ) ) for i in range( 2 )
+    ]
+    seen = { }
+
+    async def use( index ):
+        with backend.use_context( contexts[ index ] ):
+            # Note: Let the other task enter the scope of its context.
+            await asyncio.sleep( 0 )
+            await asyncio.sleep( 0 )
+            seen[ index ] = backend.get_context( )
+        seen[ -1 - index ] = backend.get_context( )
+
+    loop = asyncio.new_event_loop( )
+    try:
+        tasks = [
+            loop.create_task( use( i ) ) for i in range( len( contexts ) )
+        ]
+        loop.run_until_complete( asyncio.wait( tasks ) )
+        for task in tasks: task.result( )
+    finally:
+        loop.close( )
+
+    for index, context in enumerate( contexts ):
+        assert context is seen[ index ], ( index, seen )
+        assert process_context is seen[ -1 - index ], ( index, seen )
+    assert process_context is backend.get_context( )
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
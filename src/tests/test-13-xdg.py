@@ -0,0 +1,188 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Are files found in the user directory before the system directories?
+
+    * Are relative directories in the search path ignored?
+
+    * Are directory listings reused until invalidated?
+
+    * Are directory listings refreshed after their directories change, when
+      revalidation is enabled?
+
+    * Are unknown kinds of files rejected?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import os
+import shutil
+import tempfile
+from os.path import (
+    join                    as _join_path,
+)
+
+
+def __make_file( path ):
+    """
+        Creates an empty file, along with its parent directories.
+    """
+
+    parent_path = os.path.dirname( path )
+    if not os.path.isdir( parent_path ): os.makedirs( parent_path )
+    open( path, "wb" ).close( )
+
+
+def __make_search_path( root_path ):
+    """
+        Returns an environment with a user directory and two system
+        directories for configuration files under a root directory.
+    """
+
+    return {
+        "XDG_CONFIG_HOME":  _join_path( root_path, "user" ),
+        "XDG_CONFIG_DIRS":  ":".join( [
+            _join_path( root_path, "first" ), "relative",
+            _join_path( root_path, "second" ),
+        ] ),
+    }
+
+
+def test_SEARCH_ORDER( ):
+    """ Are files found in the user directory first? """
+
+    from utilia.filesystem.stdpath.xdg import XDGResolver
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        environment = __make_search_path( root_path )
+        user_path = _join_path( root_path, "user", "foo", "foo.conf" )
+        first_path = _join_path( root_path, "first", "foo", "foo.conf" )
+        second_path = _join_path( root_path, "second", "foo", "foo.conf" )
+        for path in ( user_path, first_path, second_path, ):
+            __make_file( path )
+        __make_file( _join_path( root_path, "second", "bar.conf" ) )
+
+        resolver = XDGResolver( "config", environment = environment )
+
+        assert [
+            _join_path( root_path, "user" ),
+            _join_path( root_path, "first" ),
+            _join_path( root_path, "second" ),
+        ] == resolver.directories, resolver.directories
+        assert user_path == resolver.find( "foo/foo.conf" )
+        assert [ user_path, first_path, second_path, ] \
+        == resolver.find_all( "foo/foo.conf" )
+        assert _join_path( root_path, "second", "bar.conf" ) \
+        == resolver.find( "bar.conf" )
+        assert None is resolver.find( "foo/missing.conf" )
+        assert None is resolver.find( "missing/foo.conf" )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_RELATIVE_USER_DIRECTORY( ):
+    """ Is a relative user directory replaced by the default one? """
+
+    from utilia.filesystem.stdpath.facts import get_platform_facts
+    from utilia.filesystem.stdpath.xdg import XDGResolver
+
+    user_home = get_platform_facts( ).user_home
+    resolver = XDGResolver(
+        "data", environment = { "XDG_DATA_HOME": "relative", }
+    )
+
+    if user_home:
+        assert _join_path( user_home, ".local/share" ) \
+        == resolver.directories[ 0 ], resolver.directories
+    assert "relative" not in resolver.directories
+    assert [ "/usr/local/share", "/usr/share", ] \
+    == resolver.directories[ -2 : ], resolver.directories
+
+
+def test_INVALIDATION( ):
+    """ Are directory listings reused until invalidated? """
+
+    from utilia.filesystem.stdpath.xdg import XDGResolver
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        environment = __make_search_path( root_path )
+        resolver = XDGResolver( "config", environment = environment )
+        path = _join_path( root_path, "first", "foo.conf" )
+
+        assert None is resolver.find( "foo.conf" )
+        __make_file( path )
+        assert None is resolver.find( "foo.conf" )
+        resolver.invalidate( )
+        assert path == resolver.find( "foo.conf" )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_REVALIDATION( ):
+    """ Are directory listings refreshed after their directories change? """
+
+    from utilia.filesystem.stdpath.xdg import XDGResolver
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        environment = __make_search_path( root_path )
+        resolver = XDGResolver(
+            "config", revalidate_after = 0, environment = environment
+        )
+        directory = _join_path( root_path, "first" )
+        path = _join_path( directory, "foo.conf" )
+        os.makedirs( directory )
+        os.utime( directory, ( 1000000000, 1000000000, ) )
+
+        assert None is resolver.find( "foo.conf" )
+        __make_file( path )
+        # Note: Set a distinct time, in case of coarse timestamps.
+        os.utime( directory, ( 1000000100, 1000000100, ) )
+        assert path == resolver.find( "foo.conf" )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_UNKNOWN_KIND( ):
+    """ Are unknown kinds of files rejected? """
+
+    from utilia.filesystem.stdpath.xdg import (
+        XDGResolver,
+        get_xdg_resolver,
+    )
+
+    try: XDGResolver( "cache" )
+    except ValueError: pass
+    else: assert False, "Expected ValueError for an unknown kind."
+    assert get_xdg_resolver( "data" ) is get_xdg_resolver( "data" )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -0,0 +1,270 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Is the runtime directory under a user base path kept apart from the
+      other user directories?
+
+    * Are the paths to sockets, PID files, and lock files in the runtime
+      directory, which is created private to its owner?
+
+    * Is a socket path rejected, if it exceeds the length limit in bytes?
+
+    * Is an existing runtime directory made private to its owner?
+
+    * Is a symbolic link refused as the runtime directory?
+
+    * Is the system runtime directory accepted only, if it is owned by the
+      user, is private to the user, and is not a symbolic link?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import os
+import stat
+import shutil
+import tempfile
+from os.path import (
+    join                    as _join_path,
+)
+
+
+def __make_standard_path( root_path ):
+    """
+        Returns a POSIX standard path object, which puts the runtime
+        directory under a root directory, along with a context for a software
+        product.
+    """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+    from utilia.filesystem.stdpath.facts import get_platform_facts
+
+    backend = get_platform_backend( "POSIX" )
+    standard_path = backend.StandardPath(
+        environment = dict(
+            HOME = _join_path( root_path, "home" ),
+            XDG_RUNTIME_DIR = _join_path( root_path, "run" ),
+        ),
+        facts = get_platform_facts( ).with_facts(
+            fs_layout = "POSIX", user_uid = os.getuid( ),
+            user_home = _join_path( root_path, "home" ),
+            system_runtime_dir = None,
+        )
+    )
+    context = backend.StandardPathContext(
+        software_name = "Foo", software_provider_name = "Acme",
+        calculate_path = True
+    )
+    return standard_path, context
+
+
+def __mode_of( path ):
+    """
+        Returns the permission bits of a path.
+    """
+
+    return stat.S_IMODE( os.lstat( path ).st_mode )
+
+
+def test_USER_BASE_PATH( ):
+    """ Is the runtime directory under a user base path kept apart? """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+    from utilia.filesystem.stdpath.offline import offline_platform_facts
+
+    for fs_layout in ( "POSIX", "MacOS X", ):
+        backend = get_platform_backend( fs_layout )
+        standard_path = backend.StandardPath(
+            environment = { },
+            facts = offline_platform_facts(
+                fs_layout, { "HOME": "/home/alice", }
+            )
+        )
+        paths = standard_path.resolve_all( backend.StandardPathContext(
+            software_name = "Foo", software_provider_name = "Acme",
+            calculate_path = True, user_base_path = "/srv/users/alice"
+        ) )
+
+        assert "/srv/users/alice/run/Acme/Foo" == paths.runtime, \
+        paths.runtime
+        for path in paths:
+            if path == paths.runtime: continue
+            assert not path.startswith( paths.runtime + "/" ), path
+            assert not paths.runtime.startswith( path + "/" ), path
+
+
+def test_IPC_PATHS( ):
+    """ Are the IPC paths in a runtime directory private to its owner? """
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        standard_path, context = __make_standard_path( root_path )
+        os.mkdir( _join_path( root_path, "run" ), 0o700 )
+        runtime_path = _join_path( root_path, "run", "Acme", "Foo" )
+
+        assert _join_path( runtime_path, "control" ) \
+        == standard_path.socket_path( "control", context )
+        assert 0o700 == __mode_of( runtime_path ), \
+        oct( __mode_of( runtime_path ) )
+        assert _join_path( runtime_path, "daemon.pid" ) \
+        == standard_path.pid_file_path( "daemon", context )
+        assert _join_path( runtime_path, "daemon.lock" ) \
+        == standard_path.lock_file_path( "daemon", context )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_IPC_PATHS_WITHOUT_CREATION( ):
+    """ Is the runtime directory left alone, if creation is declined? """
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        standard_path, context = __make_standard_path( root_path )
+        runtime_path = _join_path( root_path, "run", "Acme", "Foo" )
+
+        assert _join_path( runtime_path, "daemon.pid" ) \
+        == standard_path.pid_file_path(
+            "daemon", context, create_directory = False
+        )
+        assert not os.path.exists( runtime_path )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_SOCKET_PATH_LENGTH( ):
+    """ Is a socket path rejected, if it exceeds the limit in bytes? """
+
+    from utilia.filesystem.stdpath._INTERNAL_ import UndeterminedPathError
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        standard_path, context = __make_standard_path( root_path )
+        max_length = standard_path._socket_path_max_length
+        prefix_length = \
+        len( _join_path( root_path, "run", "Acme", "Foo", "" ) )
+        assert max_length > prefix_length, root_path
+
+        name = "s" * (max_length - prefix_length)
+        assert max_length == len( standard_path.socket_path( name, context ) )
+
+        for name in (
+            "s" * (max_length - prefix_length + 1),
+            # Note: Within the limit in characters but not in bytes.
+            b"\xc3\xa9".decode( "utf-8" ) * (max_length - prefix_length),
+        ):
+            try: standard_path.socket_path( name, context )
+            except UndeterminedPathError: pass
+            else: assert False, "Expected rejection of {0!r}.".format( name )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_EXISTING_DIRECTORY_MODE( ):
+    """ Is an existing runtime directory made private to its owner? """
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        standard_path, context = __make_standard_path( root_path )
+        runtime_path = _join_path( root_path, "run", "Acme", "Foo" )
+        os.makedirs( runtime_path )
+        os.chmod( runtime_path, 0o755 )
+
+        standard_path.lock_file_path( "daemon", context )
+        assert 0o700 == __mode_of( runtime_path ), \
+        oct( __mode_of( runtime_path ) )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_SYMBOLIC_LINK_REFUSED( ):
+    """ Is a symbolic link refused as the runtime directory? """
+
+    from utilia.filesystem.stdpath._INTERNAL_ import UndeterminedPathError
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        standard_path, context = __make_standard_path( root_path )
+        target_path = _join_path( root_path, "elsewhere" )
+        os.mkdir( target_path, 0o700 )
+        os.makedirs( _join_path( root_path, "run", "Acme" ) )
+        os.symlink(
+            target_path, _join_path( root_path, "run", "Acme", "Foo" )
+        )
+
+        try: standard_path.socket_path( "control", context )
+        except UndeterminedPathError: pass
+        else: assert False, "Expected refusal of symbolic link."
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_SYSTEM_RUNTIME_DIR( ):
+    """ Is the system runtime directory accepted only, if it is private? """
+
+    import utilia.filesystem.stdpath.facts as facts_module
+    from utilia.filesystem.stdpath.facts import PlatformFacts
+
+    def determine( user_uid ):
+        return PlatformFacts(
+            fs_layout = "POSIX", user_uid = user_uid
+        ).system_runtime_dir
+
+    user_uid = os.getuid( )
+    root_path = tempfile.mkdtemp( )
+    path_format = facts_module._SYSTEM_RUNTIME_DIR_FORMAT
+    try:
+        facts_module._SYSTEM_RUNTIME_DIR_FORMAT = \
+        _join_path( root_path, "{0}" )
+        runtime_path = _join_path( root_path, str( user_uid ) )
+
+        assert None is determine( user_uid )
+        os.mkdir( runtime_path, 0o700 )
+        assert runtime_path == determine( user_uid )
+        assert None is PlatformFacts(
+            fs_layout = "Windows", user_uid = user_uid
+        ).system_runtime_dir
+
+        # Note: Owned by the user with the ID in the path only.
+        other_path = _join_path( root_path, str( user_uid + 1 ) )
+        os.rename( runtime_path, other_path )
+        assert None is determine( user_uid + 1 )
+        os.rename( other_path, runtime_path )
+
+        os.chmod( runtime_path, 0o750 )
+        assert None is determine( user_uid )
+        os.chmod( runtime_path, 0o700 )
+
+        target_path = _join_path( root_path, "elsewhere" )
+        os.rename( runtime_path, target_path )
+        os.symlink( target_path, runtime_path )
+        assert None is determine( user_uid )
+    finally:
+        facts_module._SYSTEM_RUNTIME_DIR_FORMAT = path_format
+        shutil.rmtree( root_path )
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
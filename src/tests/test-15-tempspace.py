@@ -0,0 +1,333 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Is the scratch tree created upon first use, with its shard
+      directories, under the base path?
+
+    * Are the files and directories handed out unique and private to the
+      current user?
+
+    * Is the directory pool refilled in batches?
+
+    * Is memory-backed storage chosen only, if it has enough free space, and
+      is the scratch tree put under the specific path there?
+
+    * Does a forked child process create a fresh tree and leave the tree of
+      its parent alone?
+
+    * Is the scratch tree removed on cleanup and recreated upon next use?
+
+    * Are the remaining scratch trees of the process removed at exit?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import os
+import stat
+import shutil
+import tempfile
+from os.path import (
+    basename                as _basename_of_path,
+    dirname                 as _dirname_of_path,
+    isdir                   as _is_directory,
+    join                    as _join_path,
+)
+
+
+def __mode_of( path ):
+    """
+        Returns the permission bits of a path.
+    """
+
+    return stat.S_IMODE( os.lstat( path ).st_mode )
+
+
+def __call_with_memory_path( memory_path, function, *args ):
+    """
+        Calls a function with a fake memory-backed directory.
+    """
+
+    import utilia.filesystem.tempspace as tempspace
+
+    original_path = tempspace.MEMORY_BACKED_PATH
+    tempspace.MEMORY_BACKED_PATH = memory_path
+    try:
+        return function( *args )
+    finally:
+        tempspace.MEMORY_BACKED_PATH = original_path
+
+
+def test_TREE_CREATION( ):
+    """ Is the scratch tree created upon first use under the base path? """
+
+    from utilia.filesystem.tempspace import TempSpace
+
+    base_path = tempfile.mkdtemp( )
+    try:
+        temp_space = TempSpace( base_path = base_path, shard_count = 4 )
+        assert not os.listdir( base_path )
+
+        root = temp_space.root
+        assert base_path == _dirname_of_path( root ), root
+        assert _basename_of_path( root ).startswith(
+            "scratch-{0}-".format( os.getpid( ) )
+        ), root
+        assert [ "00", "01", "02", "03", ] == sorted( os.listdir( root ) )
+        assert root == temp_space.root
+    finally:
+        shutil.rmtree( base_path )
+
+
+def test_INVALID_ARGUMENTS( ):
+    """ Are shard counts and pool sizes less than one rejected? """
+
+    from utilia.filesystem.tempspace import TempSpace
+
+    for kwargs in ( dict( shard_count = 0 ), dict( pool_size = 0 ), ):
+        try: TempSpace( **kwargs )
+        except ValueError: pass
+        else: assert False, "Expected rejection of {0!r}.".format( kwargs )
+
+
+def test_UNIQUE_PRIVATE_ENTRIES( ):
+    """ Are the files and directories handed out unique and private? """
+
+    from utilia.filesystem.tempspace import TempSpace
+
+    base_path = tempfile.mkdtemp( )
+    try:
+        temp_space = TempSpace( base_path = base_path, shard_count = 4 )
+        root = temp_space.root
+
+        file_paths = [ temp_space.new_file_path( ".txt" ) for i in range( 8 ) ]
+        assert 8 == len( set( file_paths ) )
+        for the_path in file_paths:
+            assert the_path.endswith( ".txt" ), the_path
+            assert root == _dirname_of_path( _dirname_of_path( the_path ) )
+            assert not os.path.exists( the_path ), the_path
+        assert 4 == len( set( map( _dirname_of_path, file_paths ) ) )
+
+        with temp_space.new_file( ) as temp_file:
+            temp_file.write( b"data" )
+            mode = stat.S_IMODE( os.fstat( temp_file.fileno( ) ).st_mode )
+            assert 0o600 == mode, oct( mode )
+
+        directory_paths = [ temp_space.new_directory( ) for i in range( 8 ) ]
+        assert 8 == len( set( directory_paths ) )
+        for the_path in directory_paths:
+            assert not os.listdir( the_path ), the_path
+            assert 0o700 == __mode_of( the_path ), oct( __mode_of( the_path ) )
+        assert not set( file_paths ) & set( directory_paths )
+    finally:
+        shutil.rmtree( base_path )
+
+
+def __count_pooled_directories( root ):
+    """
+        Returns the number of directories, which have been created in the
+        shard directories of a scratch tree.
+    """
+
+    return sum( [
+        len( os.listdir( _join_path( root, shard ) ) )
+        for shard in os.listdir( root )
+    ] )
+
+
+def test_DIRECTORY_POOL( ):
+    """ Is the directory pool refilled in batches? """
+
+    from utilia.filesystem.tempspace import TempSpace
+
+    base_path = tempfile.mkdtemp( )
+    try:
+        temp_space = TempSpace(
+            base_path = base_path, shard_count = 2, pool_size = 3
+        )
+        root = temp_space.root
+        assert 0 == __count_pooled_directories( root )
+
+        temp_space.new_directory( )
+        assert 3 == __count_pooled_directories( root )
+        temp_space.new_directory( )
+        temp_space.new_directory( )
+        assert 3 == __count_pooled_directories( root )
+        temp_space.new_directory( )
+        assert 6 == __count_pooled_directories( root )
+    finally:
+        shutil.rmtree( base_path )
+
+
+def test_MEMORY_BACKED_STORAGE( ):
+    """ Is memory-backed storage chosen only, if it has enough space? """
+
+    from utilia.filesystem.tempspace import TempSpace
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        base_path = _join_path( root_path, "base" )
+        memory_path = _join_path( root_path, "shm" )
+        os.mkdir( memory_path )
+
+        def choose( **kwargs ):
+            return TempSpace( base_path = base_path, **kwargs ) \
+            .choose_base_path( )
+
+        # Note: The fake memory-backed directory is missing.
+        assert base_path == __call_with_memory_path(
+            _join_path( root_path, "missing" ), choose
+        )
+        assert base_path == __call_with_memory_path(
+            memory_path, lambda: choose( minimum_free_space = 0 )
+        )
+        assert memory_path == __call_with_memory_path(
+            memory_path,
+            lambda: choose( prefer_memory = True, minimum_free_space = 0 )
+        )
+        assert base_path == __call_with_memory_path(
+            memory_path,
+            lambda: choose(
+                prefer_memory = True, minimum_free_space = 2 ** 80
+            )
+        )
+
+        temp_space = TempSpace(
+            specific_path = _join_path( "Acme", "Foo" ), base_path = base_path,
+            prefer_memory = True, minimum_free_space = 0
+        )
+        root = __call_with_memory_path(
+            memory_path, lambda: temp_space.root
+        )
+        assert _join_path( memory_path, "Acme", "Foo" ) \
+        == _dirname_of_path( root ), root
+        assert not os.path.exists( base_path )
+        temp_space.cleanup( )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_FORKED_CHILD( ):
+    """ Does a forked child create a fresh tree and leave its parent's? """
+
+    from utilia.filesystem.tempspace import TempSpace
+
+    base_path = tempfile.mkdtemp( )
+    try:
+        temp_space = TempSpace( base_path = base_path )
+        parent_root = temp_space.root
+
+        read_fd, write_fd = os.pipe( )
+        child_pid = os.fork( )
+        if 0 == child_pid:
+            status = 1
+            try:
+                os.close( read_fd )
+                child_root = temp_space.root
+                fresh = _basename_of_path( child_root ).startswith(
+                    "scratch-{0}-".format( os.getpid( ) )
+                )
+                temp_space.cleanup( )
+                if      fresh and _is_directory( parent_root ) \
+                    and not os.path.exists( child_root ):
+                    status = 0
+            finally:
+                os._exit( status )
+
+        os.close( write_fd )
+        os.close( read_fd )
+        status = os.waitpid( child_pid, 0 )[ 1 ]
+        assert 0 == status, status
+        assert _is_directory( parent_root )
+        assert parent_root == temp_space.root
+        assert [ _basename_of_path( parent_root ) ] == os.listdir( base_path )
+    finally:
+        shutil.rmtree( base_path )
+
+
+def test_CLEANUP( ):
+    """ Is the scratch tree removed on cleanup and recreated upon use? """
+
+    from utilia.filesystem.tempspace import (
+        TempSpace,
+        _scratch_roots,
+    )
+
+    base_path = tempfile.mkdtemp( )
+    try:
+        temp_space = TempSpace( base_path = base_path )
+        root = temp_space.root
+        temp_space.new_directory( )
+        assert root in _scratch_roots
+
+        temp_space.cleanup( )
+        assert not os.path.exists( root )
+        assert root not in _scratch_roots
+        assert not os.listdir( base_path )
+
+        new_root = _dirname_of_path(
+            _dirname_of_path( temp_space.new_file_path( ) )
+        )
+        assert _is_directory( new_root ) and (root != new_root), new_root
+        temp_space.cleanup( )
+
+        with TempSpace( base_path = base_path ) as temp_space:
+            root = temp_space.root
+            assert _is_directory( root )
+        assert not os.path.exists( root )
+    finally:
+        shutil.rmtree( base_path )
+
+
+def test_EXIT_REMOVAL( ):
+    """ Are the remaining scratch trees of the process removed at exit? """
+
+    from utilia.filesystem.tempspace import (
+        TempSpace,
+        _scratch_roots,
+        _remove_scratch_trees,
+    )
+
+    base_path = tempfile.mkdtemp( )
+    try:
+        roots = [
+            TempSpace( base_path = base_path ).root for i in range( 3 )
+        ]
+        # Note: A tree, which belongs to another process, is left alone.
+        foreign_root = _join_path( base_path, "foreign" )
+        os.mkdir( foreign_root )
+        _scratch_roots[ foreign_root ] = os.getpid( ) + 1
+
+        _remove_scratch_trees( )
+        for root in roots: assert not os.path.exists( root ), root
+        assert [ "foreign" ] == os.listdir( base_path )
+        assert not _scratch_roots
+    finally:
+        shutil.rmtree( base_path )
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
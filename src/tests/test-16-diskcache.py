@@ -0,0 +1,156 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Are entries stored, retrieved, and deleted?
+
+    * Are the least recently used entries evicted, when the cache exceeds
+      its bounds on size or on number of entries?
+
+    * Is the recency of the entries recovered from a scan of the disk?
+
+    * Is a cache without a directory or a software name refused?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import os
+import shutil
+import tempfile
+
+
+def test_STORE_AND_RETRIEVE( ):
+    """ Are entries stored, retrieved, and deleted? """
+
+    from utilia.filesystem.diskcache import DiskCache
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        cache = DiskCache( root_path )
+        cache.set( "foo", b"spam" )
+
+        assert "foo" in cache
+        assert b"spam" == cache.get( "foo" )
+        assert None is cache.get( "bar" )
+        assert b"eggs" == cache.get_or_compute( "bar", lambda: b"eggs" )
+        assert 2 == len( cache )
+        assert 8 == cache.total_size, cache.total_size
+        # Note: Another cache on the same directory finds the entries.
+        assert b"spam" == DiskCache( root_path ).get( "foo" )
+
+        cache.delete( "foo" )
+        assert "foo" not in cache
+        cache.clear( )
+        assert 0 == len( cache )
+        assert 0 == cache.total_size
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_SIZE_EVICTION( ):
+    """ Are the least recently used entries evicted by size? """
+
+    from utilia.filesystem.diskcache import DiskCache
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        cache = DiskCache( root_path, max_size = 250 )
+        cache.set( "a", b"a" * 100 )
+        cache.set( "b", b"b" * 100 )
+        cache.get( "a" )
+        cache.set( "c", b"c" * 100 )
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert 200 == cache.total_size, cache.total_size
+
+        # Note: The most recently stored entry is kept, even if too large.
+        cache.set( "d", b"d" * 1000 )
+        assert [ False, False, False, True, ] \
+        == [ key in cache for key in ( "a", "b", "c", "d", ) ]
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_COUNT_EVICTION( ):
+    """ Are the least recently used entries evicted by number? """
+
+    from utilia.filesystem.diskcache import DiskCache
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        cache = DiskCache( root_path, max_size = None, max_entries = 2 )
+        for key in ( "a", "b", "c", ):
+            cache.set( key, key.encode( "ascii" ) )
+
+        assert 2 == len( cache )
+        assert "a" not in cache
+        assert b"c" == cache.get( "c" )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_RECENCY_FROM_DISK( ):
+    """ Is the recency of the entries recovered from a scan? """
+
+    from utilia.filesystem.diskcache import DiskCache
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        cache = DiskCache( root_path, max_entries = 3 )
+        for key in ( "a", "b", "c", ):
+            cache.set( key, b"x" )
+        # Note: Give the entries distinct times, oldest first.
+        for offset, key in enumerate( ( "b", "c", "a", ) ):
+            entry_path = cache._entry_path( cache._digest( key ) )
+            os.utime( entry_path, ( 1000000000 + offset, ) * 2 )
+
+        cache = DiskCache( root_path, max_entries = 3 )
+        cache.set( "d", b"x" )
+
+        assert "b" not in cache
+        assert all( [ key in cache for key in ( "a", "c", "d", ) ] )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_NO_SOFTWARE_NAME( ):
+    """ Is a cache without a directory or a software name refused? """
+
+    from utilia.filesystem.diskcache import DiskCache
+    from utilia.filesystem.stdpath import get_platform_backend
+    from utilia.filesystem.stdpath._INTERNAL_ import UndeterminedPathError
+
+    context = get_platform_backend( ).StandardPathContext( )
+    try: DiskCache( context = context ).path
+    except UndeterminedPathError: pass
+    else: assert False, "Expected UndeterminedPathError."
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -0,0 +1,259 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Are the missing directories of a layout created, parents first, and
+      the existing ones reported?
+
+    * Is the runtime directory created private to its owner?
+
+    * Are only the directories of the requested kinds created?
+
+    * Is a directory, which cannot be created, reported as failed without
+      stopping the others?
+
+    * Does the coroutine counterpart create the same directories?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import os
+import sys
+import stat
+import shutil
+import tempfile
+from os.path import (
+    isdir                   as _is_directory,
+    join                    as _join_path,
+)
+
+
+def __make_environment( root_path ):
+    """
+        Returns environment variables, which put the user directories under
+        a root directory.
+    """
+
+    return {
+        "HOME":             _join_path( root_path, "home" ),
+        "XDG_CONFIG_HOME":  _join_path( root_path, "config" ),
+        "XDG_DATA_HOME":    _join_path( root_path, "data" ),
+        "XDG_CACHE_HOME":   _join_path( root_path, "cache" ),
+        "XDG_RUNTIME_DIR":  _join_path( root_path, "run" ),
+    }
+
+
+def __call_with_environment( environment, function, *args, **kwargs ):
+    """
+        Calls a function with some environment variables temporarily
+        replaced.
+    """
+
+    saved_environment = dict( os.environ )
+    os.environ.update( environment )
+    try:
+        return function( *args, **kwargs )
+    finally:
+        os.environ.clear( )
+        os.environ.update( saved_environment )
+
+
+def __run_coroutine( coroutine ):
+    """
+        Runs a coroutine in a new event loop and returns its result.
+    """
+
+    import asyncio
+
+    loop = asyncio.new_event_loop( )
+    try:
+        return loop.run_until_complete( coroutine )
+    finally:
+        loop.close( )
+
+
+def __make_context( ):
+    """
+        Returns a POSIX context for a software product.
+    """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+
+    return get_platform_backend( "POSIX" ).StandardPathContext(
+        software_name = "foo", calculate_path = True
+    ).freeze( )
+
+
+def test_CREATION( ):
+    """ Are the missing directories created and the existing reported? """
+
+    from utilia.filesystem.stdpath import materialize_layouts
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        environment = __make_environment( root_path )
+        context = __make_context( )
+        kinds = ( "user_config", "user_resources", "temp", )
+
+        report = __call_with_environment(
+            environment, materialize_layouts,
+            context, kinds = kinds, fs_layout = "POSIX"
+        )
+
+        assert not report.failed, report.failed
+        assert not report.existing, report.existing
+        expected_paths = [
+            _join_path( root_path, "cache" ),
+            _join_path( root_path, "config" ),
+            _join_path( root_path, "data" ),
+            _join_path( root_path, "cache", "foo" ),
+            _join_path( root_path, "config", "foo" ),
+            _join_path( root_path, "data", "foo" ),
+        ]
+        assert expected_paths == report.created, report.created
+        assert all( [ _is_directory( path ) for path in expected_paths ] )
+
+        report = __call_with_environment(
+            environment, materialize_layouts,
+            [ context, context, ], kinds = kinds, fs_layout = "POSIX"
+        )
+
+        assert not report.created, report.created
+        assert sorted( expected_paths[ 3 : ] ) == report.existing, \
+        report.existing
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_PRIVATE_RUNTIME( ):
+    """ Is the runtime directory created private to its owner? """
+
+    from utilia.filesystem.stdpath import (
+        PRIVATE_MODE,
+        materialize_layouts,
+    )
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        environment = __make_environment( root_path )
+        os.mkdir( environment[ "XDG_RUNTIME_DIR" ], PRIVATE_MODE )
+
+        report = __call_with_environment(
+            environment, materialize_layouts,
+            __make_context( ), kinds = ( "runtime", ), fs_layout = "POSIX"
+        )
+
+        runtime_path = _join_path( root_path, "run", "foo" )
+        assert [ runtime_path ] == report.created, report
+        mode = stat.S_IMODE( os.stat( runtime_path ).st_mode )
+        assert PRIVATE_MODE == mode, oct( mode )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_REQUESTED_KINDS_ONLY( ):
+    """ Are only the directories of the requested kinds created? """
+
+    from utilia.filesystem.stdpath import materialize_layouts
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        environment = __make_environment( root_path )
+
+        report = __call_with_environment(
+            environment, materialize_layouts,
+            __make_context( ), kinds = ( "user_config", ), fs_layout = "POSIX"
+        )
+
+        assert not report.failed, report.failed
+        assert [ "config" ] == os.listdir( root_path ), os.listdir( root_path )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_FAILURE( ):
+    """ Is a directory, which cannot be created, reported as failed? """
+
+    from utilia.filesystem.stdpath import materialize_layouts
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        environment = __make_environment( root_path )
+        # Note: A file stands in the way of the configuration directory.
+        open( environment[ "XDG_CONFIG_HOME" ], "wb" ).close( )
+
+        report = __call_with_environment(
+            environment, materialize_layouts,
+            __make_context( ), kinds = ( "user_config", "user_resources", ),
+            fs_layout = "POSIX"
+        )
+
+        assert [ environment[ "XDG_CONFIG_HOME" ] ] \
+        == [ path for path, exc in report.failed ], report.failed
+        assert _is_directory( _join_path( root_path, "data", "foo" ) )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_COROUTINE( ):
+    """ Does the coroutine counterpart create the same directories? """
+
+    if (3, 5) > sys.version_info: return
+
+    from utilia.filesystem.stdpath import materialize_layouts
+    from utilia.filesystem.stdpath.aio import ensure_layout
+
+    kinds = ( "user_config", "user_resources", "runtime", )
+    reports = [ ]
+    for materialize in (
+        lambda: materialize_layouts(
+            __make_context( ), kinds = kinds, fs_layout = "POSIX"
+        ),
+        lambda: __run_coroutine( ensure_layout(
+            __make_context( ), kinds = kinds, fs_layout = "POSIX"
+        ) ),
+    ):
+        root_path = tempfile.mkdtemp( )
+        try:
+            environment = __make_environment( root_path )
+            report = __call_with_environment( environment, materialize )
+            reports.append( [
+                [ os.path.relpath( path, root_path ) for path in paths ]
+                for paths in ( report.created, report.existing, )
+            ] )
+            mode = stat.S_IMODE(
+                os.stat( _join_path( root_path, "run", "foo" ) ).st_mode
+            )
+            assert 0o700 == mode, oct( mode )
+        finally:
+            shutil.rmtree( root_path )
+
+    assert reports[ 0 ] == reports[ 1 ], reports
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
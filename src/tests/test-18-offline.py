@@ -0,0 +1,236 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Are the expected standard paths calculated for each filesystem layout
+      from a fixed, simulated environment?
+
+    * Are the Pythonic standard paths calculated from the simulated Python
+      installation rather than the current one?
+
+    * Are the configuration and resources directories kept apart on
+      Windows?
+
+    * Are the simulated facts derived from the simulated environment?
+
+    * Is an explicit context required?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+#: Simulated environments by filesystem layout classification.
+__ENVIRONMENTS = \
+{
+    "POSIX":    { "HOME": "/home/alice", "USER": "alice", },
+    "MacOS X":  { "HOME": "/Users/alice", "USER": "alice", },
+    "Windows":  {
+        "UserProfile":  "C:\\Users\\alice",
+        "UserName":     "alice",
+        "TEMP":         "C:\\Users\\alice\\AppData\\Local\\Temp",
+        "ProgramFiles": "C:\\Program Files",
+        "ProgramData":  "C:\\ProgramData",
+        "APPDATA":      "C:\\Users\\alice\\AppData\\Roaming",
+        "LOCALAPPDATA": "C:\\Users\\alice\\AppData\\Local",
+    },
+}
+
+#: Options of the context of the simulated software product.
+__OPTIONS = dict(
+    software_name = "Foo", software_provider_name = "Acme",
+    calculate_path = True,
+)
+
+#: Expected standard paths by filesystem layout classification.
+__EXPECTED_PATHS = \
+{
+    "POSIX":    dict(
+        temp                = "/home/alice/.cache/Acme/Foo",
+        common_config       = "/usr/local/etc/Acme/Foo",
+        common_resources    = "/usr/local/share/Acme/Foo",
+        common_programs     = "/usr/local/bin",
+        user_config         = "/home/alice/.config/Acme/Foo",
+        user_resources      = "/home/alice/.local/share/Acme/Foo",
+        saved_data          = "/home/alice/.Acme/Foo/saved_data",
+        runtime             = "/home/alice/.cache/Acme/Foo",
+    ),
+    "MacOS X":  dict(
+        temp                = "/tmp/Acme/Foo",
+        common_config       = "/Library/Preferences/Acme/Foo",
+        common_resources    = "/Library/Application Support/Acme/Foo",
+        common_programs     = "/usr/local/bin",
+        user_config         = "/Users/alice/Preferences/Acme/Foo",
+        user_resources      = "/Users/alice/Application Support/Acme/Foo",
+        saved_data          = "/Users/alice/Documents/Acme/Foo",
+        runtime             = "/tmp/Acme/Foo",
+    ),
+    "Windows":  dict(
+        temp                = "C:\\Users\\alice\\AppData\\Local\\Temp"
+                              "\\Acme\\Foo",
+        common_config       = "C:\\Program Files\\Common Files\\Acme\\Foo",
+        common_resources    = "C:\\ProgramData\\Acme\\Foo",
+        common_programs     = "C:\\Program Files\\Acme\\Foo",
+        user_config         = "C:\\Users\\alice\\AppData\\Roaming\\Acme\\Foo",
+        user_resources      = "C:\\Users\\alice\\AppData\\Local\\Acme\\Foo",
+        saved_data          = "C:\\Users\\alice\\Documents\\Acme\\Foo",
+        runtime             = "C:\\Users\\alice\\AppData\\Local\\Temp"
+                              "\\Acme\\Foo",
+    ),
+}
+
+
+def __check_paths( fs_layout ):
+    """
+        Checks the standard paths for a filesystem layout.
+    """
+
+    from utilia.filesystem.stdpath.offline import compute_standard_paths
+
+    paths = compute_standard_paths(
+        fs_layout, [ __OPTIONS ], __ENVIRONMENTS[ fs_layout ]
+    )[ 0 ]
+
+    assert __EXPECTED_PATHS[ fs_layout ] == paths._asdict( ), \
+    ( fs_layout, paths, )
+
+
+def test_PATHS( ):
+    """ Are the expected standard paths calculated for each layout? """
+
+    for fs_layout in ( "POSIX", "MacOS X", "Windows", ):
+        yield __check_paths, fs_layout
+
+
+def test_PYTHONIC_PATHS( ):
+    """ Are the Pythonic paths calculated from the simulated Python? """
+
+    from utilia.filesystem.stdpath.offline import make_offline_standard_path
+
+    options = dict( __OPTIONS, Pythonic = True )
+    del options[ "software_provider_name" ]
+
+    standard_path = make_offline_standard_path(
+        "POSIX", options, __ENVIRONMENTS[ "POSIX" ],
+        python_version = "3.9", python_prefix = "/opt/python"
+    )
+    assert "/opt/python/etc/Foo" == standard_path.whereis_common_config( )
+    assert "/opt/python/share/Foo" == standard_path.whereis_common_resources( )
+    assert "/home/alice/.local/etc/Foo" == standard_path.whereis_user_config( )
+
+    standard_path = make_offline_standard_path(
+        "POSIX",
+        dict(
+            options, strictly_Pythonic = True, Python_package_name = "foo"
+        ),
+        __ENVIRONMENTS[ "POSIX" ],
+        python_version = "3.9", python_prefix = "/opt/python"
+    )
+    assert "/home/alice/.local/lib/python3.9/site-packages/foo" \
+    == standard_path.whereis_user_config( )
+
+    standard_path = make_offline_standard_path(
+        "Windows", options, __ENVIRONMENTS[ "Windows" ],
+        python_version = "3.9", python_prefix = "C:\\Python39"
+    )
+    assert "C:\\Python39\\Foo" == standard_path.whereis_common_config( )
+    assert "C:\\Python39\\Resources\\Foo" \
+    == standard_path.whereis_common_resources( )
+    assert "C:\\Users\\alice\\AppData\\Roaming\\Python\\Config\\Foo" \
+    == standard_path.whereis_user_config( )
+    assert "C:\\Users\\alice\\AppData\\Roaming\\Python\\Resources\\Foo" \
+    == standard_path.whereis_user_resources( )
+
+
+def test_WINDOWS_CONFIG_AND_RESOURCES( ):
+    """ Are the configuration and resources kept apart on Windows? """
+
+    from utilia.filesystem.stdpath.offline import compute_standard_paths
+
+    environment = dict( __ENVIRONMENTS[ "Windows" ] )
+    # Note: Before Windows Vista, there is no "ProgramData" folder.
+    del environment[ "ProgramData" ]
+    options = dict( __OPTIONS, common_base_path = "D:\\Apps" )
+
+    paths, based_paths = compute_standard_paths(
+        "Windows", [ __OPTIONS, options ], environment
+    )
+
+    assert "C:\\Program Files\\Common Files\\Resources\\Acme\\Foo" \
+    == paths.common_resources, paths
+    assert paths.common_config != paths.common_resources, paths
+    assert "D:\\Apps\\Config\\Acme\\Foo" == based_paths.common_config
+    assert "D:\\Apps\\Resources\\Acme\\Foo" == based_paths.common_resources
+
+
+def test_FACTS( ):
+    """ Are the simulated facts derived from the simulated environment? """
+
+    from utilia.filesystem.stdpath.offline import offline_platform_facts
+
+    facts = offline_platform_facts(
+        "Windows", __ENVIRONMENTS[ "Windows" ], python_version = "3.9"
+    )
+    assert "alice" == facts.user_id
+    assert "C:\\Users\\alice" == facts.user_home
+    assert "C:\\Users\\alice\\AppData\\Roaming\\Python" == facts.user_base
+    assert "C:\\Users\\alice\\AppData\\Roaming\\Python\\Python39" \
+    "\\site-packages" == facts.user_site
+    assert 64 == facts.os_bit_width
+
+    facts = offline_platform_facts(
+        "MacOS X", __ENVIRONMENTS[ "MacOS X" ], user_base = "/opt/base"
+    )
+    assert "/Users/alice" == facts.user_home
+    assert "/opt/base" == facts.user_base
+    # Note: Without a Python version, there is no user site.
+    assert None is facts.user_site
+
+    from utilia.filesystem.stdpath import UnsupportedFilesystemLayout
+
+    try: offline_platform_facts( "Plan 9" )
+    except UnsupportedFilesystemLayout: pass
+    else: assert False, "Expected UnsupportedFilesystemLayout."
+
+
+def test_EXPLICIT_CONTEXT( ):
+    """ Is an explicit context required? """
+
+    from utilia.filesystem.stdpath.offline import (
+        compute_standard_paths,
+        make_offline_standard_path,
+    )
+
+    for calculate in (
+        lambda: make_offline_standard_path( "POSIX", None ),
+        lambda: compute_standard_paths( "POSIX", [ __OPTIONS, None, ] ),
+    ):
+        try: calculate( )
+        except ValueError: pass
+        else: assert False, "Expected ValueError without a context."
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
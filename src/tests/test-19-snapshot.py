@@ -0,0 +1,189 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Does a snapshot survive being written to and read from a file?
+
+    * Is a snapshot fresh, until a value from which its paths were
+      calculated changes?
+
+    * Are paths answered from a fresh snapshot for the recorded context
+      only, and calculated anew for other contexts or a stale snapshot?
+
+    * Are missing, malformed, and unsupported snapshot files ignored?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import os
+import json
+import shutil
+import tempfile
+from os.path import (
+    join                    as _join_path,
+)
+
+
+def __make_context( ):
+    """
+        Returns a POSIX context for a software product.
+    """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+
+    return get_platform_backend( "POSIX" ).StandardPathContext(
+        software_name = "foo", calculate_path = True
+    )
+
+
+def test_ROUND_TRIP( ):
+    """ Does a snapshot survive being written and read? """
+
+    from utilia.filesystem.stdpath.snapshot import (
+        read_path_snapshot,
+        write_path_snapshot,
+    )
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        snapshot_path = _join_path( root_path, "paths.json" )
+        written = write_path_snapshot(
+            snapshot_path, __make_context( ), "POSIX"
+        )
+        read = read_path_snapshot( snapshot_path )
+
+        assert written.to_dict( ) == read.to_dict( ), read.to_dict( )
+        assert "POSIX" == read.fs_layout
+        assert dict( software_name = "foo", calculate_path = True ) \
+        == read.context_options, read.context_options
+        assert [ "paths.json" ] == os.listdir( root_path ), \
+        os.listdir( root_path )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_FRESHNESS( ):
+    """ Is a snapshot fresh, until a value it depends on changes? """
+
+    from utilia.filesystem.stdpath.snapshot import take_path_snapshot
+
+    snapshot = take_path_snapshot( __make_context( ), "POSIX" )
+    environment = dict( os.environ )
+
+    assert snapshot.is_fresh( )
+    assert snapshot.is_fresh( environment )
+    for evname in ( "XDG_CONFIG_HOME", "HOME", "USER", ):
+        assert evname in snapshot.environment_variable_names, evname
+        changed_environment = dict( environment )
+        changed_environment[ evname ] = "/elsewhere"
+        assert not snapshot.is_fresh( changed_environment ), evname
+    # Note: Unrelated variables do not affect the paths.
+    environment[ "UNRELATED" ] = "1"
+    assert snapshot.is_fresh( environment )
+
+
+def test_ANSWERS( ):
+    """ Are paths answered from a fresh snapshot only? """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+    from utilia.filesystem.stdpath.snapshot import (
+        SnapshotStandardPath,
+        load_standard_path,
+        take_path_snapshot,
+    )
+
+    backend = get_platform_backend( "POSIX" )
+    root_path = tempfile.mkdtemp( )
+    try:
+        snapshot_path = _join_path( root_path, "paths.json" )
+        snapshot = take_path_snapshot( __make_context( ), "POSIX" )
+        calculated_path = snapshot.paths[ "user_config" ]
+        # Note: Alter the recorded path to tell where answers come from.
+        snapshot.paths[ "user_config" ] = "/recorded"
+        with open( snapshot_path, "w" ) as snapshot_file:
+            json.dump( snapshot.to_dict( ), snapshot_file )
+
+        standard_path = load_standard_path( snapshot_path )
+        assert "/recorded" \
+        == standard_path.whereis_user_config( __make_context( ) )
+        assert "/recorded" \
+        == standard_path.resolve_all( __make_context( ) ).user_config
+        with backend.use_context( __make_context( ) ):
+            assert standard_path.is_from_snapshot
+            assert "/recorded" == standard_path.whereis_user_config( )
+            assert "/recorded" == standard_path.resolve_all( ).user_config
+
+        other_context = backend.StandardPathContext(
+            software_name = "bar", calculate_path = True
+        )
+        other_path = \
+        backend.StandardPath( ).whereis_user_config( other_context )
+        assert other_path \
+        == standard_path.whereis_user_config( other_context )
+        with backend.use_context( other_context ):
+            assert not standard_path.is_from_snapshot
+            assert other_path == standard_path.whereis_user_config( )
+            assert other_path == standard_path.resolve_all( ).user_config
+
+        snapshot.fingerprint = "stale"
+        standard_path = SnapshotStandardPath( snapshot )
+        assert calculated_path \
+        == standard_path.whereis_user_config( __make_context( ) )
+        with backend.use_context( __make_context( ) ):
+            assert not standard_path.is_from_snapshot
+            assert calculated_path == standard_path.whereis_user_config( )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_BAD_FILES( ):
+    """ Are missing, malformed, and unsupported snapshot files ignored? """
+
+    from utilia.filesystem.stdpath.snapshot import (
+        SNAPSHOT_FORMAT_VERSION,
+        read_path_snapshot,
+    )
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        snapshot_path = _join_path( root_path, "paths.json" )
+        assert None is read_path_snapshot( snapshot_path )
+        for contents in (
+            "{",
+            "[]",
+            json.dumps( dict( format = SNAPSHOT_FORMAT_VERSION + 1 ) ),
+            json.dumps( dict( format = SNAPSHOT_FORMAT_VERSION ) ),
+        ):
+            with open( snapshot_path, "w" ) as snapshot_file:
+                snapshot_file.write( contents )
+            assert None is read_path_snapshot( snapshot_path ), contents
+    finally:
+        shutil.rmtree( root_path )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
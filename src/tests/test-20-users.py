@@ -0,0 +1,161 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Are the user accounts parsed from a passwd file, with comments,
+      compatibility entries, and malformed lines skipped?
+
+    * Are user accounts filtered by their user IDs?
+
+    * Are the per-user paths the same as those calculated for each user
+      alone?
+
+    * Are paths of the current user only carried over to other users, if
+      they lie under the home directory?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import os
+import tempfile
+
+
+#: Contents of a passwd file with valid and invalid lines.
+__PASSWD_LINES = [
+    "# System accounts",
+    "root:x:0:0:root:/root:/bin/bash",
+    "daemon:x:1:1:daemon:/usr/sbin:/usr/sbin/nologin",
+    "",
+    "alice:x:1000:1000:Alice,,,:/home/alice:/bin/bash",
+    "bob:x:1001:1001::/home/bob:/bin/sh",
+    "+nisuser::::::",
+    "-excluded:x:1002:1002::/home/excluded:/bin/sh",
+    "broken:x:1003:1003:/home/broken",
+    "baduid:x:abc:1004::/home/baduid:/bin/sh",
+    "carol:x:60000:60000::/:/bin/false",
+]
+
+
+def __read_accounts( **kwargs ):
+    """
+        Returns the user accounts from a temporary passwd file.
+    """
+
+    from utilia.filesystem.stdpath.users import iter_user_accounts
+
+    fd, passwd_path = tempfile.mkstemp( )
+    try:
+        with os.fdopen( fd, "w" ) as passwd_file:
+            passwd_file.write( "\n".join( __PASSWD_LINES ) + "\n" )
+        return list( iter_user_accounts( passwd_path, **kwargs ) )
+    finally:
+        os.remove( passwd_path )
+
+
+def test_PASSWD_PARSING( ):
+    """ Are the user accounts parsed from a passwd file? """
+
+    from utilia.filesystem.stdpath.users import UserAccount
+
+    accounts = __read_accounts( )
+
+    assert [ "root", "daemon", "alice", "bob", "carol", ] \
+    == [ account.name for account in accounts ], accounts
+    assert UserAccount( "alice", 1000, 1000, "/home/alice", "/bin/bash" ) \
+    == accounts[ 2 ], accounts[ 2 ]
+
+
+def test_UID_BOUNDS( ):
+    """ Are user accounts filtered by their user IDs? """
+
+    assert [ "alice", "bob", ] == [
+        account.name
+        for account in __read_accounts( min_uid = 1000, max_uid = 59999 )
+    ]
+    assert [ "root", "daemon", ] == [
+        account.name for account in __read_accounts( max_uid = 999 )
+    ]
+
+
+def test_PER_USER_PATHS( ):
+    """ Are the per-user paths the same as those for each user alone? """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+    from utilia.filesystem.stdpath.facts import get_platform_facts
+    from utilia.filesystem.stdpath.users import (
+        DEFAULT_USER_PATH_KINDS,
+        whereis_users_paths,
+    )
+
+    backend = get_platform_backend( "POSIX" )
+    context = backend.StandardPathContext(
+        software_name = "foo", calculate_path = True
+    )
+    accounts = __read_accounts( )
+
+    users_paths = whereis_users_paths(
+        context, accounts = accounts, fs_layout = "POSIX"
+    )
+
+    assert [ account.name for account in accounts ] == list( users_paths )
+    for account in accounts:
+        standard_path = backend.StandardPath(
+            context, environment = { },
+            facts = get_platform_facts( ).with_facts(
+                user_home = account.home
+            )
+        )
+        for kind in DEFAULT_USER_PATH_KINDS:
+            expected_path = getattr( standard_path, "whereis_" + kind )( )
+            path = users_paths[ account.name ][ kind ]
+            assert expected_path == path, ( account.name, kind, path, )
+    assert "/.config/foo" == users_paths[ "carol" ][ "user_config" ]
+
+
+def test_HOME_TEMPLATES( ):
+    """ Are paths only carried over, if under the home directory? """
+
+    from utilia.filesystem.stdpath.users import (
+        _substitute_home,
+        _template_home_path,
+    )
+
+    for path, home, other_home, expected_path in (
+        ( "/home/al/.local", "/home/al", "/home/bo", "/home/bo/.local", ),
+        ( "/home/al/", "/home/al", "/home/bo", "/home/bo", ),
+        ( "/home/alice/.local", "/home/al", "/home/bo", None, ),
+        ( "/opt/python", "/home/al", "/home/bo", None, ),
+        ( "/home/al/.local", "/home/al/", "/", "/.local", ),
+        ( None, "/home/al", "/home/bo", None, ),
+    ):
+        template = _template_home_path( path, home )
+        assert expected_path == _substitute_home( template, other_home ), \
+        ( path, home, template, )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -0,0 +1,226 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Are changes in a watched directory reported once per batch, both by
+      polling and by ``inotify``?
+
+    * Are the appearance, removal, and reappearance of a watched directory
+      reported?
+
+    * Are registered caches invalidated only upon changes in their
+      directories?
+
+    * Is every watched directory reported as changed, when the kernel drops
+      events?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import os
+import shutil
+import tempfile
+from os.path import (
+    join                    as _join_path,
+)
+
+
+#: Seconds to wait for a change to be reported.
+__TIMEOUT = 2.0
+
+
+def __watch_modes( ):
+    """
+        Returns the values of the ``use_inotify`` argument of the watcher to
+        test with: polling always and ``inotify``, if available.
+    """
+
+    from utilia.filesystem.watch import DirectoryWatcher
+
+    modes = [ False ]
+    watcher = DirectoryWatcher( )
+    if watcher.uses_inotify: modes.append( True )
+    watcher.close( )
+    return modes
+
+
+def __make_file( path ):
+    """
+        Creates a file with some contents.
+    """
+
+    with open( path, "wb" ) as f: f.write( b"contents" )
+
+
+def __check_changes( use_inotify ):
+    """
+        Checks that changes in a watched directory are reported once.
+    """
+
+    from utilia.filesystem.watch import DirectoryWatcher
+
+    root_path = tempfile.mkdtemp( )
+    watcher = DirectoryWatcher( use_inotify = use_inotify )
+    try:
+        watched_path = _join_path( root_path, "watched" )
+        other_path = _join_path( root_path, "other" )
+        os.mkdir( watched_path )
+        os.mkdir( other_path )
+        watcher.add_path( watched_path )
+        reports = [ ]
+        watcher.register( reports.append )
+
+        assert not watcher.check( ), use_inotify
+        for name in ( "a", "b", "c", ):
+            __make_file( _join_path( watched_path, name ) )
+        __make_file( _join_path( other_path, "a" ) )
+
+        assert set( [ watched_path ] ) == watcher.check( __TIMEOUT ), \
+        use_inotify
+        assert [ watched_path ] == reports, ( use_inotify, reports, )
+    finally:
+        watcher.close( )
+        shutil.rmtree( root_path )
+
+
+def test_CHANGES( ):
+    """ Are changes in a watched directory reported once per batch? """
+
+    for use_inotify in __watch_modes( ):
+        yield __check_changes, use_inotify
+
+
+def __check_appearance( use_inotify ):
+    """
+        Checks that the appearance and removal of a directory are reported.
+    """
+
+    from utilia.filesystem.watch import DirectoryWatcher
+
+    root_path = tempfile.mkdtemp( )
+    watched_path = _join_path( root_path, "watched" )
+    watcher = DirectoryWatcher( [ watched_path ], use_inotify = use_inotify )
+    try:
+        assert not watcher.check( ), use_inotify
+        os.mkdir( watched_path )
+        assert set( [ watched_path ] ) == watcher.check( ), use_inotify
+
+        os.rmdir( watched_path )
+        assert set( [ watched_path ] ) == watcher.check( __TIMEOUT ), \
+        use_inotify
+        assert not watcher.check( ), use_inotify
+
+        os.mkdir( watched_path )
+        assert set( [ watched_path ] ) == watcher.check( ), use_inotify
+        __make_file( _join_path( watched_path, "a" ) )
+        assert set( [ watched_path ] ) == watcher.check( __TIMEOUT ), \
+        use_inotify
+    finally:
+        watcher.close( )
+        shutil.rmtree( root_path )
+
+
+def test_APPEARANCE( ):
+    """ Are the appearance and removal of a directory reported? """
+
+    for use_inotify in __watch_modes( ):
+        yield __check_appearance, use_inotify
+
+
+class __Cache( object ):
+    """
+        Counts its invalidations.
+    """
+
+    def __init__( self ): self.invalidations = 0
+
+    def invalidate( self ): self.invalidations += 1
+
+
+def test_CACHE_INVALIDATION( ):
+    """ Are registered caches invalidated upon relevant changes only? """
+
+    from utilia.filesystem.watch import DirectoryWatcher
+
+    root_path = tempfile.mkdtemp( )
+    watcher = DirectoryWatcher( use_inotify = False )
+    try:
+        first_path = _join_path( root_path, "first" )
+        second_path = _join_path( root_path, "second" )
+        for path in ( first_path, second_path, ):
+            os.mkdir( path )
+            watcher.add_path( path )
+        any_cache = __Cache( )
+        first_cache = __Cache( )
+        watcher.register_cache( any_cache )
+        watcher.register_cache( first_cache, [ first_path ] )
+
+        __make_file( _join_path( second_path, "a" ) )
+        watcher.check( )
+        assert 1 == any_cache.invalidations
+        assert 0 == first_cache.invalidations
+
+        __make_file( _join_path( first_path, "a" ) )
+        watcher.check( )
+        assert 2 == any_cache.invalidations
+        assert 1 == first_cache.invalidations
+
+        try: watcher.register_cache( object( ) )
+        except TypeError: pass
+        else: assert False, "Expected TypeError for an uninvalidatable cache."
+    finally:
+        watcher.close( )
+        shutil.rmtree( root_path )
+
+
+def test_QUEUE_OVERFLOW( ):
+    """ Is every watched directory reported, when events are dropped? """
+
+    from utilia.filesystem.watch import (
+        DirectoryWatcher,
+        _EVENT_HEADER,
+        _IN_Q_OVERFLOW,
+    )
+
+    # Note: A pipe stands in for the 'inotify' instance, so that the
+    #       overflow event can be delivered on demand.
+    read_fd, write_fd = os.pipe( )
+    watcher = DirectoryWatcher( use_inotify = False )
+    try:
+        watcher._fd = read_fd
+        watcher._paths.update( [ "/first", "/second", ] )
+        watcher._watch_descriptors.update( { 1: "/first", 2: "/second", } )
+        os.write( write_fd, _EVENT_HEADER.pack( -1, _IN_Q_OVERFLOW, 0, 0 ) )
+
+        assert set( [ "/first", "/second", ] ) == watcher.check( __TIMEOUT )
+    finally:
+        watcher.close( )
+        os.close( write_fd )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
@@ -0,0 +1,184 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Does a snapshot hold the recorded values until refreshed?
+
+    * Is the version incremented only when a refresh finds changed values?
+
+    * Are the changes since a version told apart by variable?
+
+    * Are callbacks called with the names of the changed variables?
+
+    * Are derived values recomputed only after their variables change?
+
+    * Do standard paths follow a snapshot of the environment?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+def test_RECORDED_VALUES( ):
+    """ Does a snapshot hold the recorded values until refreshed? """
+
+    from utilia.os.environment import EnvironmentSnapshot
+
+    environment = { "FOO": "1", "UNTRACKED": "2", }
+    snapshot = EnvironmentSnapshot( [ "FOO", "BAR", ], environment )
+
+    assert { "FOO": "1", } == dict( snapshot ), dict( snapshot )
+    assert "BAR" not in snapshot
+    assert frozenset( [ "FOO", "BAR", ] ) == snapshot.names
+    environment[ "FOO" ] = "3"
+    assert "1" == snapshot[ "FOO" ]
+    snapshot.refresh( )
+    assert "3" == snapshot[ "FOO" ]
+
+
+def test_VERSIONING( ):
+    """ Is the version incremented only when values change? """
+
+    from utilia.os.environment import EnvironmentSnapshot
+
+    environment = { "FOO": "1", }
+    snapshot = EnvironmentSnapshot( [ "FOO", "BAR", ], environment )
+    version = snapshot.version
+
+    environment[ "UNTRACKED" ] = "1"
+    assert frozenset( ) == snapshot.refresh( )
+    assert version == snapshot.version
+
+    environment[ "BAR" ] = "2"
+    del environment[ "FOO" ]
+    assert frozenset( [ "FOO", "BAR", ] ) == snapshot.refresh( )
+    assert version + 1 == snapshot.version
+    assert { "BAR": "2", } == dict( snapshot ), dict( snapshot )
+
+    assert frozenset( ) == snapshot.refresh( )
+    assert version + 1 == snapshot.version
+
+
+def test_CHANGED_SINCE( ):
+    """ Are the changes since a version told apart by variable? """
+
+    from utilia.os.environment import EnvironmentSnapshot
+
+    environment = { "FOO": "1", "BAR": "1", }
+    snapshot = EnvironmentSnapshot( [ "FOO", "BAR", ], environment )
+    version = snapshot.version
+
+    environment[ "FOO" ] = "2"
+    snapshot.refresh( )
+
+    assert snapshot.changed_since( version )
+    assert snapshot.changed_since( version, [ "FOO", ] )
+    assert not snapshot.changed_since( version, [ "BAR", ] )
+    assert not snapshot.changed_since( snapshot.version )
+    # Note: Variables, which are tracked later, count as changed.
+    snapshot.track( "BAZ" )
+    assert snapshot.changed_since( version, [ "BAZ", ] )
+    assert not snapshot.changed_since( snapshot.version, [ "BAZ", ] )
+
+
+def test_CALLBACKS( ):
+    """ Are callbacks called with the names of the changed variables? """
+
+    from utilia.os.environment import EnvironmentSnapshot
+
+    environment = { "FOO": "1", }
+    snapshot = EnvironmentSnapshot( [ "FOO", ], environment )
+    reports = [ ]
+    snapshot.register( reports.append )
+
+    snapshot.refresh( )
+    environment[ "FOO" ] = "2"
+    snapshot.refresh( )
+
+    assert [ frozenset( [ "FOO", ] ) ] == reports, reports
+
+
+def test_DERIVED_VALUES( ):
+    """ Are derived values recomputed only after their variables change? """
+
+    from utilia.os.environment import EnvironmentSnapshot
+
+    environment = { "FOO": "1", "BAR": "1", }
+    snapshot = EnvironmentSnapshot( [ "BAR", ], environment )
+    computations = [ ]
+
+    def compute( ):
+        """ Records and returns the value of a variable. """
+        computations.append( snapshot.get( "FOO" ) )
+        return snapshot.get( "FOO" )
+
+    get_value = snapshot.derive( compute, [ "FOO", ] )
+    assert "1" == get_value( )
+    assert "1" == get_value( )
+    assert [ "1", ] == computations, computations
+
+    environment[ "BAR" ] = "2"
+    snapshot.refresh( )
+    assert "1" == get_value( )
+    assert [ "1", ] == computations, computations
+
+    environment[ "FOO" ] = "2"
+    snapshot.refresh( )
+    assert "2" == get_value( )
+    assert [ "1", "2", ] == computations, computations
+
+
+def test_STANDARD_PATHS( ):
+    """ Do standard paths follow a snapshot of the environment? """
+
+    import os
+    from utilia.filesystem.stdpath import (
+        get_platform_backend,
+        snapshot_environment,
+    )
+    from utilia.os.environment import EnvironmentSnapshot
+
+    backend = get_platform_backend( "POSIX" )
+    snapshot = snapshot_environment( "POSIX" )
+    assert "XDG_CONFIG_HOME" in snapshot.names, snapshot.names
+    assert os.environ.get( "XDG_CONFIG_HOME" ) \
+    == snapshot.get( "XDG_CONFIG_HOME" )
+
+    variables = { "XDG_CONFIG_HOME": "/x/config", }
+    snapshot = EnvironmentSnapshot( snapshot.names, variables )
+    standard_path = backend.StandardPath( environment = snapshot )
+    context = backend.StandardPathContext(
+        software_name = "foo", calculate_path = True
+    )
+
+    assert "/x/config/foo" == standard_path.whereis_user_config( context )
+    variables[ "XDG_CONFIG_HOME" ] = "/y/config"
+    assert "/x/config/foo" == standard_path.whereis_user_config( context )
+    snapshot.refresh( )
+    assert "/y/config/foo" == standard_path.whereis_user_config( context )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
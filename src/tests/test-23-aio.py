@@ -0,0 +1,168 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Are only the standard paths, at which directories exist, resolved?
+
+    * Do concurrent identical calls share one run?
+
+    * Are different calls run separately?
+
+    * Is the record of a batched run removed, once the run is over?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import os
+import shutil
+import tempfile
+import threading
+from os.path import (
+    join                    as _join_path,
+)
+
+
+class __CountingFunction( object ):
+    """
+        Blocking function, which counts its runs.
+    """
+
+
+    def __init__( self ):
+        self.runs = 0
+        self._lock = threading.Lock( )
+
+
+    def __call__( self, value ):
+        with self._lock: self.runs += 1
+        return value * 2
+
+
+def __run( *coroutines ):
+    """
+        Runs coroutines concurrently in a new event loop and returns their
+        results.
+    """
+
+    import asyncio
+
+    loop = asyncio.new_event_loop( )
+    try:
+        tasks = [ loop.create_task( coroutine ) for coroutine in coroutines ]
+        loop.run_until_complete( asyncio.wait( tasks ) )
+        return [ task.result( ) for task in tasks ]
+    finally:
+        loop.close( )
+
+
+def test_RESOLVE_EXISTING( ):
+    """ Are only the paths, at which directories exist, resolved? """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+    from utilia.filesystem.stdpath.aio import (
+        BatchingExecutor,
+        resolve_existing,
+    )
+
+    root_path = tempfile.mkdtemp( )
+    executor = BatchingExecutor( max_workers = 2 )
+    try:
+        context = get_platform_backend( "POSIX" ).StandardPathContext(
+            software_name = "foo", calculate_path = True,
+            user_base_path = root_path
+        )
+        config_path = _join_path( root_path, "etc", "foo" )
+        os.makedirs( config_path )
+
+        paths, = __run( resolve_existing(
+            context, kinds = ( "user_config", "user_resources", ),
+            fs_layout = "POSIX", executor = executor
+        ) )
+        assert [ "user_config", "user_resources", ] == list( paths ), paths
+        assert config_path == paths[ "user_config" ], paths
+        assert None is paths[ "user_resources" ], paths
+    finally:
+        executor.shutdown( )
+        shutil.rmtree( root_path )
+
+
+def test_BATCHING( ):
+    """ Do concurrent identical calls share one run? """
+
+    from utilia.filesystem.stdpath.aio import BatchingExecutor
+
+    function = __CountingFunction( )
+    executor = BatchingExecutor( max_workers = 2 )
+    try:
+        results = \
+        __run( *[ executor.run( function, 21 ) for i in range( 5 ) ] )
+        assert [ 42 ] * 5 == results, results
+        assert 1 == function.runs, function.runs
+        assert not executor._in_flight, executor._in_flight
+
+        # Note: A later call runs anew.
+        assert [ 42 ] == __run( executor.run( function, 21 ) )
+        assert 2 == function.runs, function.runs
+    finally:
+        executor.shutdown( )
+
+
+def test_DIFFERENT_CALLS( ):
+    """ Are different calls run separately? """
+
+    from utilia.filesystem.stdpath.aio import BatchingExecutor
+
+    function = __CountingFunction( )
+    executor = BatchingExecutor( max_workers = 2 )
+    try:
+        results = __run(
+            executor.run( function, 1 ), executor.run( function, 2 ),
+            executor.run( function, 1 )
+        )
+        assert [ 2, 4, 2, ] == results, results
+        assert 2 == function.runs, function.runs
+        assert not executor._in_flight, executor._in_flight
+    finally:
+        executor.shutdown( )
+
+
+def test_FAILED_RUN( ):
+    """ Is the record of a failed run removed, once the run is over? """
+
+    from utilia.filesystem.stdpath.aio import BatchingExecutor
+
+    executor = BatchingExecutor( max_workers = 1 )
+    try:
+        try: __run( executor.run( os.listdir, "/nonexistent/utilia" ) )
+        except OSError: pass
+        else: assert False, "Expected OSError."
+        assert not executor._in_flight, executor._in_flight
+    finally:
+        executor.shutdown( )
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
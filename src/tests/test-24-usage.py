@@ -0,0 +1,270 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Is a tree, which is nested in another measured tree, counted once?
+
+    * Are the standard directories, which are shared by several tenants or
+      nested in one another, counted once in the totals?
+
+    * Is a file, which is hard linked from several trees, counted once?
+
+    * Do accountings with a usage cache, saved and loaded again, see the
+      same usage and later changes?
+
+    * Are the nested trees among many thousands of paths found quickly?
+
+    * Is an unexpected error in the measurement of a tree reported as a
+      failure, rather than as its usage?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import os
+import shutil
+import tempfile
+from os.path import (
+    join                    as _join_path,
+)
+
+
+def __make_file( path, size ):
+    """
+        Creates a file of the given size, along with its parent directories.
+    """
+
+    parent_path = os.path.dirname( path )
+    if not os.path.isdir( parent_path ): os.makedirs( parent_path )
+    with open( path, "wb" ) as f: f.write( b"\0" * size )
+
+
+def test_NESTED_TREES( ):
+    """ Is a tree, which is nested in another measured tree, counted once? """
+
+    from utilia.filesystem.usage import measure_usage
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        nested_path = _join_path( root_path, ".config", "foo" )
+        __make_file( _join_path( nested_path, "settings" ), 100000 )
+        __make_file( _join_path( root_path, "notes" ), 1000 )
+
+        usages, failed = measure_usage(
+            [ nested_path, root_path ], apparent_size = True
+        )
+
+        assert not failed, failed
+        assert 101000 == usages[ root_path ].size, usages
+        assert 2 == usages[ root_path ].file_count, usages
+        assert 100000 == usages[ nested_path ].size, usages
+        assert 1 == usages[ nested_path ].file_count, usages
+    finally:
+        shutil.rmtree( root_path )
+
+
+def __measure_with_environment( tenants, environment ):
+    """
+        Measures the standard usage of tenants with some environment
+        variables temporarily replaced.
+    """
+
+    from utilia.filesystem.usage import measure_standard_usage
+
+    saved_environment = dict( os.environ )
+    os.environ.update( environment )
+    try:
+        return measure_standard_usage(
+            tenants,
+            kinds = ( "user_config", "user_resources", ),
+            fs_layout = "POSIX", apparent_size = True
+        )
+    finally:
+        os.environ.clear( )
+        os.environ.update( saved_environment )
+
+
+def test_SHARED_AND_NESTED_DIRECTORIES( ):
+    """ Are shared and nested standard directories counted once? """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+
+    backend = get_platform_backend( "POSIX" )
+    root_path = tempfile.mkdtemp( )
+    try:
+        config_home = _join_path( root_path, "config" )
+        # Note: The data directory of 'foo' lies in its config directory.
+        data_home = _join_path( config_home, "foo", "data" )
+        __make_file( _join_path( config_home, "foo", "settings" ), 1000 )
+        __make_file( _join_path( data_home, "foo", "table" ), 100000 )
+
+        context = backend.StandardPathContext(
+            software_name = "foo", calculate_path = True
+        ).freeze( )
+        report = __measure_with_environment(
+            { "first": context, "second": context, },
+            { "XDG_CONFIG_HOME": config_home, "XDG_DATA_HOME": data_home, }
+        )
+
+        assert not report.failed, report.failed
+        for tenant in ( "first", "second", ):
+            usages = report.tenants[ tenant ]
+            assert 101000 == usages[ "user_config" ].size, usages
+            assert 100000 == usages[ "user_resources" ].size, usages
+        assert 101000 == report.kinds[ "user_config" ].size, report.kinds
+        assert 100000 == report.kinds[ "user_resources" ].size, report.kinds
+        assert 101000 == report.total.size, report.total
+        assert 2 == report.total.file_count, report.total
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_HARD_LINKS( ):
+    """ Is a file, which is hard linked from several trees, counted once? """
+
+    from utilia.filesystem.usage import measure_usage
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        first_path = _join_path( root_path, "first" )
+        second_path = _join_path( root_path, "second" )
+        __make_file( _join_path( first_path, "table" ), 100000 )
+        os.mkdir( second_path )
+        os.link(
+            _join_path( first_path, "table" ),
+            _join_path( second_path, "table" )
+        )
+        __make_file( _join_path( second_path, "notes" ), 1000 )
+
+        usages, failed = measure_usage(
+            [ first_path, second_path ], apparent_size = True
+        )
+
+        assert not failed, failed
+        # Note: The linked file is counted in whichever tree comes first.
+        assert 101000 == sum( [
+            usage.size for usage in usages.values( )
+        ] ), usages
+        assert 2 == sum( [
+            usage.file_count for usage in usages.values( )
+        ] ), usages
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_USAGE_CACHE( ):
+    """ Do accountings with a usage cache see the same usage? """
+
+    from utilia.filesystem.usage import (
+        UsageCache,
+        measure_usage,
+    )
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        tree_path = _join_path( root_path, "tree" )
+        cache_path = _join_path( root_path, "usage.json" )
+        __make_file( _join_path( tree_path, "a", "table" ), 100000 )
+        __make_file( _join_path( tree_path, "notes" ), 1000 )
+
+        cache = UsageCache( cache_path, apparent_size = True )
+        usages, failed = measure_usage(
+            [ tree_path ], cache = cache, apparent_size = True
+        )
+        assert not failed, failed
+        cache.save( )
+
+        cache = UsageCache( cache_path, apparent_size = True )
+        assert len( cache ), cache
+        cached_usages, failed = measure_usage(
+            [ tree_path ], cache = cache, apparent_size = True
+        )
+        assert not failed, failed
+        assert usages == cached_usages, cached_usages
+
+        __make_file( _join_path( tree_path, "a", "more" ), 10 )
+        usages, failed = measure_usage(
+            [ tree_path ], cache = cache, apparent_size = True
+        )
+        assert 101010 == usages[ tree_path ].size, usages
+        assert 3 == usages[ tree_path ].file_count, usages
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_MANY_NESTED_PATHS( ):
+    """ Are the nested trees among many paths found quickly? """
+
+    import time
+    from utilia.filesystem.usage import _find_nested_paths
+
+    paths = [
+        _join_path( os.sep, "home", "u{0}".format( user ), kind )
+        for user in range( 10000 ) for kind in ( "a", "b", "c", "d", )
+    ]
+    home_path = _join_path( os.sep, "home", "u5" )
+    paths.append( home_path )
+
+    started_at = time.time( )
+    nested_paths = _find_nested_paths( paths )
+    elapsed_time = time.time( ) - started_at
+
+    assert 5 == len( nested_paths[ home_path ] ), nested_paths[ home_path ]
+    assert [ paths[ 0 ] ] == nested_paths[ paths[ 0 ] ]
+    # Note: Comparing every pair of paths takes minutes.
+    assert 10 > elapsed_time, elapsed_time
+
+
+class __FaultyCache( object ):
+    """
+        Usage cache, which fails unexpectedly upon lookup.
+    """
+
+    apparent_size = True
+
+    def lookup( self, path, mtime ): raise RuntimeError( path )
+
+
+def test_UNEXPECTED_ERRORS( ):
+    """ Is an unexpected error reported as a failure? """
+
+    from utilia.filesystem.usage import measure_usage
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        usages, failed = measure_usage(
+            [ root_path ], cache = __FaultyCache( ), apparent_size = True
+        )
+
+        assert [ root_path ] == [ path for path, exc in failed ], failed
+        assert isinstance( failed[ 0 ][ 1 ], RuntimeError ), failed
+        assert 0 == usages[ root_path ].size, usages
+    finally:
+        shutil.rmtree( root_path )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #
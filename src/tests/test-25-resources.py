@@ -0,0 +1,196 @@
+###############################################################################
+#                                  utilia                                     #
+#-----------------------------------------------------------------------------#
+#                                                                             #
+#   Licensed under the Apache License, Version 2.0 (the "License");           #
+#   you may not use this file except in compliance with the License.          #
+#   You may obtain a copy of the License at                                   #
+#                                                                             #
+#       http://www.apache.org/licenses/LICENSE-2.0                            #
+#                                                                             #
+#   Unless required by applicable law or agreed to in writing, software       #
+#   distributed under the License is distributed on an "AS IS" BASIS,         #
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.  #
+#   See the License for the specific language governing permissions and       #
+#   limitations under the License.                                            #
+#                                                                             #
+###############################################################################
+
+"""
+    Implements the following tests:
+
+    * Are resources found in the user directory before the common one?
+
+    * Are the mappings of resources shared between accesses and replaced,
+      when their files change?
+
+    * Are the least recently used mappings evicted from a full pool, and
+      closed only once their views are released?
+
+    * Are missing resources and invalid names rejected?
+"""
+
+
+# Note: Future imports must go before other imports.
+from __future__ import (
+    division                as __FUTURE_division,
+    absolute_import         as __FUTURE_absolute_import,
+    print_function          as __FUTURE_print_function,
+) # Assumes Python version >= 2.6.
+
+
+import os
+import errno
+import shutil
+import tempfile
+from os.path import (
+    join                    as _join_path,
+)
+
+
+def __make_file( path, contents ):
+    """
+        Creates a file with the given contents, along with its parent
+        directories.
+    """
+
+    parent_path = os.path.dirname( path )
+    if not os.path.isdir( parent_path ): os.makedirs( parent_path )
+    with open( path, "wb" ) as f: f.write( contents )
+
+
+def __make_locator( root_path, max_open = 16 ):
+    """
+        Returns a resource locator, which searches user and common resource
+        directories under a root directory, and the paths to those
+        directories.
+    """
+
+    from utilia.filesystem.stdpath import get_platform_backend
+    from utilia.filesystem.stdpath.resources import ResourceLocator
+
+    context = get_platform_backend( "POSIX" ).StandardPathContext(
+        software_name = "foo", calculate_path = True,
+        user_base_path = _join_path( root_path, "user" ),
+        common_base_path = _join_path( root_path, "common" )
+    )
+    return (
+        ResourceLocator( context, fs_layout = "POSIX", max_open = max_open ),
+        _join_path( root_path, "user", "share", "foo" ),
+        _join_path( root_path, "common", "share", "foo" ),
+    )
+
+
+def test_SEARCH_ORDER( ):
+    """ Are resources found in the user directory first? """
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        locator, user_path, common_path = __make_locator( root_path )
+        __make_file( _join_path( user_path, "tables", "a.bin" ), b"user" )
+        __make_file( _join_path( common_path, "tables", "a.bin" ), b"common" )
+        __make_file( _join_path( common_path, "tables", "b.bin" ), b"common" )
+
+        with locator:
+            assert [ user_path, common_path, ] == locator.directories
+            assert _join_path( user_path, "tables", "a.bin" ) \
+            == locator.find( "tables/a.bin" )
+            assert _join_path( common_path, "tables", "b.bin" ) \
+            == locator.find( "./tables//b.bin" )
+            assert b"user" == locator.open( "tables/a.bin" ).tobytes( )
+            assert b"common" == locator.open( "tables/b.bin" ).tobytes( )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_SHARED_MAPPINGS( ):
+    """ Are mappings shared and replaced, when their files change? """
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        locator, user_path, common_path = __make_locator( root_path )
+        resource_path = _join_path( user_path, "a.bin" )
+        __make_file( resource_path, b"first" )
+
+        with locator:
+            first_view = locator.open( "a.bin" )
+            mapping = locator._mappings[ resource_path ][ 1 ]
+            second_view = locator.open( "a.bin" )
+            assert mapping is locator._mappings[ resource_path ][ 1 ]
+            assert 1 == len( locator._mappings )
+
+            # Note: Replace rather than rewrite the file, as installers do.
+            __make_file( resource_path + ".new", b"second!" )
+            os.rename( resource_path + ".new", resource_path )
+            assert b"second!" == locator.open( "a.bin" ).tobytes( )
+            assert mapping is not locator._mappings[ resource_path ][ 1 ]
+            # Note: Views of the old mapping remain valid.
+            assert b"first" == first_view.tobytes( ) == second_view.tobytes( )
+            first_view.release( )
+            second_view.release( )
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_EVICTION( ):
+    """ Are evicted mappings closed once their views are released? """
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        locator, user_path, common_path = __make_locator(
+            root_path, max_open = 2
+        )
+        resource_paths = [ ]
+        for name in ( "a", "b", "c", ):
+            resource_path = _join_path( user_path, name )
+            __make_file( resource_path, name.encode( "ascii" ) )
+            resource_paths.append( resource_path )
+
+        with locator:
+            view = locator.open( "a" )
+            locator.open( "b" ).release( )
+            locator.open( "c" ).release( )
+            assert resource_paths[ 1 : ] == list( locator._mappings ), \
+            list( locator._mappings )
+            # Note: The evicted mapping is still in use by its view.
+            assert 1 == len( locator._retired )
+            assert b"a" == view.tobytes( )
+
+            view.release( )
+            locator.open( "b" ).release( )
+            assert not locator._retired, locator._retired
+        assert not locator._mappings, locator._mappings
+    finally:
+        shutil.rmtree( root_path )
+
+
+def test_INVALID_RESOURCES( ):
+    """ Are missing resources and invalid names rejected? """
+
+    root_path = tempfile.mkdtemp( )
+    try:
+        locator, user_path, common_path = __make_locator( root_path )
+        __make_file( _join_path( user_path, "empty" ), b"" )
+
+        with locator:
+            assert b"" == locator.open( "empty" ).tobytes( )
+            assert None is locator.find( "missing" )
+            try: locator.open( "missing" )
+            except IOError as exc: assert errno.ENOENT == exc.errno, exc
+            else: assert False, "Expected IOError for a missing resource."
+            for name in (
+                "", "/etc/passwd", "../foo/empty", "a/../../b",
+                "C:/Windows/win.ini", "C:empty", "\\\\server\\share\\empty",
+                "\\empty", "a/b:stream",
+            ):
+                try: locator.find( name )
+                except ValueError: pass
+                else:
+                    assert False, \
+                    "Expected ValueError for {0!r}.".format( name )
+    finally:
+        shutil.rmtree( root_path )
+
+
+###############################################################################
+# vim: set ft=python ts=4 sts=4 sw=4 et tw=79:                                #